@@ -0,0 +1,120 @@
+"""Runs the benchmarks, and reports how their time and memory usage scale.
+
+Usage::
+
+    PYTHONPATH=src python -m benchmarks [--output FILE] [--compare FILE]
+        [--repeat N] [case ...]
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import sys
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Tuple
+
+from benchmarks.cases import CASES
+from benchmarks.runner import Measurement, run_case, scaling_exponent
+
+
+def _load_baseline(path: str) -> Dict[Tuple[str, int], Dict]:
+    with open(path) as file:
+        results = json.load(file)['results']
+    return {(r['case'], r['parameter']): r for r in results}
+
+
+def _format_row(
+        measurement: Measurement,
+        baseline: Optional[Dict[Tuple[str, int], Dict]]
+) -> str:
+    row = (
+        f'{measurement.case:<34}'
+        f'{measurement.parameter_name:>12}={measurement.parameter:<7}'
+        f'{measurement.seconds * 1000:>12.3f} ms'
+        f'{measurement.peak_memory / 1024:>12.1f} KiB'
+    )
+    if baseline is not None:
+        previous = baseline.get((measurement.case, measurement.parameter))
+        if previous is not None:
+            row += (
+                f'{measurement.seconds / previous["seconds"]:>9.2f}x time'
+                f'{measurement.peak_memory / max(previous["peak_memory"], 1):>9.2f}x memory'
+            )
+    return row
+
+
+def main(arguments: List[str]) -> int:
+    parser = argparse.ArgumentParser(prog='python -m benchmarks')
+    parser.add_argument(
+        'cases',
+        nargs='*',
+        help='the names of the benchmarks to run; all of them by default'
+    )
+    parser.add_argument(
+        '--repeat',
+        type=int,
+        default=5,
+        help='the number of timed runs per problem size; the fastest counts'
+    )
+    parser.add_argument(
+        '--output',
+        help='the JSON file to save the results to'
+    )
+    parser.add_argument(
+        '--compare',
+        help='a JSON file saved by an earlier run to compare the results with'
+    )
+    args = parser.parse_args(arguments)
+
+    names = {case.name for case in CASES}
+    unknown = [name for name in args.cases if name not in names]
+    if len(unknown) > 0:
+        parser.error(f'unknown benchmarks: {", ".join(unknown)}')
+
+    baseline = None if args.compare is None else _load_baseline(args.compare)
+    measurements: List[Measurement] = []
+    scaling: Dict[str, Dict[str, float]] = {}
+    for case in CASES:
+        if len(args.cases) > 0 and case.name not in args.cases:
+            continue
+        case_measurements = run_case(case, repeat=args.repeat)
+        for measurement in case_measurements:
+            print(_format_row(measurement, baseline), flush=True)
+        parameters = [m.parameter for m in case_measurements]
+        scaling[case.name] = {
+            'time': scaling_exponent(
+                parameters, [m.seconds for m in case_measurements]
+            ),
+            'peak_memory': scaling_exponent(
+                parameters, [m.peak_memory for m in case_measurements]
+            ),
+        }
+        print(
+            f'{case.name:<34}'
+            f'time ~ {case.parameter_name}^{scaling[case.name]["time"]:.2f}, '
+            f'peak memory ~ '
+            f'{case.parameter_name}^{scaling[case.name]["peak_memory"]:.2f}',
+            flush=True
+        )
+        measurements.extend(case_measurements)
+
+    if args.output is not None:
+        with open(args.output, 'w') as file:
+            json.dump(
+                {
+                    'created_at': datetime.now(timezone.utc).isoformat(),
+                    'python': platform.python_version(),
+                    'platform': platform.platform(),
+                    'repeat': args.repeat,
+                    'results': [m.to_json() for m in measurements],
+                    'scaling': scaling,
+                },
+                file,
+                indent=2
+            )
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
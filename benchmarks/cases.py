@@ -0,0 +1,209 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Callable, Tuple
+
+from neonsign import (
+    Alignment, Color, Column, ColumnSpec, Label, LazyColumn, ProgressGroup,
+    Row, ScrollView, StyledLabel, Table, TextArea, s
+)
+from neonsign.block.block import Block
+from neonsign.block.canvas import Canvas
+from neonsign.core.point import Point
+from neonsign.core.size import Size
+from neonsign.string.styled_string import StyledString
+
+
+@dataclass(frozen=True)
+class Case:
+    """A benchmark measured at a series of increasing problem sizes.
+
+    Attributes:
+        name: The name of the benchmark.
+        parameter_name: What the parameter of the benchmark stands for, for
+            example ``'grid_size'``.
+        parameters: The problem sizes to measure, from small to large.
+        setup: Prepares the inputs for a problem size, and returns the
+            function whose time and memory usage are measured. Only the
+            returned function is measured.
+    """
+    name: str
+    parameter_name: str
+    parameters: Tuple[int, ...]
+    setup: Callable[[int], Callable[[], Any]]
+
+
+def _wide_table(grid_size: int) -> Callable[[], Any]:
+    block = Row(
+        *[
+            Column(
+                *[
+                    Label(f'{x},{y}').padded_horizontally(1)
+                    for y in range(0, grid_size)
+                ]
+            )
+            for x in range(0, grid_size)
+        ]
+    )
+    return lambda: str(block.rendered())
+
+
+def _deep_nesting(depth: int) -> Callable[[], Any]:
+    block: Block = Label('leaf')
+    for i in range(0, depth):
+        if i % 2 == 0:
+            block = Row(Label(f'{i}'), block.padded(1))
+        else:
+            block = Column(Label(f'{i}'), block.framed())
+    return lambda: str(block.rendered())
+
+
+def _large_text_area(num_words: int) -> Callable[[], Any]:
+    block = TextArea(' '.join(['lorem'] * num_words))
+    return lambda: str(block.rendered(width_constraint=80))
+
+
+def _mixed_width_text_area(num_words: int) -> Callable[[], Any]:
+    block = TextArea(' '.join(['lorem', '漢字', 'ｶﾀｶﾅ', 'é'] * (num_words // 4)))
+    return lambda: str(block.rendered(width_constraint=80))
+
+
+def _scroll_view(num_lines: int) -> Callable[[], Any]:
+    view = ScrollView(
+        Column(*[Label(f'line {i}') for i in range(0, num_lines)]),
+        offset_y=num_lines // 2
+    )
+    return lambda: str(view.rendered(width_constraint=80, height_constraint=60))
+
+
+def _lazy_column(num_rows: int) -> Callable[[], Any]:
+    view = ScrollView(
+        LazyColumn(num_rows, lambda i: Label(f'row {i}'), row_height=1),
+        offset_y=num_rows // 2
+    )
+    return lambda: str(view.rendered(width_constraint=80, height_constraint=60))
+
+
+def _table(num_rows: int) -> Callable[[], Any]:
+    table = Table(
+        *[
+            [Label(f'{i}'), Label(f'item {i}'), TextArea(f'{i * 7 % 1000}')]
+            for i in range(0, num_rows)
+        ],
+        columns=[
+            ColumnSpec(alignment=Alignment.END),
+            ColumnSpec(flex=1),
+            ColumnSpec(alignment=Alignment.END)
+        ]
+    )
+    return lambda: str(table.rendered(width_constraint=80))
+
+
+def _progress_group(num_tasks: int) -> Callable[[], Any]:
+    group = ProgressGroup(show_rate=True)
+    tasks = [group.add_task(f'job {i}', total=1000) for i in range(0, num_tasks)]
+    group.rendered(width_constraint=80)
+
+    # Every frame, a hundred tasks report progress.
+    def update_and_render() -> Canvas:
+        for i in range(0, 100):
+            group.advance(tasks[i * 7919 % num_tasks])
+        return group.rendered(width_constraint=80)
+    return update_and_render
+
+
+def _canvas_replace(canvas_size: int) -> Callable[[], Any]:
+    canvas = Canvas.filled(Size(width=canvas_size, height=canvas_size), '.')
+    patch = Canvas.filled(
+        Size(width=canvas_size // 2, height=canvas_size // 2),
+        s('#').bold()
+    )
+    start = Point(x=canvas_size // 4, y=canvas_size // 4)
+    return lambda: canvas.replace(start, patch.size, patch)
+
+
+def _canvas_concatenation(num_canvases: int) -> Callable[[], Any]:
+    canvases = [
+        Canvas.filled(Size(width=8, height=24), str(i % 10))
+        for i in range(0, num_canvases)
+    ]
+    return lambda: Canvas.concatenate_horizontally(*canvases)
+
+
+def _canvas_bytes(canvas_size: int) -> Callable[[], Any]:
+    canvas = StyledLabel(
+        s(
+            *[
+                s(f'{i:>4}').foreground(Color.color8(i % 256))
+                for i in range(0, canvas_size * canvas_size // 4)
+            ]
+        )
+    ).rendered(width_constraint=canvas_size)
+    return lambda: Canvas.from_bytes(canvas.to_bytes())
+
+
+def _heatmap(grid_size: int) -> Callable[[], Any]:
+    # Every run colors every cell anew, as a view updated on every frame does.
+    def build_and_render() -> str:
+        return str(
+            s(
+                *[
+                    s(' ').background(
+                        Color.rgb((x * 8) % 256, (y * 8) % 256, 128)
+                    )
+                    for y in range(0, grid_size)
+                    for x in range(0, grid_size)
+                ]
+            )
+        )
+    return build_and_render
+
+
+def _hsl_array(num_colors: int) -> Callable[[], Any]:
+    hues = [i * 360 / num_colors for i in range(0, num_colors)]
+    saturations = [80] * num_colors
+    lightnesses = [i * 100 / num_colors for i in range(0, num_colors)]
+    return lambda: Color.from_hsl_array(hues, saturations, lightnesses)
+
+
+def _deep_style_stack(depth: int) -> Callable[[], Any]:
+    colors = [Color.RED, Color.GREEN, Color.BLUE, Color.rgb(255, 128, 0)]
+
+    # Styled strings cache their renders, so every run builds a new string.
+    def build_and_render() -> str:
+        string: StyledString = s('text')
+        for i in range(0, depth):
+            string = s('[', string, ']').foreground(colors[i % len(colors)])
+            if i % 3 == 0:
+                string = string.bold()
+        return string.rendered
+    return build_and_render
+
+
+CASES: Tuple[Case, ...] = (
+    Case('wide_table', 'grid_size', (4, 8, 16, 32), _wide_table),
+    Case('deep_nesting', 'depth', (2, 4, 8, 16), _deep_nesting),
+    Case('large_text_area', 'num_words', (1000, 4000, 16000), _large_text_area),
+    Case(
+        'mixed_width_text_area', 'num_words', (1000, 4000, 16000),
+        _mixed_width_text_area
+    ),
+    Case('scroll_view', 'num_lines', (1000, 10000, 100000), _scroll_view),
+    Case('table', 'num_rows', (100, 400, 1600), _table),
+    Case(
+        'lazy_column', 'num_rows', (1000, 100000, 10000000), _lazy_column
+    ),
+    Case('progress_group', 'num_tasks', (500, 2000, 8000), _progress_group),
+    Case('canvas_replace', 'canvas_size', (32, 64, 128, 256), _canvas_replace),
+    Case(
+        'canvas_concatenate_horizontally',
+        'num_canvases',
+        (4, 16, 64, 256),
+        _canvas_concatenation
+    ),
+    Case('canvas_bytes', 'canvas_size', (64, 128, 256), _canvas_bytes),
+    Case('heatmap', 'grid_size', (16, 32, 64), _heatmap),
+    Case('hsl_array', 'num_colors', (1000, 4000, 16000), _hsl_array),
+    Case('styled_string_rendered', 'depth', (16, 64, 256, 1024), _deep_style_stack),
+)
+"""All benchmarks, in the order they are run."""
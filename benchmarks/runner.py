@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+import gc
+import math
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+from typing import Any, Callable, Dict, List, Sequence
+
+from benchmarks.cases import Case
+
+
+@dataclass(frozen=True)
+class Measurement:
+    """The cost of a benchmark at one problem size.
+
+    Attributes:
+        case: The name of the benchmark.
+        parameter_name: What the parameter stands for.
+        parameter: The problem size.
+        seconds: The fastest time taken by one run, in seconds.
+        peak_memory: The peak size of the memory allocated by one run, in
+            bytes.
+    """
+    case: str
+    parameter_name: str
+    parameter: int
+    seconds: float
+    peak_memory: int
+
+    def to_json(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+def scaling_exponent(
+        parameters: Sequence[int],
+        costs: Sequence[float]
+) -> float:
+    """Fits ``cost ~ parameter ** k`` to the measurements of a benchmark, and
+    returns ``k``.
+
+    For example, 1 means that the cost grows linearly with the problem size,
+    and 2 means quadratically. This is the slope of the least squares line
+    through the measurements on a log-log scale.
+    """
+    points = [
+        (math.log(p), math.log(c)) for p, c in zip(parameters, costs) if c > 0
+    ]
+    if len(points) < 2:
+        return float('nan')
+    mean_x = sum(x for x, _ in points) / len(points)
+    mean_y = sum(y for _, y in points) / len(points)
+    variance = sum((x - mean_x) ** 2 for x, _ in points)
+    covariance = sum((x - mean_x) * (y - mean_y) for x, y in points)
+    return covariance / variance
+
+
+def time_of(function: Callable[[], Any], repeat: int) -> float:
+    """Runs a function a number of times, and returns the fastest time."""
+    best = float('inf')
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for _ in range(0, repeat):
+            start = time.perf_counter()
+            function()
+            best = min(best, time.perf_counter() - start)
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+    return best
+
+
+def peak_memory_of(function: Callable[[], Any]) -> int:
+    """Runs a function once, and returns the peak size of the memory it
+    allocated.
+
+    This is measured in a separate run, since tracing allocations slows down
+    the function considerably.
+    """
+    gc.collect()
+    tracemalloc.start()
+    try:
+        function()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak
+
+
+def run_case(case: Case, repeat: int) -> List[Measurement]:
+    """Measures a benchmark at all its problem sizes."""
+    measurements: List[Measurement] = []
+    for parameter in case.parameters:
+        function = case.setup(parameter)
+        # Warm up, so that one-off costs such as imports are not measured.
+        function()
+        measurements.append(
+            Measurement(
+                case=case.name,
+                parameter_name=case.parameter_name,
+                parameter=parameter,
+                seconds=time_of(function, repeat=repeat),
+                peak_memory=peak_memory_of(function),
+            )
+        )
+    return measurements
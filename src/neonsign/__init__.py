@@ -3,12 +3,14 @@ from pkgutil import extend_path
 __path__ = extend_path(__path__, __name__)
 
 from neonsign.block.alignment import Alignment
+from neonsign.block.axis import Axis
 from neonsign.block.frame_styles import FrameStyle, FrameStyle
 from neonsign.block.impl.column import Column
 from neonsign.block.impl.fixed import (
     FixedHeightBlock, FixedSizeBlock, FixedWidthBlock
 )
 from neonsign.block.impl.label import Label
+from neonsign.block.impl.lazy_column import LazyColumn
 from neonsign.block.impl.padded import PaddedBlock
 from neonsign.block.impl.rectangle import Rectangle
 from neonsign.block.impl.row import Row
@@ -17,13 +19,28 @@ from neonsign.block.impl.separators import (
 )
 from neonsign.block.impl.flexible_space import FlexibleSpace
 from neonsign.block.impl.progress_bar import ProgressBar
+from neonsign.block.impl.progress_group import ProgressGroup
 from neonsign.block.impl.text_effects import (
     BackgroundColoredBlock,
     BlinkingBlock, BoldBlock, ForegroundColoredBlock, ItalicBlock,
     UnderlinedBlock
 )
+from neonsign.block.impl.scroll_view import ScrollView
+from neonsign.block.impl.styled_label import StyledLabel
+from neonsign.block.impl.table import ColumnSpec, Table
 from neonsign.block.impl.text_area import TextArea
 from neonsign.block.block import Block
 from neonsign.core.colors import Color
+from neonsign.string.color_profile import ColorProfile
+from neonsign.string.line_breaking import WrapMode
 from neonsign.string.styled_string import StyledString
 from neonsign.string.syntax import s
+
+
+def __getattr__(name: str):
+    # The live display is imported when first used, so that importing
+    # neonsign does not import asyncio.
+    if name in ('LiveDisplay', 'Observable'):
+        from neonsign import live
+        return getattr(live, name)
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
@@ -0,0 +1,19 @@
+from enum import Enum
+
+
+class Axis(Enum):
+    """An axis of a text block.
+
+    - The x-axis goes from left to right horizontally, and
+    - the y-axis goes from top to bottom vertically.
+
+    The other axis of either one is its cross axis.
+    """
+
+    X = 'x'
+    Y = 'y'
+
+    @property
+    def cross(self) -> 'Axis':
+        """The other axis."""
+        return Axis.Y if self is Axis.X else Axis.X
@@ -1,15 +1,25 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import Optional, Tuple
+from concurrent.futures import Executor, Future
+from typing import (
+    Dict, Hashable, Iterator, Optional, Sequence, TYPE_CHECKING, Tuple
+)
 
+from neonsign.block.axis import Axis
 from neonsign.block.canvas import Canvas
 from neonsign.block.frame_styles import FrameStyle
+from neonsign.block import measurable
 from neonsign.block.measurable import Measurable
 from neonsign.block.renderable import Renderable
 from neonsign.core.colors import Color
 from neonsign.core.rect import Rect
 from neonsign.core.size import Size
+from neonsign.string.color_profile import ColorProfile
+
+if TYPE_CHECKING:
+    from neonsign.block.cache import LayoutCache
+    from neonsign.block.canvas_builder import RenderTarget
 
 
 class Block(Measurable, Renderable, ABC):
@@ -17,10 +27,40 @@ class Block(Measurable, Renderable, ABC):
     def rendered(
             self,
             width_constraint: Optional[int] = None,
-            height_constraint: Optional[int] = None
+            height_constraint: Optional[int] = None,
+            layout_cache: Optional[LayoutCache] = None,
+            executor: Optional[Executor] = None,
+            min_parallel_area: Optional[int] = None,
     ) -> Canvas:
-        from neonsign.block.cache import LayoutContainer
-        with LayoutContainer(self):
+        """Measures and renders this block.
+
+        Args:
+            width_constraint: The maximum width of the render.
+            height_constraint: The maximum height of the render.
+            layout_cache: A cache of measurements to reuse across renders. When
+                this is None, measurements are cached during this render only.
+            executor: An executor to render large blocks in, in parallel with
+                their siblings. When this is None, everything is rendered on
+                the current thread. A process pool renders in parallel on
+                several cores, but requires the blocks to be picklable; a
+                thread pool shares measurements between its threads, but only
+                helps with blocks that release the GIL while rendering.
+            min_parallel_area: The smallest area, in cells, of a block rendered
+                in the executor. When this is None,
+                :data:`~neonsign.block.cache.DEFAULT_MIN_PARALLEL_AREA` is used.
+        """
+        from neonsign.block.cache import (
+            DEFAULT_MIN_PARALLEL_AREA, LayoutContainer
+        )
+        with LayoutContainer(
+                self,
+                cache=layout_cache,
+                executor=executor,
+                min_parallel_area=(
+                    DEFAULT_MIN_PARALLEL_AREA if min_parallel_area is None
+                    else min_parallel_area
+                )
+        ):
             granted_size = self.measure(
                 width_constraint=width_constraint,
                 height_constraint=height_constraint,
@@ -28,6 +68,51 @@ class Block(Measurable, Renderable, ABC):
             canvas = self.render(granted_size=granted_size)
             return canvas
 
+    def iter_lines(
+            self,
+            width_constraint: Optional[int] = None,
+            height_constraint: Optional[int] = None,
+            layout_cache: Optional[LayoutCache] = None,
+            profile: ColorProfile = ColorProfile.TRUECOLOR,
+    ) -> Iterator[str]:
+        """Measures and renders this block, yielding the lines of the render
+        one at a time.
+
+        The lines are the same as those of ``str(block.rendered())``, but
+        the render is produced in bands (see
+        :func:`~neonsign.block.renderable.Renderable.render_in_bands`). For a
+        :class:`~neonsign.Column`, only the render of one child is in memory
+        at a time, which suits printing very tall blocks::
+
+            for line in report.iter_lines(width_constraint=120):
+                print(line, file=file)
+
+        Args:
+            width_constraint: The maximum width of the render.
+            height_constraint: The maximum height of the render.
+            layout_cache: A cache of measurements to reuse across renders. When
+                this is None, measurements are cached during this render only.
+            profile: The colors the terminal supports. Colors the terminal
+                does not support are replaced by the closest ones it does.
+        """
+        from neonsign.block.cache import LayoutContainer
+        # Every step runs in a layout container of its own, so that the
+        # measurements cached by earlier steps can be freed, and so that the
+        # caller can render other blocks between lines.
+        with LayoutContainer(self, cache=layout_cache):
+            granted_size = self.measure(
+                width_constraint=width_constraint,
+                height_constraint=height_constraint,
+            )
+            bands = self.render_in_bands(granted_size=granted_size)
+        while True:
+            with LayoutContainer(self, cache=layout_cache):
+                band = next(bands, None)
+            if band is None:
+                return
+            for y in range(0, band.height):
+                yield band.serialized_row(y, profile=profile)
+
     def __str__(self) -> str:
         return str(self.rendered())
 
@@ -150,6 +235,8 @@ class LeafBlock(Block, ABC):
 
 class LayoutBlock(Block, ABC):
 
+    _cached_layout_stamp: Optional[Tuple[int, int]] = None
+
     @property
     @abstractmethod
     def subblocks(self) -> Tuple[Block, ...]:
@@ -162,16 +249,79 @@ class LayoutBlock(Block, ABC):
     def get_rects(self, granted_size: Size) -> Tuple[Rect, ...]:
         return self._get_rects(granted_size=granted_size)
 
-    def _render(self, granted_size: Size) -> Canvas:
-        rects: Tuple[Rect, ...] = self.get_rects(granted_size=granted_size)
-        renders: Tuple[Canvas, ...] = tuple(
-            block.render(granted_size=rect.size)
-            for block, rect in zip(self.subblocks, rects)
+    @property
+    def layout_stamp(self) -> int:
+        # The stamp is kept until the stamp of any object changes, so that a
+        # tree is only walked once after every change.
+        cached = self._cached_layout_stamp
+        if cached is not None and cached[0] == measurable._latest_layout_stamp:
+            return cached[1]
+        stamp = max(
+            self._layout_stamp,
+            max((block.layout_stamp for block in self.subblocks), default=0)
         )
-        canvas: Canvas = Canvas.of(size=granted_size, pixel_factory=lambda x, y: ' ')
-        for rect, render in zip(rects, renders):
-            canvas = canvas.replace(rect.top_left, rect.size, render)
-        return canvas
+        self._cached_layout_stamp = (measurable._latest_layout_stamp, stamp)
+        return stamp
+
+    def _render(self, granted_size: Size) -> Canvas:
+        from neonsign.block.canvas_builder import CanvasBuilder
+        builder = CanvasBuilder(size=granted_size, pixel=' ')
+        self._render_subblocks_into(builder.target)
+        return builder.build()
+
+    def render_into(self, target: RenderTarget) -> None:
+        target.fill(' ')
+        self._render_subblocks_into(target)
+
+    def _render_subblocks_into(self, target: RenderTarget) -> None:
+        rects: Tuple[Rect, ...] = self.get_rects(granted_size=target.size)
+        subblocks = self.subblocks
+        renders = _start_parallel_renders(subblocks, rects, target)
+        for i, (block, rect) in enumerate(zip(subblocks, rects)):
+            region = target.region(rect)
+            # Blocks that are clipped away entirely are not rendered at all.
+            if region.clip is None:
+                continue
+            future = renders.get(i) if renders else None
+            if future is None:
+                block.render_into(region)
+            else:
+                region.draw(future.result())
+
+
+def _start_parallel_renders(
+        blocks: Sequence[Block],
+        rects: Sequence[Rect],
+        target: RenderTarget
+) -> Dict[int, Future]:
+    """Starts rendering the blocks worth rendering in the executor of the
+    current render, if it has one, and returns their futures by index.
+
+    A block is worth it when it is fully visible, since it is rendered
+    without clipping, and when its area is at least the minimum area. Blocks
+    are only sent to the executor when at least two siblings are, so that a
+    block with a single large child parallelizes further down instead.
+    """
+    from neonsign.block.cache import current_layout_container
+    container = current_layout_container()
+    if container is None or container.executor is None:
+        return {}
+    min_area = container.min_parallel_area
+    indices = [
+        i for i, rect in enumerate(rects)
+        if rect.size.area >= min_area and _is_fully_visible(target, rect)
+    ]
+    if len(indices) < 2:
+        return {}
+    return {
+        i: container.submit_render(blocks[i], rects[i].size)
+        for i in indices
+    }
+
+
+def _is_fully_visible(target: RenderTarget, rect: Rect) -> bool:
+    clip = target.region(rect).clip
+    return clip is not None and clip.size == rect.size
 
 
 class WrapperBlock(LayoutBlock):
@@ -183,6 +333,16 @@ class WrapperBlock(LayoutBlock):
     def subblocks(self) -> Tuple[Block, ...]:
         return (self.original,)
 
+    def _layout_key_parts(self) -> Optional[Tuple[Hashable, ...]]:
+        return type(self), self.original.layout_key
+
+    def flexibility(
+            self,
+            axis: Axis,
+            cross_constraint: Optional[int] = None
+    ) -> bool:
+        return self.original.flexibility(axis, cross_constraint)
+
     def _measure(
             self,
             width_constraint: Optional[int] = None,
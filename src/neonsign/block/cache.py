@@ -1,10 +1,22 @@
 from __future__ import annotations
 
 import threading
-from typing import Any, Callable, Dict, Hashable, Optional, TYPE_CHECKING
+import weakref
+from collections import OrderedDict
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from typing import (
+    Any, Callable, Dict, Hashable, Optional, TYPE_CHECKING, Tuple, Union
+)
 
 if TYPE_CHECKING:
+    from neonsign.block.block import Block
+    from neonsign.block.canvas import Canvas
     from neonsign.block.measurable import Measurable
+    from neonsign.core.size import Size
+
+DEFAULT_MIN_PARALLEL_AREA: int = 2048
+"""The smallest area, in cells, of a block worth rendering in an executor by
+default."""
 
 
 class RenderCache:
@@ -20,36 +32,313 @@ class RenderCache:
         return value
 
 
+class LayoutKey:
+    """A value that identifies how a block measures.
+
+    Blocks with equal layout keys always measure to the same sizes under the
+    same constraints, so they can share cached measurements. Layout keys are
+    interned: equal keys are the same object, and their hashes are computed
+    once.
+    """
+
+    __slots__ = ('parts', '_hash', '__weakref__')
+
+    _interned: weakref.WeakValueDictionary = weakref.WeakValueDictionary()
+
+    def __init__(self, parts: Tuple[Hashable, ...]):
+        self.parts: Tuple[Hashable, ...] = parts
+        self._hash: int = hash(parts)
+
+    @classmethod
+    def of(cls, parts: Tuple[Hashable, ...]) -> LayoutKey:
+        """Obtains the interned layout key consisting of the parts."""
+        key = cls._interned.get(parts)
+        if key is None:
+            key = cls._interned.setdefault(parts, LayoutKey(parts))
+        return key
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __eq__(self, other: Any) -> bool:
+        return self is other or (
+            isinstance(other, LayoutKey) and
+            self._hash == other._hash and
+            self.parts == other.parts
+        )
+
+    def __repr__(self) -> str:
+        return f'LayoutKey{self.parts}'
+
+
+class LayoutCache:
+    """A cache of measurements that outlives a single render.
+
+    Pass the same ``LayoutCache`` to every call of :func:`Block.rendered` to
+    reuse the measurements of blocks that did not change since the previous
+    render. The cache holds at most ``max_size`` entries, evicting the least
+    recently used one when it is full.
+
+    Entries are keyed by the layout key of the block, or by the identity of the
+    block and its layout stamp if it has no layout key. Assigning a public
+    field of a block invalidates its layout. A block that is mutated in any
+    other way after being rendered must call
+    :func:`Measurable.invalidate_layout`, which also invalidates the entries of
+    all blocks containing it.
+    """
+
+    def __init__(self, max_size: int = 65536):
+        if max_size <= 0:
+            raise ValueError(
+                f'max_size must be a positive integer and not {max_size}!'
+            )
+        self.max_size: int = max_size
+        self.hits: int = 0
+        self.misses: int = 0
+        self._cache: OrderedDict[Hashable, Any] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+    def get(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        if key in self._cache:
+            self.hits += 1
+            self._cache.move_to_end(key)
+            return self._cache[key]
+        self.misses += 1
+        value = compute()
+        self._cache[key] = value
+        if len(self._cache) > self.max_size:
+            self._cache.popitem(last=False)
+        return value
+
+    def clear(self) -> None:
+        self._cache.clear()
+
+
+class _InFlight:
+    """A measurement being computed by one thread, which other threads
+    needing the same entry wait for."""
+
+    __slots__ = ('done', 'value', 'error')
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.value: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class ConcurrentLayoutCache(LayoutCache):
+    """A :class:`LayoutCache` that can be shared by threads rendering at the
+    same time, for example by the workers of a
+    :class:`~concurrent.futures.ThreadPoolExecutor` rendering the sections of
+    a report::
+
+        cache = ConcurrentLayoutCache()
+        with ThreadPoolExecutor() as executor:
+            canvases = list(executor.map(
+                lambda block: block.rendered(80, layout_cache=cache),
+                sections
+            ))
+
+    Every entry is computed once: when several threads need an entry that is
+    not cached yet, the first one computes it while the others wait for its
+    result, and ``waits`` counts how often that happened. If the computation
+    raises an exception, the waiting threads raise it too, and the entry is
+    left uncached.
+
+    The same :class:`LayoutContainer` may also be entered by several threads
+    at once, so that worker threads measure into the container of the render
+    they take part in.
+    """
+
+    def __init__(self, max_size: int = 65536):
+        super().__init__(max_size=max_size)
+        self.waits: int = 0
+        self._lock = threading.Lock()
+        self._in_flight: Dict[Hashable, _InFlight] = {}
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._cache)
+
+    def get(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        with self._lock:
+            if key in self._cache:
+                self.hits += 1
+                self._cache.move_to_end(key)
+                return self._cache[key]
+            in_flight = self._in_flight.get(key)
+            if in_flight is None:
+                self.misses += 1
+                in_flight = self._in_flight[key] = _InFlight()
+                is_computing = True
+            else:
+                self.waits += 1
+                is_computing = False
+
+        if not is_computing:
+            in_flight.done.wait()
+            if in_flight.error is not None:
+                raise in_flight.error
+            return in_flight.value
+
+        # Measurements only depend on those of the parts of a block, never on
+        # the block itself, so waiting threads cannot wait for each other.
+        try:
+            value = compute()
+        except BaseException as error:
+            in_flight.error = error
+            with self._lock:
+                del self._in_flight[key]
+            in_flight.done.set()
+            raise
+        with self._lock:
+            self._cache[key] = value
+            if len(self._cache) > self.max_size:
+                self._cache.popitem(last=False)
+            del self._in_flight[key]
+        in_flight.value = value
+        in_flight.done.set()
+        return value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._cache.clear()
+
+
+class _Pinned:
+    """A cache key component that compares by identity and holds a strong
+    reference to the object, so that its id cannot be reused by another object
+    while the key is alive."""
+
+    __slots__ = ('obj',)
+
+    def __init__(self, obj: Any):
+        self.obj = obj
+
+    def __hash__(self) -> int:
+        return id(self.obj)
+
+    def __eq__(self, other: Any) -> bool:
+        return isinstance(other, _Pinned) and other.obj is self.obj
+
+
 _LAYOUT_CONTAINER = threading.local()
 
 
 class LayoutContainer:
 
-    def __init__(self, root: Measurable):
-        self._cache = RenderCache()
+    def __init__(
+            self,
+            root: Measurable,
+            cache: Optional[LayoutCache] = None,
+            executor: Optional[Executor] = None,
+            min_parallel_area: int = DEFAULT_MIN_PARALLEL_AREA
+    ):
+        """
+        Args:
+            root: The object measured and rendered in this container.
+            cache: The cache to keep measurements in. When this is None,
+                measurements are cached in this container only.
+            executor: The executor to render large sibling blocks in, or None
+                to render every block on the current thread. Worker threads
+                share the measurements of this container, which requires a
+                :class:`ConcurrentLayoutCache`; one is created if ``cache`` is
+                None.
+            min_parallel_area: The smallest area, in cells, of a block
+                rendered in the executor.
+        """
+        if min_parallel_area <= 0:
+            raise ValueError(
+                f'min_parallel_area must be a positive integer and not '
+                f'{min_parallel_area}!'
+            )
+        if executor is not None and not isinstance(
+                executor, ProcessPoolExecutor
+        ):
+            if cache is None:
+                cache = ConcurrentLayoutCache()
+            elif not isinstance(cache, ConcurrentLayoutCache):
+                raise ValueError(
+                    'The layout cache shared with worker threads must be a '
+                    'ConcurrentLayoutCache!'
+                )
+        self._cache: Union[RenderCache, LayoutCache] = (
+            RenderCache() if cache is None else cache
+        )
+        self._is_persistent: bool = cache is not None
         self._root = root
+        self.executor: Optional[Executor] = executor
+        self.min_parallel_area: int = min_parallel_area
 
     def __enter__(self) -> LayoutContainer:
-        self._previous = getattr(_LAYOUT_CONTAINER, 'instance', None)
+        # The containers entered before are kept per thread, so that a
+        # container shared by several threads can be entered by all of them.
+        previous = getattr(_LAYOUT_CONTAINER, 'previous', None)
+        if previous is None:
+            previous = _LAYOUT_CONTAINER.previous = []
+        previous.append(getattr(_LAYOUT_CONTAINER, 'instance', None))
         _LAYOUT_CONTAINER.instance = self
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
-        _LAYOUT_CONTAINER.instance = self._previous
+        _LAYOUT_CONTAINER.instance = _LAYOUT_CONTAINER.previous.pop()
         return False
 
     @property
-    def cache(self) -> RenderCache:
+    def cache(self) -> Union[RenderCache, LayoutCache]:
         return self._cache
 
+    @property
+    def is_persistent(self) -> bool:
+        """Whether measurements are cached in a :class:`LayoutCache` that
+        outlives this container."""
+        return self._is_persistent
+
     def get_cache_key(
         self,
         block: Measurable,
         width_constraint: Optional[int],
         height_constraint: Optional[int]
     ) -> Hashable:
+        layout_key = block.layout_key
+        if layout_key is not None:
+            return layout_key, width_constraint, height_constraint
+        if self._is_persistent:
+            return (
+                _Pinned(block),
+                block.layout_stamp,
+                width_constraint,
+                height_constraint
+            )
         return id(block), width_constraint, height_constraint
 
+    def submit_render(self, block: Block, granted_size: Size) -> Future:
+        """Renders a block in the executor of this container.
+
+        A worker thread measures into the cache of this container, while a
+        worker process measures anew, since it only has a copy of the block.
+        Either way, the block renders its own subblocks on the worker.
+
+        Returns:
+            The future of the canvas rendered.
+        """
+        if isinstance(self.executor, ProcessPoolExecutor):
+            return self.executor.submit(_render_detached, block, granted_size)
+        return self.executor.submit(
+            _render_detached, block, granted_size, self._cache
+        )
+
+
+def _render_detached(
+        block: Block,
+        granted_size: Size,
+        cache: Optional[LayoutCache] = None
+) -> Canvas:
+    with LayoutContainer(block, cache=cache):
+        return block.render(granted_size=granted_size)
+
 
 def current_layout_container() -> Optional[LayoutContainer]:
     return getattr(_LAYOUT_CONTAINER, 'instance', None)
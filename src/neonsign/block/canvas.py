@@ -1,14 +1,25 @@
 from __future__ import annotations
 
+import unicodedata
 from abc import ABC, abstractmethod
+from array import array
 from dataclasses import dataclass
 from enum import Enum
-from functools import reduce
-from typing import Any, Callable, List, Tuple, Union, final
+from typing import (
+    Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple, Union,
+    final
+)
 
 from neonsign.core.point import Point
 from neonsign.core.rect import Rect
 from neonsign.core.size import Size
+from neonsign.string.color_profile import ColorProfile, style_id_for_profile
+from neonsign.string.display_width import char_widths, code_point_width
+from neonsign.string.line_breaking import (
+    WrapMode, break_lines, spans_of_lines
+)
+from neonsign.string.sgr import style_transition
+from neonsign.string.style_table import PLAIN_STYLE_ID
 from neonsign.string.styled_string import StyledString
 from neonsign.string.syntax import s
 
@@ -87,44 +98,96 @@ class TransparentPixel(Pixel):
         return hash(' ')
 
 
+TRANSPARENT_STYLE_ID: int = -1
+"""The style ID marking a cell that is occupied by a transparent pixel."""
+
+WIDE_CHARACTER_CONTINUATION: int = 0
+"""The code point of a cell covered by the right half of the wide character
+in the cell to its left. Such a cell has the style of the wide character, and
+is not printed on its own."""
+
+_SPACE: int = ord(' ')
+_ELLIPSIS: int = ord('…')
+_FIRST_WIDE_CODE_POINT: int = 0x1100
+
+
+def encode_pixel(obj: PixelSource) -> Tuple[int, int]:
+    """Converts a pixel source to the code point and the style ID that
+    represent it in a canvas."""
+    if isinstance(obj, str) and len(obj) == 1:
+        return ord(obj), PLAIN_STYLE_ID
+    pixel = px(obj)
+    if isinstance(pixel, TransparentPixel):
+        return _SPACE, TRANSPARENT_STYLE_ID
+    elif isinstance(pixel, StyledStringPixel):
+        ((char, style_id),) = pixel.styled_string._iter_content()
+        return ord(char), style_id
+    else:
+        raise TypeError(f'Pixel type {type(pixel)} is not supported!')
+
+
+def decode_pixel(code_point: int, style_id: int) -> Pixel:
+    """Converts a code point and a style ID stored in a canvas back to a
+    pixel."""
+    if style_id == TRANSPARENT_STYLE_ID:
+        return TransparentPixel()
+    return StyledStringPixel(
+        StyledString.from_spans(((chr(code_point), style_id),))
+    )
+
+
 @final
 @dataclass(frozen=True)
 class Canvas:
-    pixels: Tuple[Tuple[Pixel, ...], ...]
+    """A two-dimensional grid of pixels.
+
+    Instead of holding one :class:`Pixel` object per cell, a canvas keeps the
+    characters of all cells in a flat array of code points, and their styles
+    in a parallel array of style IDs interned in the
+    :data:`~neonsign.string.style_table.STYLE_TABLE`. Both arrays are laid out
+    row by row. Pixel objects are only created on demand, for example by
+    :func:`at`.
+
+    Do not mutate the arrays of a canvas. Use the methods of this class, which
+    all return new canvases.
+    """
+
+    width: int
+    height: int
+    chars: array
+    """The code points of the characters of all cells, row by row."""
+
+    styles: array
+    """The style IDs of all cells, row by row. A transparent cell has the style
+    ID :data:`TRANSPARENT_STYLE_ID`."""
 
     @property
     def size(self) -> Size:
-        if len(self.pixels) == 0:
-            return Size(width=0, height=0)
-        else:
-            return Size(width=len(self.pixels[0]), height=len(self.pixels))
+        return Size(width=self.width, height=self.height)
+
+    @property
+    def pixels(self) -> Tuple[Tuple[Pixel, ...], ...]:
+        return tuple(
+            tuple(self.at(x=x, y=y) for x in range(0, self.width))
+            for y in range(0, self.height)
+        )
 
     def at(self, x: int, y: int) -> Pixel:
-        return self.pixels[y][x]
+        if not (0 <= x < self.width and 0 <= y < self.height):
+            raise IndexError(f'({x}, {y}) is outside of the canvas!')
+        i = x + y * self.width
+        return decode_pixel(self.chars[i], self.styles[i])
 
     def map(self, f: Callable[[Pixel], PixelSource]) -> Canvas:
-        return Canvas(
-            pixels=tuple(
-                tuple(
-                    px(f(pixel))
-                    for pixel in row
-                )
-                for row in self.pixels
-            )
-        )
+        return self.map_with_index(lambda x, y, pixel: f(pixel))
 
     def map_with_index(
             self,
             f: Callable[[int, int, Pixel], PixelSource]
     ) -> Canvas:
-        return Canvas(
-            pixels=tuple(
-                tuple(
-                    px(f(x, y, self.at(x=x, y=y)))
-                    for x in range(0, self.size.width)
-                )
-                for y in range(0, self.size.height)
-            )
+        return Canvas.of(
+            size=self.size,
+            pixel_factory=lambda x, y: f(x, y, self.at(x=x, y=y))
         )
 
     def crop_or_pad_to(
@@ -156,50 +219,96 @@ class Canvas:
             CanvasAnchor.BOTTOM_RIGHT: lambda: Point(x=x_right(), y=y_bottom())
         }[anchor]()
 
-        def pixel_factory(x: int, y: int) -> Pixel:
-            if (
-                content_top_left_in_new_canvas.x <= x <
-                    content_top_left_in_new_canvas.x + self.size.width and
-                content_top_left_in_new_canvas.y <= y <
-                    content_top_left_in_new_canvas.y + self.size.height
-            ):
-                return self.at(
-                    x=x - content_top_left_in_new_canvas.x,
-                    y=y - content_top_left_in_new_canvas.y
-                )
-            else:
-                return px(filler())
-        return Canvas.of(new_size, pixel_factory)
+        return self._moved(
+            new_size=new_size,
+            content_top_left=content_top_left_in_new_canvas,
+            filler=filler
+        )
 
     def crop_or_pad_to_rect(
             self,
             rect: Rect,
             filler: Callable[[], PixelSource] = lambda: TransparentPixel()
     ) -> Canvas:
-        def pixel_factory(x: int, y: int) -> Pixel:
-            if (
-                    0 <= x + rect.top_left.x < self.size.width and
-                    0 <= y + rect.top_left.y < self.size.height
-            ):
-                return self.at(x=x + rect.top_left.x, y=y + rect.top_left.y)
-            else:
-                return px(filler())
-        return Canvas.of(rect.size, pixel_factory)
+        return self._moved(
+            new_size=rect.size,
+            content_top_left=Point(x=-rect.top_left.x, y=-rect.top_left.y),
+            filler=filler
+        )
+
+    def _moved(
+            self,
+            new_size: Size,
+            content_top_left: Point,
+            filler: Callable[[], PixelSource]
+    ) -> Canvas:
+        """Creates a canvas of the new size, with the contents of this canvas
+        placed at the specified position, and the remaining cells filled by
+        the filler."""
+        code_point, style_id = encode_pixel(filler())
+        area = new_size.area
+        chars = array('I', [code_point]) * area
+        styles = array('i', [style_id]) * area
+
+        x_start = max(0, content_top_left.x)
+        x_end = min(new_size.width, content_top_left.x + self.width)
+        y_start = max(0, content_top_left.y)
+        y_end = min(new_size.height, content_top_left.y + self.height)
+        if x_start < x_end:
+            for y in range(y_start, y_end):
+                target = y * new_size.width
+                source = (
+                    (y - content_top_left.y) * self.width - content_top_left.x
+                )
+                chars[target + x_start:target + x_end] = (
+                    self.chars[source + x_start:source + x_end]
+                )
+                styles[target + x_start:target + x_end] = (
+                    self.styles[source + x_start:source + x_end]
+                )
+        return Canvas(
+            width=new_size.width,
+            height=new_size.height,
+            chars=chars,
+            styles=styles
+        )
 
     def replace(self, start: Point, size: Size, new_canvas: Canvas) -> Canvas:
-        def pixel_factory(x: int, y: int) -> Pixel:
-            if (
-                start.x <= x < min(self.size.width, start.x + size.width) and
-                start.y <= y < min(self.size.height, start.y + size.height)
-            ):
-                new_pixel = new_canvas.at(x=x - start.x, y=y - start.y)
-                if isinstance(new_pixel, TransparentPixel):
-                    return self.at(x=x, y=y)
-                else:
-                    return new_pixel
-            else:
-                return self.at(x=x, y=y)
-        return Canvas.of(self.size, pixel_factory)
+        chars = array('I', self.chars)
+        styles = array('i', self.styles)
+
+        x_start = max(0, start.x)
+        x_end = min(
+            self.width,
+            start.x + min(size.width, new_canvas.width)
+        )
+        y_start = max(0, start.y)
+        y_end = min(
+            self.height,
+            start.y + min(size.height, new_canvas.height)
+        )
+        if x_start < x_end:
+            for y in range(y_start, y_end):
+                target = y * self.width
+                source = (y - start.y) * new_canvas.width - start.x
+                new_styles = new_canvas.styles[source + x_start:source + x_end]
+                if TRANSPARENT_STYLE_ID not in new_styles:
+                    chars[target + x_start:target + x_end] = (
+                        new_canvas.chars[source + x_start:source + x_end]
+                    )
+                    styles[target + x_start:target + x_end] = new_styles
+                    continue
+                for x in range(x_start, x_end):
+                    style_id = new_canvas.styles[source + x]
+                    if style_id != TRANSPARENT_STYLE_ID:
+                        chars[target + x] = new_canvas.chars[source + x]
+                        styles[target + x] = style_id
+        return Canvas(
+            width=self.width,
+            height=self.height,
+            chars=chars,
+            styles=styles
+        )
 
     @classmethod
     def concatenate_horizontally(cls, *canvases: Canvas) -> Canvas:
@@ -210,13 +319,20 @@ class Canvas:
                 f'The canvases being concatenated horizontally do not have the '
                 f'same height!'
             )
-        height = canvases[0].size.height
-        pixels = [[] for _ in range(0, height)]
-        for canvas in canvases:
-            for y in range(0, height):
-                for x in range(0, canvas.size.width):
-                    pixels[y].append(canvas.at(x=x, y=y))
-        return Canvas.from_pixels(pixels)
+        height = canvases[0].height
+        chars = array('I')
+        styles = array('i')
+        for y in range(0, height):
+            for canvas in canvases:
+                start = y * canvas.width
+                chars.extend(canvas.chars[start:start + canvas.width])
+                styles.extend(canvas.styles[start:start + canvas.width])
+        return Canvas(
+            width=sum(_.width for _ in canvases),
+            height=height,
+            chars=chars,
+            styles=styles
+        )
 
     @classmethod
     def concatenate_vertically(cls, *canvases: Canvas) -> Canvas:
@@ -227,43 +343,364 @@ class Canvas:
                 f'The canvases being concatenated vertically do not have the '
                 f'same width!'
             )
+        chars = array('I')
+        styles = array('i')
+        for canvas in canvases:
+            chars.extend(canvas.chars)
+            styles.extend(canvas.styles)
         return Canvas(
-            pixels=reduce(
-                lambda x, y: x + y,
-                [_.pixels for _ in canvases],
-                ()
-            )
+            width=canvases[0].width,
+            height=sum(_.height for _ in canvases),
+            chars=chars,
+            styles=styles
         )
 
     def __str__(self) -> str:
+        return self.serialized()
+
+    def __reduce__(self):
+        # Style IDs are only meaningful in the process that interned them, so
+        # canvases are pickled in the binary format, which stores styles as
+        # their commands.
+        return Canvas.from_bytes, (self.to_bytes(),)
+
+    def to_bytes(self, encoding: str = 'utf-32') -> bytes:
+        """Converts this canvas to a compact binary format, described in
+        :mod:`neonsign.block.canvas_format`, which can be loaded by
+        :func:`from_bytes` in any process.
+
+        Args:
+            encoding: The encoding of the characters, either ``'utf-32'``,
+                which is fastest to load, or ``'utf-8'``, which is smallest
+                for ASCII text.
+        """
+        from neonsign.block.canvas_format import canvas_to_bytes
+        return canvas_to_bytes(self, encoding)
+
+    def serialized(
+            self,
+            per_cell: bool = False,
+            profile: ColorProfile = ColorProfile.TRUECOLOR
+    ) -> str:
+        """Converts this canvas to a string containing the terminal commands
+        that style its pixels, with one line per row.
+
+        Args:
+            per_cell: Whether to style every pixel on its own, as earlier
+                versions did. By default, adjacent pixels with the same style
+                share one styled span, and only the changes of style between
+                spans are emitted.
+            profile: The colors the terminal supports. Colors the terminal
+                does not support are replaced by the closest ones it does.
+        """
+        if per_cell:
+            return self._serialized_per_cell(profile)
         return '\n'.join(
-            ''.join(
-                pixel.rendered if pixel is not None else ' '
-                for pixel in row
-            )
-            for row in self.pixels
+            self.serialized_row(y, profile=profile)
+            for y in range(0, self.height)
         )
 
+    def serialized_row(
+            self,
+            y: int,
+            x_start: int = 0,
+            x_end: Optional[int] = None,
+            profile: ColorProfile = ColorProfile.TRUECOLOR
+    ) -> str:
+        """Converts one row of this canvas to a string, merging adjacent pixels
+        with the same style into one styled span.
+
+        Args:
+            y: The index of the row.
+            x_start: The index of the first column to include.
+            x_end: The index after the last column to include. When this is
+                None, the row is included up to its end.
+            profile: The colors the terminal supports. Colors the terminal
+                does not support are replaced by the closest ones it does.
+        """
+        if x_end is None:
+            x_end = self.width
+        width = x_end - x_start
+        start = y * self.width + x_start
+        row = self.chars[start:start + width]
+        text: Sequence[str]
+        if width > 0 and (
+            max(row) >= _FIRST_WIDE_CODE_POINT or
+            WIDE_CHARACTER_CONTINUATION in row
+        ):
+            text = _cells_of_row(row)
+        else:
+            text = ''.join(map(chr, row))
+        if profile is ColorProfile.NONE:
+            return ''.join(text)
+        styles = self.styles[start:start + width]
+        if styles.count(PLAIN_STYLE_ID) == width:
+            return ''.join(text)
+        adapts_styles = profile is not ColorProfile.TRUECOLOR
+
+        pieces: List[str] = []
+        active_style_id = PLAIN_STYLE_ID
+        run_start = 0
+        for x in range(0, width + 1):
+            if x < width:
+                style_id = styles[x]
+                if style_id == TRANSPARENT_STYLE_ID:
+                    style_id = PLAIN_STYLE_ID
+                if x == 0:
+                    run_style_id = style_id
+                if style_id == run_style_id:
+                    continue
+            if adapts_styles:
+                run_style_id = style_id_for_profile(run_style_id, profile)
+            pieces.append(style_transition(active_style_id, run_style_id))
+            pieces.append(''.join(text[run_start:x]))
+            active_style_id = run_style_id
+            run_start = x
+            if x < width:
+                run_style_id = style_id
+        pieces.append(style_transition(active_style_id, PLAIN_STYLE_ID))
+        return ''.join(pieces)
+
+    def _serialized_per_cell(self, profile: ColorProfile) -> str:
+        rendered_cells: Dict[Tuple[int, int], str] = {}
+
+        adapts_styles = profile is not ColorProfile.TRUECOLOR
+
+        def render_cell(code_point: int, style_id: int) -> str:
+            if adapts_styles and style_id != TRANSPARENT_STYLE_ID:
+                style_id = style_id_for_profile(style_id, profile)
+            if style_id == PLAIN_STYLE_ID:
+                return chr(code_point)
+            key = (code_point, style_id)
+            rendered = rendered_cells.get(key)
+            if rendered is None:
+                rendered = decode_pixel(code_point, style_id).rendered
+                rendered_cells[key] = rendered
+            return rendered
+
+        def render_row(y: int) -> str:
+            start = y * self.width
+            cells = _cells_of_row(self.chars[start:start + self.width])
+            return ''.join(
+                render_cell(ord(cell), self.styles[start + x])
+                if len(cell) == 1 else cell
+                for x, cell in enumerate(cells)
+            )
+
+        return '\n'.join(render_row(y) for y in range(0, self.height))
+
     @classmethod
     def of(
             cls,
             size: Size,
             pixel_factory: Callable[[int, int], PixelSource] = lambda x, y: px()
     ) -> Canvas:
+        """Creates a canvas by calling ``pixel_factory`` with the coordinates
+        of each cell.
+
+        A wide character also covers the cell to its right, which becomes its
+        :data:`WIDE_CHARACTER_CONTINUATION` cell without calling the factory.
+        A wide character in the last column of a row does not fit, and is
+        replaced with an ellipsis of the same style.
+        """
+        chars = array('I', bytes(4 * size.area))
+        styles = array('i', bytes(4 * size.area))
+        width = size.width
+        i = 0
+        for y in range(0, size.height):
+            x = 0
+            while x < width:
+                code_point, style_id = encode_pixel(pixel_factory(x, y))
+                columns = 1
+                if (code_point >= _FIRST_WIDE_CODE_POINT and
+                        code_point_width(code_point) == 2):
+                    if x + 1 == width:
+                        code_point = _ELLIPSIS
+                    else:
+                        chars[i + 1] = WIDE_CHARACTER_CONTINUATION
+                        styles[i + 1] = style_id
+                        columns = 2
+                chars[i] = code_point
+                styles[i] = style_id
+                x += columns
+                i += columns
         return Canvas(
-            pixels=tuple(
-                tuple(
-                    px(pixel_factory(x, y))
-                    for x in range(0, size.width)
-                )
-                for y in range(0, size.height)
-            )
+            width=size.width,
+            height=size.height,
+            chars=chars,
+            styles=styles
+        )
+
+    @classmethod
+    def of_text(
+            cls,
+            size: Size,
+            spans: Iterable[Tuple[str, int]]
+    ) -> Canvas:
+        """Lays out text in a canvas, breaking it into rows by characters, as
+        by :func:`~neonsign.string.display_width.wrap_offsets`.
+
+        Args:
+            size: The size of the canvas.
+            spans: The pieces of the text, each paired with the ID of the
+                interned style applied to it.
+        """
+        spans = tuple(spans)
+        if size.width == 0:
+            return cls.of_lines(size, [])
+        lines = break_lines(
+            ''.join(text for text, _ in spans),
+            size.width,
+            WrapMode.CHARACTERS
+        )
+        return cls.of_lines(size, spans_of_lines(spans, lines))
+
+    @classmethod
+    def of_lines(
+            cls,
+            size: Size,
+            lines: Sequence[Sequence[Tuple[str, int]]]
+    ) -> Canvas:
+        """Lays out lines of text in a canvas, one line per row, by the number
+        of columns each character takes.
+
+        A wide character fills its own cell and the
+        :data:`WIDE_CHARACTER_CONTINUATION` cell to its right. A combining mark
+        is merged into the character before it when Unicode has a precomposed
+        form of the two, and dropped otherwise. Cells left over are filled with
+        plain spaces. When there are more lines than rows, an ellipsis follows
+        the last visible line, replacing its last character if the row is
+        full.
+
+        Args:
+            size: The size of the canvas.
+            lines: The lines, each consisting of pieces of text paired with
+                the ID of the interned style applied to them. Characters that
+                do not fit in a row are clipped.
+        """
+        width = size.width
+        area = size.area
+        chars = array('I', [_SPACE]) * area
+        styles = array('i', [PLAIN_STYLE_ID]) * area
+        i = 0
+        last = -1
+        for y in range(0, min(len(lines), size.height)):
+            i = y * width
+            row_end = i + width
+            last = -1
+            for text, style_id in lines[y]:
+                if text.isascii():
+                    num_fitting = min(len(text), row_end - i)
+                    if num_fitting > 0:
+                        chars[i:i + num_fitting] = array(
+                            'I', map(ord, text[:num_fitting])
+                        )
+                        styles[i:i + num_fitting] = (
+                            array('i', [style_id]) * num_fitting
+                        )
+                        i += num_fitting
+                        last = i - 1
+                    continue
+                for char, char_columns in zip(text, char_widths(text)):
+                    columns = char_columns if char_columns <= width else width
+                    if columns == 0:
+                        if last >= 0:
+                            composed = unicodedata.normalize(
+                                'NFC', chr(chars[last]) + char
+                            )
+                            if len(composed) == 1:
+                                chars[last] = ord(composed)
+                        continue
+                    if i + columns > row_end:
+                        break
+                    # A character wider than a row is shown as a space.
+                    chars[i] = ord(char) if columns == char_columns else _SPACE
+                    styles[i] = style_id
+                    if columns == 2:
+                        chars[i + 1] = WIDE_CHARACTER_CONTINUATION
+                        styles[i + 1] = style_id
+                    last = i
+                    i += columns
+
+        if len(lines) > size.height and area > 0:
+            if i < area:
+                chars[i] = _ELLIPSIS
+                if last >= 0:
+                    styles[i] = styles[last]
+            elif chars[i - 1] == WIDE_CHARACTER_CONTINUATION:
+                chars[i - 1] = _SPACE
+                styles[i - 1] = PLAIN_STYLE_ID
+                chars[i - 2] = _ELLIPSIS
+            else:
+                chars[i - 1] = _ELLIPSIS
+        return Canvas(
+            width=size.width,
+            height=size.height,
+            chars=chars,
+            styles=styles
+        )
+
+    @classmethod
+    def from_bytes(cls, data: Union[bytes, bytearray, memoryview]) -> Canvas:
+        """Loads a canvas converted by :func:`to_bytes`, from any object
+        supporting the buffer protocol, through a :class:`memoryview`.
+
+        Raises:
+            ValueError: when the data is not a canvas converted by
+                :func:`to_bytes`.
+        """
+        from neonsign.block.canvas_format import canvas_from_bytes
+        return canvas_from_bytes(data)
+
+    @classmethod
+    def filled(cls, size: Size, pixel: PixelSource = None) -> Canvas:
+        """Creates a canvas whose cells all hold the same pixel, laid out as
+        by :func:`of` if it is a wide character."""
+        code_point, style_id = encode_pixel(pixel)
+        if (code_point >= _FIRST_WIDE_CODE_POINT and
+                code_point_width(code_point) == 2):
+            return cls.of(size, lambda x, y: pixel)
+        return Canvas(
+            width=size.width,
+            height=size.height,
+            chars=array('I', [code_point]) * size.area,
+            styles=array('i', [style_id]) * size.area
         )
 
     @classmethod
     def from_pixels(cls, pixels: List[List[Pixel]]) -> Canvas:
-        return Canvas(pixels=tuple(tuple(l) for l in pixels))
+        if len(pixels) == 0:
+            return Canvas.empty()
+        return Canvas.of(
+            size=Size(width=len(pixels[0]), height=len(pixels)),
+            pixel_factory=lambda x, y: pixels[y][x]
+        )
 
     @classmethod
     def empty(cls) -> Canvas:
-        return Canvas(pixels=())
+        return Canvas(width=0, height=0, chars=array('I'), styles=array('i'))
+
+
+def _cells_of_row(row: array) -> List[str]:
+    """Converts the code points of a row to the text printed for each cell.
+
+    A continuation cell is printed as nothing after its wide character, and as
+    a space when that character was clipped away. A wide character whose
+    continuation cell was clipped away is printed as a space as well, so that
+    the rest of the row stays in place.
+    """
+    cells = [chr(code_point) for code_point in row]
+    last_x = len(cells) - 1
+    for x, code_point in enumerate(row):
+        if code_point == WIDE_CHARACTER_CONTINUATION:
+            if x == 0 or code_point_width(row[x - 1]) != 2:
+                cells[x] = ' '
+            else:
+                cells[x] = ''
+        elif (
+            code_point >= _FIRST_WIDE_CODE_POINT and
+            code_point_width(code_point) == 2 and
+            (x == last_x or row[x + 1] != WIDE_CHARACTER_CONTINUATION)
+        ):
+            cells[x] = ' '
+    return cells
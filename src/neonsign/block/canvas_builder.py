@@ -0,0 +1,151 @@
+from __future__ import annotations
+
+from array import array
+from typing import Optional, final
+
+from neonsign.block.canvas import (
+    Canvas, PixelSource, TRANSPARENT_STYLE_ID,
+    encode_pixel
+)
+from neonsign.core.point import Point
+from neonsign.core.rect import Rect
+from neonsign.core.size import Size
+
+
+@final
+class CanvasBuilder:
+    """A mutable canvas that blocks render into.
+
+    A builder owns one buffer for a whole render. Blocks draw into
+    sub-rectangles of it through :class:`RenderTarget` objects, and the buffer
+    is frozen into a :class:`Canvas` once by :func:`build`, without copying.
+    """
+
+    def __init__(self, size: Size, pixel: PixelSource = None):
+        code_point, style_id = encode_pixel(pixel)
+        self.size: Size = size
+        self._chars: Optional[array] = array('I', [code_point]) * size.area
+        self._styles: Optional[array] = array('i', [style_id]) * size.area
+
+    @property
+    def target(self) -> RenderTarget:
+        """The render target covering the whole builder."""
+        return RenderTarget(
+            builder=self,
+            origin=Point.origin(),
+            size=self.size,
+            clip=Rect.from_origin(self.size)
+        )
+
+    def build(self) -> Canvas:
+        """Freezes the contents drawn so far into a canvas.
+
+        The builder cannot be drawn into after it is built.
+        """
+        self._require_not_built()
+        canvas = Canvas(
+            width=self.size.width,
+            height=self.size.height,
+            chars=self._chars,
+            styles=self._styles
+        )
+        self._chars = None
+        self._styles = None
+        return canvas
+
+    def fill(self, rect: Rect, pixel: PixelSource) -> None:
+        """Sets every cell within the rectangle to the pixel."""
+        self._require_not_built()
+        code_point, style_id = encode_pixel(pixel)
+        chars = array('I', [code_point]) * rect.size.width
+        styles = array('i', [style_id]) * rect.size.width
+        for y in range(rect.top, rect.bottom):
+            start = y * self.size.width + rect.left
+            self._chars[start:start + rect.size.width] = chars
+            self._styles[start:start + rect.size.width] = styles
+
+    def draw(self, top_left: Point, canvas: Canvas, clip: Rect) -> None:
+        """Copies the canvas to the specified position, skipping transparent
+        pixels and cells outside the clipping rectangle."""
+        self._require_not_built()
+        x_start = max(clip.left, top_left.x)
+        x_end = min(clip.right, top_left.x + canvas.width)
+        y_start = max(clip.top, top_left.y)
+        y_end = min(clip.bottom, top_left.y + canvas.height)
+        if x_start >= x_end:
+            return
+        for y in range(y_start, y_end):
+            target = y * self.size.width
+            source = (y - top_left.y) * canvas.width - top_left.x
+            new_styles = canvas.styles[source + x_start:source + x_end]
+            if TRANSPARENT_STYLE_ID not in new_styles:
+                self._chars[target + x_start:target + x_end] = (
+                    canvas.chars[source + x_start:source + x_end]
+                )
+                self._styles[target + x_start:target + x_end] = new_styles
+                continue
+            for x in range(x_start, x_end):
+                style_id = canvas.styles[source + x]
+                if style_id != TRANSPARENT_STYLE_ID:
+                    self._chars[target + x] = canvas.chars[source + x]
+                    self._styles[target + x] = style_id
+
+    def _require_not_built(self):
+        if self._chars is None:
+            raise Exception('The canvas builder has already been built!')
+
+
+@final
+class RenderTarget:
+    """A rectangular area of a :class:`CanvasBuilder` that a block renders
+    into.
+
+    The size of a render target is the size granted to the block rendering
+    into it. Anything drawn outside the target's clipping rectangle, which is
+    the part of the target visible through all of its ancestors, is discarded.
+    """
+
+    def __init__(
+            self,
+            builder: CanvasBuilder,
+            origin: Point,
+            size: Size,
+            clip: Optional[Rect]
+    ):
+        self.builder: CanvasBuilder = builder
+        self.origin: Point = origin
+        self.size: Size = size
+        self.clip: Optional[Rect] = clip
+
+    def region(self, rect: Rect) -> RenderTarget:
+        """Obtains the render target for a rectangle relative to this
+        target."""
+        origin = self.origin.moved_by(
+            x_delta=rect.top_left.x,
+            y_delta=rect.top_left.y
+        )
+        clip: Optional[Rect] = None
+        if self.clip is not None:
+            intersection = self.clip.intersect(Rect(origin, rect.size))
+            if intersection is not None:
+                clip = intersection.moved_by(
+                    x_delta=self.clip.left,
+                    y_delta=self.clip.top
+                )
+        return RenderTarget(
+            builder=self.builder,
+            origin=origin,
+            size=rect.size,
+            clip=clip
+        )
+
+    def draw(self, canvas: Canvas) -> None:
+        """Draws the canvas at the top left corner of this target, skipping
+        transparent pixels."""
+        if self.clip is not None:
+            self.builder.draw(self.origin, canvas, self.clip)
+
+    def fill(self, pixel: PixelSource) -> None:
+        """Sets every visible cell of this target to the pixel."""
+        if self.clip is not None:
+            self.builder.fill(self.clip, pixel)
@@ -0,0 +1,214 @@
+"""Converts canvases to and from a compact binary format, to store them, for
+example in an on-disk cache, or to send them to other processes.
+
+A canvas is stored as, in order:
+
+1. A header of 24 bytes: the magic bytes ``b'NSCV'``, the format version, the
+   encoding of the character plane, the size of an item of the style plane,
+   a padding byte, then the width, the height, the number of styles and the
+   length of the character plane in bytes, as unsigned 32-bit integers.
+2. The character plane: the code points of all cells, row by row, encoded in
+   UTF-32 or UTF-8.
+3. The style plane: the index of the style of every cell in the style table,
+   row by row, as unsigned integers of 1, 2 or 4 bytes, whichever is the
+   smallest that fits. The index equal to the number of styles stands for
+   transparent cells.
+4. The style table: for every style, the number of its style commands, and
+   for every command, the number of its terminal codes followed by the codes
+   themselves, all as unsigned 16-bit integers.
+
+All integers are little-endian. Style IDs are only meaningful in the process
+that interned them, so styles are stored as their commands, and are interned
+again when loaded.
+"""
+from __future__ import annotations
+
+import struct
+import sys
+from array import array
+from typing import List, Tuple, Union
+
+from neonsign.block.canvas import Canvas, TRANSPARENT_STYLE_ID
+from neonsign.core.style_command import StyleCommand
+from neonsign.string.style_table import STYLE_TABLE
+
+MAGIC: bytes = b'NSCV'
+"""The bytes every stored canvas starts with."""
+
+VERSION: int = 1
+"""The version of the format written by :func:`canvas_to_bytes`."""
+
+UTF_32: str = 'utf-32'
+UTF_8: str = 'utf-8'
+
+_HEADER = struct.Struct('<4sBBBxIIII')
+_ENCODING_CODES = {UTF_32: 0, UTF_8: 1}
+_ENCODINGS = {code: encoding for encoding, code in _ENCODING_CODES.items()}
+_STYLE_ITEM_CODES = {1: 'B', 2: 'H', 4: 'I'}
+_IS_BIG_ENDIAN: bool = sys.byteorder == 'big'
+
+
+def canvas_to_bytes(canvas: Canvas, encoding: str = UTF_32) -> bytes:
+    """Converts a canvas to the binary format.
+
+    Args:
+        canvas: The canvas to convert.
+        encoding: The encoding of the character plane, either ``'utf-32'``,
+            which is fastest to load, or ``'utf-8'``, which takes a quarter of
+            the space for ASCII text.
+    """
+    encoding_code = _ENCODING_CODES.get(encoding)
+    if encoding_code is None:
+        raise ValueError(
+            f'encoding must be {UTF_32!r} or {UTF_8!r}, and not {encoding!r}!'
+        )
+
+    chars = canvas.chars
+    if _IS_BIG_ENDIAN:  # pragma: no cover
+        chars = array('I', chars)
+        chars.byteswap()
+    char_plane = chars.tobytes()
+    if encoding == UTF_8:
+        char_plane = char_plane.decode('utf-32-le', 'surrogatepass').encode(
+            'utf-8', 'surrogatepass'
+        )
+
+    style_ids = sorted(set(canvas.styles))
+    if TRANSPARENT_STYLE_ID in style_ids:
+        style_ids.remove(TRANSPARENT_STYLE_ID)
+    indices = {style_id: i for i, style_id in enumerate(style_ids)}
+    indices[TRANSPARENT_STYLE_ID] = len(style_ids)
+    item_size = _style_item_size(len(style_ids))
+    style_plane = array(
+        _STYLE_ITEM_CODES[item_size],
+        map(indices.__getitem__, canvas.styles)
+    )
+    if _IS_BIG_ENDIAN:  # pragma: no cover
+        style_plane.byteswap()
+
+    style_table = array('H')
+    for style_id in style_ids:
+        commands = STYLE_TABLE.commands(style_id)
+        style_table.append(len(commands))
+        for command in commands:
+            codes = command.terminal_code
+            style_table.append(len(codes))
+            style_table.extend(codes)
+    if _IS_BIG_ENDIAN:  # pragma: no cover
+        style_table.byteswap()
+
+    return b''.join((
+        _HEADER.pack(
+            MAGIC,
+            VERSION,
+            encoding_code,
+            item_size,
+            canvas.width,
+            canvas.height,
+            len(style_ids),
+            len(char_plane)
+        ),
+        char_plane,
+        style_plane.tobytes(),
+        style_table.tobytes()
+    ))
+
+
+def canvas_from_bytes(data: Union[bytes, bytearray, memoryview]) -> Canvas:
+    """Loads a canvas from the binary format.
+
+    The data is read through a :class:`memoryview`, so that it can be any
+    object supporting the buffer protocol, such as a memory-mapped file or a
+    part of a larger buffer, and each plane is copied once, straight into the
+    arrays of the canvas.
+
+    Raises:
+        ValueError: when the data is not a canvas in a supported version of
+            the format.
+    """
+    view = memoryview(data).cast('B')
+    if len(view) < _HEADER.size or view[:len(MAGIC)] != MAGIC:
+        raise ValueError('The data is not a stored canvas!')
+    (
+        _, version, encoding_code, item_size,
+        width, height, num_styles, char_plane_length
+    ) = _HEADER.unpack_from(view)
+    if version != VERSION:
+        raise ValueError(f'Canvas format version {version} is not supported!')
+    encoding = _ENCODINGS.get(encoding_code)
+    item_code = _STYLE_ITEM_CODES.get(item_size)
+    area = width * height
+    style_plane_start = _HEADER.size + char_plane_length
+    style_table_start = style_plane_start + area * item_size
+    if (
+        encoding is None or item_code is None or
+        len(view) < style_table_start
+    ):
+        raise ValueError('The stored canvas is corrupted!')
+
+    char_plane = view[_HEADER.size:style_plane_start]
+    chars = array('I')
+    if encoding == UTF_32:
+        chars.frombytes(char_plane)
+    else:
+        chars.frombytes(
+            str(char_plane, 'utf-8', 'surrogatepass').encode(
+                'utf-32-le', 'surrogatepass'
+            )
+        )
+    if _IS_BIG_ENDIAN:  # pragma: no cover
+        chars.byteswap()
+    if len(chars) != area:
+        raise ValueError('The stored canvas is corrupted!')
+
+    style_table_bytes = view[style_table_start:]
+    if len(style_table_bytes) % 2 != 0:
+        raise ValueError('The stored canvas is corrupted!')
+    style_table = array('H')
+    style_table.frombytes(style_table_bytes)
+    if _IS_BIG_ENDIAN:  # pragma: no cover
+        style_table.byteswap()
+    style_ids = _interned_style_ids(style_table, num_styles)
+    style_ids.append(TRANSPARENT_STYLE_ID)
+
+    style_indices = array(item_code)
+    style_indices.frombytes(view[style_plane_start:style_table_start])
+    if _IS_BIG_ENDIAN:  # pragma: no cover
+        style_indices.byteswap()
+    try:
+        styles = array('i', map(style_ids.__getitem__, style_indices))
+    except IndexError:
+        raise ValueError('The stored canvas is corrupted!') from None
+    return Canvas(width=width, height=height, chars=chars, styles=styles)
+
+
+def _style_item_size(num_styles: int) -> int:
+    # One more index is needed for transparent cells.
+    if num_styles < 0xFF:
+        return 1
+    if num_styles < 0xFFFF:
+        return 2
+    return 4
+
+
+def _interned_style_ids(style_table: array, num_styles: int) -> List[int]:
+    style_ids: List[int] = []
+    i = 0
+    try:
+        for _ in range(0, num_styles):
+            num_commands = style_table[i]
+            i += 1
+            commands: List[StyleCommand] = []
+            for _ in range(0, num_commands):
+                num_codes = style_table[i]
+                codes: Tuple[int, ...] = tuple(
+                    style_table[i + 1:i + 1 + num_codes]
+                )
+                if len(codes) != num_codes or num_codes == 0:
+                    raise IndexError
+                commands.append(StyleCommand.of(codes[0], codes[1:]))
+                i += 1 + num_codes
+            style_ids.append(STYLE_TABLE.intern(tuple(commands)))
+    except IndexError:
+        raise ValueError('The stored canvas is corrupted!') from None
+    return style_ids
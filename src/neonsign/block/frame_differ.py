@@ -0,0 +1,154 @@
+from __future__ import annotations
+
+from typing import List, Optional, TextIO, Tuple, final
+
+from neonsign.block.canvas import Canvas, WIDE_CHARACTER_CONTINUATION
+from neonsign.string.color_profile import ColorProfile
+
+ERASE_TO_END_OF_LINE: str = '\033[K'
+"""The escape sequence that erases a line from the cursor to its end."""
+
+
+def move_cursor(row: int, column: int) -> str:
+    """Creates the escape sequence that moves the cursor to a one-based row
+    and column of the screen."""
+    return f'\033[{row};{column}H'
+
+
+@final
+class FrameDiffer:
+    """Repaints the part of the terminal screen showing a canvas, writing only
+    the cells that changed since the previous frame.
+
+    The first frame, and any frame whose size differs from the previous one,
+    is painted in full. After that, every row of a new frame is compared with
+    the same row of the previous frame, and each run of changed cells is
+    written after moving the cursor to the start of the run.
+
+    Example::
+
+        differ = FrameDiffer()
+        while True:
+            differ.write(block.rendered(), sys.stdout)
+    """
+
+    def __init__(
+            self,
+            top: int = 1,
+            left: int = 1,
+            max_gap: int = 4,
+            profile: ColorProfile = ColorProfile.TRUECOLOR
+    ):
+        """
+        Args:
+            top: The one-based row of the screen where the frames start.
+            left: The one-based column of the screen where the frames start.
+            max_gap: Two runs of changed cells in the same row that are
+                separated by at most this many unchanged cells are written as
+                one run, since rewriting a few cells is shorter than moving the
+                cursor.
+            profile: The colors the terminal supports. Colors the terminal
+                does not support are replaced by the closest ones it does.
+        """
+        self.top: int = top
+        self.left: int = left
+        self.max_gap: int = max_gap
+        self.profile: ColorProfile = profile
+        self._previous: Optional[Canvas] = None
+
+    @property
+    def previous(self) -> Optional[Canvas]:
+        """The frame emitted most recently, or None if there isn't one."""
+        return self._previous
+
+    def reset(self) -> None:
+        """Forgets the previous frame, so that the next one is painted in
+        full. Call this after the screen was changed by anything else."""
+        self._previous = None
+
+    def diff(self, canvas: Canvas) -> str:
+        """Creates the output that updates the screen from the previous frame
+        to the specified one, and remembers the latter as the previous frame.
+        """
+        previous = self._previous
+        self._previous = canvas
+        if previous is None or previous.size != canvas.size:
+            return self._repaint(canvas, previous)
+
+        pieces: List[str] = []
+        width = canvas.width
+        for y in range(0, canvas.height):
+            start = y * width
+            end = start + width
+            if (
+                canvas.chars[start:end] == previous.chars[start:end] and
+                canvas.styles[start:end] == previous.styles[start:end]
+            ):
+                continue
+            for x_start, x_end in self._changed_runs(previous, canvas, y):
+                pieces.append(move_cursor(self.top + y, self.left + x_start))
+                pieces.append(
+                    canvas.serialized_row(y, x_start, x_end, self.profile)
+                )
+        return ''.join(pieces)
+
+    def write(self, canvas: Canvas, stream: TextIO) -> None:
+        """Writes the output that updates the screen to the specified frame to
+        the stream, and flushes the stream."""
+        output = self.diff(canvas)
+        if len(output) > 0:
+            stream.write(output)
+            stream.flush()
+
+    def _repaint(self, canvas: Canvas, previous: Optional[Canvas]) -> str:
+        previous_height = 0 if previous is None else previous.height
+        pieces: List[str] = []
+        for y in range(0, max(canvas.height, previous_height)):
+            pieces.append(move_cursor(self.top + y, self.left))
+            if y < canvas.height:
+                pieces.append(canvas.serialized_row(y, profile=self.profile))
+            pieces.append(ERASE_TO_END_OF_LINE)
+        return ''.join(pieces)
+
+    def _changed_runs(
+            self,
+            previous: Canvas,
+            canvas: Canvas,
+            y: int
+    ) -> List[Tuple[int, int]]:
+        start = y * canvas.width
+        runs: List[Tuple[int, int]] = []
+        run_start: Optional[int] = None
+        last_changed: int = 0
+        for x in range(0, canvas.width):
+            i = start + x
+            if (
+                canvas.chars[i] == previous.chars[i] and
+                canvas.styles[i] == previous.styles[i]
+            ):
+                continue
+            if run_start is None:
+                run_start = x
+            elif x - last_changed - 1 > self.max_gap:
+                runs.append((run_start, last_changed + 1))
+                run_start = x
+            last_changed = x
+        if run_start is not None:
+            runs.append((run_start, last_changed + 1))
+
+        # Wide characters are always written together with their continuation
+        # cells.
+        def is_continuation(x: int) -> bool:
+            return (
+                x < canvas.width and
+                canvas.chars[start + x] == WIDE_CHARACTER_CONTINUATION
+            )
+
+        return [
+            (
+                x_start - 1 if x_start > 0 and is_continuation(x_start)
+                else x_start,
+                x_end + 1 if is_continuation(x_end) else x_end
+            )
+            for x_start, x_end in runs
+        ]
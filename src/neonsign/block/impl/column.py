@@ -1,10 +1,12 @@
 from __future__ import annotations
 
-from typing import Dict, List, Optional, Tuple, final
+from typing import Dict, Hashable, Iterator, List, Optional, Tuple, final
 
 from neonsign.block.alignment import Alignment
 from neonsign.block.layout_calculation import ItemsDistributor
 from neonsign.block.block import LayoutBlock, Block
+from neonsign.block.canvas import Canvas
+from neonsign.block.canvas_builder import CanvasBuilder
 from neonsign.core.point import Point
 from neonsign.core.rect import Rect
 from neonsign.core.size import Size
@@ -25,6 +27,11 @@ class Column(LayoutBlock):
     def subblocks(self) -> Tuple[Block, ...]:
         return self.blocks
 
+    def _layout_key_parts(self) -> Optional[Tuple[Hashable, ...]]:
+        return (type(self),) + tuple(
+            block.layout_key for block in self.blocks
+        )
+
     def _measure_each(
             self,
             width_constraint: Optional[int] = None,
@@ -134,3 +141,31 @@ class Column(LayoutBlock):
             rects.append(rect)
             last_y += size.height
         return tuple(rects)
+
+    def render_in_bands(self, granted_size: Size) -> Iterator[Canvas]:
+        last_y: int = 0
+        for block, rect in zip(self.blocks, self.get_rects(granted_size)):
+            if rect.top > last_y:
+                yield Canvas.filled(
+                    Size(width=granted_size.width, height=rect.top - last_y),
+                    ' '
+                )
+                last_y = rect.top
+            for band in block.render_in_bands(rect.size):
+                visible_height = min(band.height, granted_size.height - last_y)
+                if visible_height <= 0:
+                    break
+                builder = CanvasBuilder(
+                    size=Size(width=granted_size.width, height=visible_height),
+                    pixel=' '
+                )
+                builder.target.region(
+                    Rect(top_left=Point(x=rect.left, y=0), size=band.size)
+                ).draw(band)
+                yield builder.build()
+                last_y += visible_height
+        if granted_size.height > last_y:
+            yield Canvas.filled(
+                Size(width=granted_size.width, height=granted_size.height - last_y),
+                ' '
+            )
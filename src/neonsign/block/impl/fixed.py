@@ -1,7 +1,8 @@
 from __future__ import annotations
 
-from typing import Optional, Tuple
+from typing import Hashable, Optional, Tuple
 
+from neonsign.block.axis import Axis
 from neonsign.block.block import LayoutBlock, Block
 from neonsign.core.point import Point
 from neonsign.core.rect import Rect
@@ -18,6 +19,22 @@ class FixedWidthBlock(LayoutBlock):
     def subblocks(self) -> Tuple[Block, ...]:
         return (self.original,)
 
+    def _layout_key_parts(self) -> Optional[Tuple[Hashable, ...]]:
+        return type(self), self.fixed_width, self.original.layout_key
+
+    def flexibility(
+            self,
+            axis: Axis,
+            cross_constraint: Optional[int] = None
+    ) -> bool:
+        # The original is always measured with the fixed width, regardless of
+        # the width constraint.
+        return (
+            axis is Axis.Y and
+            self.fixed_width != 0 and
+            self.original.flexibility(Axis.Y, self.fixed_width)
+        )
+
     def _measure(
             self,
             width_constraint: Optional[int] = None,
@@ -50,6 +67,22 @@ class FixedHeightBlock(LayoutBlock):
     def subblocks(self) -> Tuple[Block, ...]:
         return (self.original,)
 
+    def _layout_key_parts(self) -> Optional[Tuple[Hashable, ...]]:
+        return type(self), self.fixed_height, self.original.layout_key
+
+    def flexibility(
+            self,
+            axis: Axis,
+            cross_constraint: Optional[int] = None
+    ) -> bool:
+        # The original is always measured with the fixed height, regardless of
+        # the height constraint.
+        return (
+            axis is Axis.X and
+            self.fixed_height != 0 and
+            self.original.flexibility(Axis.X, self.fixed_height)
+        )
+
     def _measure(
             self,
             width_constraint: Optional[int] = None,
@@ -88,6 +121,21 @@ class FixedSizeBlock(LayoutBlock):
     def subblocks(self) -> Tuple[Block, ...]:
         return (self.original,)
 
+    def _layout_key_parts(self) -> Optional[Tuple[Hashable, ...]]:
+        return (
+            type(self),
+            self.fixed_width,
+            self.fixed_height,
+            self.original.layout_key,
+        )
+
+    def flexibility(
+            self,
+            axis: Axis,
+            cross_constraint: Optional[int] = None
+    ) -> bool:
+        return False
+
     def _measure(
             self,
             width_constraint: Optional[int] = None,
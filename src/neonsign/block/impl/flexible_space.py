@@ -9,4 +9,4 @@ from neonsign.core.size import Size
 @dataclass
 class FlexibleSpace(LeafBlock, FlexibleMeasurable):
     def _render(self, granted_size: Size) -> Canvas:
-        return Canvas.of(size=granted_size, pixel_factory=lambda x, y: ' ')
+        return Canvas.filled(size=granted_size, pixel=' ')
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Optional, Tuple, final
+from typing import Hashable, Optional, Tuple, final
 
 from neonsign.block.block import Block, LayoutBlock, LeafBlock
 from neonsign.block.canvas import Canvas, PixelSource, px
@@ -46,6 +46,9 @@ class FramedBlock(LayoutBlock):
             self._frame,
         ) + ((self._padded_title,) if self.title is not None else ())
 
+    def _layout_key_parts(self) -> Optional[Tuple[Hashable, ...]]:
+        return type(self), self._padded_original.layout_key
+
     def _measure(
             self,
             width_constraint: Optional[int] = None,
@@ -56,7 +59,7 @@ class FramedBlock(LayoutBlock):
             (height_constraint is not None and height_constraint < 2)
         ):
             return Size.zero()
-        return self.original.padded(num_spaces=1).measure(
+        return self._padded_original.measure(
             width_constraint=width_constraint,
             height_constraint=height_constraint
         )
@@ -74,12 +77,7 @@ class FramedBlock(LayoutBlock):
             height_constraint=granted_size.height
         )
 
-        padded_original_rect = Rect.from_origin(
-            size=self.original.padded(1).measure(
-                width_constraint=granted_size.width,
-                height_constraint=granted_size.height
-            )
-        )
+        padded_original_rect = Rect.from_origin(size=padded_original_size)
 
         rects = [padded_original_rect, frame_rect]
 
@@ -1,51 +1,110 @@
-import math
 from dataclasses import dataclass
-from typing import Optional, final
+from typing import Hashable, Optional, Sequence, Tuple, final
 
+from neonsign.block.axis import Axis
 from neonsign.block.block import LeafBlock
-from neonsign.block.canvas import Canvas, PixelSource
+from neonsign.block.canvas import Canvas
 from neonsign.core.size import Size
+from neonsign.string.display_width import display_width
+from neonsign.string.line_breaking import (
+    WrapMode, break_lines, spans_of_lines
+)
+from neonsign.string.style_table import PLAIN_STYLE_ID
 
 
 @final
 @dataclass
 class Label(LeafBlock):
+    """A block showing text, which wraps when the text is wider than the
+    width constraint.
+
+    Attributes:
+        content: The text.
+        wrap_mode: How the text is broken into lines.
+        hyphenate: Whether words may be broken with hyphens (see
+            :func:`~neonsign.string.line_breaking.break_lines`).
+    """
     content: str
+    wrap_mode: WrapMode = WrapMode.GREEDY
+    hyphenate: bool = False
+
+    def _layout_key_parts(self) -> Optional[Tuple[Hashable, ...]]:
+        return type(self), self.content, self.wrap_mode, self.hyphenate
+
+    def flexibility(
+            self,
+            axis: Axis,
+            cross_constraint: Optional[int] = None
+    ) -> bool:
+        return False
 
     def _measure(
             self,
             width_constraint: Optional[int] = None,
             height_constraint: Optional[int] = None
     ) -> Size:
-        if len(self.content) == 0:
-            return Size.zero()
-
-        if width_constraint is not None and width_constraint == 0:
-            return Size.zero()
-        if height_constraint is not None and height_constraint == 0:
-            return Size.zero()
-
-        # Is wrapping necessary?
-        if width_constraint is None or width_constraint > len(self.content):
-            return Size(
-                width=len(self.content),
-                height=1
-            )
-        else:
-            # TODO: Implement better handling of space characters. For example,
-            #  avoid starting a new line with a space.
-            num_lines = int(math.ceil(len(self.content) / width_constraint))
-            if height_constraint is not None:
-                num_lines = min(num_lines, height_constraint)
-            return Size(width=width_constraint, height=num_lines)
+        return measure_label(
+            self.content,
+            width_constraint,
+            height_constraint,
+            self.wrap_mode,
+            self.hyphenate
+        )
 
     def _render(self, granted_size: Size) -> Canvas:
-        if granted_size.area >= len(self.content):
-            content = self.content
-        else:
-            content = self.content[:granted_size.area - 1] + '…'
-
-        def pixel_factory(x: int, y: int) -> PixelSource:
-            i = x + y * granted_size.width
-            return content[i] if i < len(content) else ' '
-        return Canvas.of(granted_size, pixel_factory)
+        return render_label(
+            granted_size,
+            ((self.content, PLAIN_STYLE_ID),),
+            self.wrap_mode,
+            self.hyphenate
+        )
+
+
+def measure_label(
+        text: str,
+        width_constraint: Optional[int] = None,
+        height_constraint: Optional[int] = None,
+        wrap_mode: WrapMode = WrapMode.GREEDY,
+        hyphenate: bool = False
+) -> Size:
+    """Measures a label showing the specified text, which wraps when it is
+    wider than the width constraint."""
+    length = display_width(text)
+    if length == 0:
+        return Size.zero()
+
+    if width_constraint is not None and width_constraint == 0:
+        return Size.zero()
+    if height_constraint is not None and height_constraint == 0:
+        return Size.zero()
+
+    # Is wrapping necessary?
+    if width_constraint is None or width_constraint > length:
+        return Size(
+            width=length,
+            height=1
+        )
+    else:
+        num_lines = len(
+            break_lines(text, width_constraint, wrap_mode, hyphenate)
+        )
+        if height_constraint is not None:
+            num_lines = min(num_lines, height_constraint)
+        return Size(width=width_constraint, height=num_lines)
+
+
+def render_label(
+        granted_size: Size,
+        spans: Sequence[Tuple[str, int]],
+        wrap_mode: WrapMode = WrapMode.GREEDY,
+        hyphenate: bool = False
+) -> Canvas:
+    """Renders a label showing the specified pieces of styled text, broken
+    into lines as measured by :func:`measure_label`."""
+    if granted_size.width == 0:
+        return Canvas.of_lines(granted_size, [])
+    text = ''.join(text for text, _ in spans)
+    if display_width(text) <= granted_size.width:
+        return Canvas.of_lines(granted_size, [spans])
+    lines = break_lines(text, granted_size.width, wrap_mode, hyphenate)
+    return Canvas.of_lines(granted_size, spans_of_lines(spans, lines))
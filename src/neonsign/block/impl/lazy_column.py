@@ -0,0 +1,301 @@
+from __future__ import annotations
+
+from bisect import bisect_right
+from collections import OrderedDict
+from typing import (
+    Callable, Hashable, Iterator, List, Optional, Tuple, final
+)
+
+from neonsign.block import measurable
+from neonsign.block.axis import Axis
+from neonsign.block.block import Block, LayoutBlock
+from neonsign.block.cache import LayoutContainer, current_layout_container
+from neonsign.block.canvas import Canvas
+from neonsign.block.canvas_builder import CanvasBuilder, RenderTarget
+from neonsign.core.point import Point
+from neonsign.core.rect import Rect
+from neonsign.core.size import Size
+
+
+@final
+class LazyColumn(LayoutBlock):
+    """A column of rows that are created on demand.
+
+    Rows are created by calling ``row_factory`` with their indices, only when
+    they are measured or rendered, and the rows created most recently are
+    kept for reuse. A lazy column is as wide as its width constraint, and
+    every row is granted the full width and the height it measures.
+
+    When ``row_height`` is set, every row is granted that height, and rows are
+    only measured to find the width of a column without a width constraint,
+    and then only the rows within the height constraint: a render only
+    creates the rows it shows, so even a column of millions of rows renders in
+    the time and memory its visible rows take, for example inside a
+    :class:`~neonsign.ScrollView`. Otherwise, every row is measured once to
+    find where the rows start, and the positions are kept until the layout of
+    the column or of a kept row is invalidated. Without any constraint, every
+    row is measured either way.
+
+    Call :func:`invalidate_layout` after changing the rows the factory
+    creates. ``subblocks`` creates all rows.
+    """
+
+    def __init__(
+            self,
+            count: int,
+            row_factory: Callable[[int], Block],
+            row_height: Optional[int] = None,
+            cache_size: int = 1024
+    ):
+        """
+        Args:
+            count: The number of rows.
+            row_factory: Creates the row at an index.
+            row_height: The height of every row, or None if the rows have to
+                be measured.
+            cache_size: The maximum number of rows kept for reuse.
+        """
+        if count < 0:
+            raise ValueError(
+                f'count must be a non-negative integer and not {count}!'
+            )
+        if row_height is not None and row_height <= 0:
+            raise ValueError(
+                f'row_height must be a positive integer and not {row_height}!'
+            )
+        if cache_size <= 0:
+            raise ValueError(
+                f'cache_size must be a positive integer and not {cache_size}!'
+            )
+        self.count: int = count
+        self.row_factory: Callable[[int], Block] = row_factory
+        self.row_height: Optional[int] = row_height
+        self.cache_size: int = cache_size
+        self._rows: OrderedDict[int, Block] = OrderedDict()
+        self._row_tops: Optional[_RowTops] = None
+
+    def row(self, index: int) -> Block:
+        """Obtains the row at an index, creating it if it is not cached."""
+        row = self._rows.get(index)
+        if row is not None:
+            self._rows.move_to_end(index)
+            return row
+        row = self.row_factory(index)
+        self._rows[index] = row
+        if len(self._rows) > self.cache_size:
+            self._rows.popitem(last=False)
+        return row
+
+    @property
+    def subblocks(self) -> Tuple[Block, ...]:
+        return tuple(self.row(i) for i in range(0, self.count))
+
+    @property
+    def layout_stamp(self) -> int:
+        # Rows that are not kept are created anew by the factory, so only the
+        # column itself and the rows it keeps can signal that they changed.
+        cached = self._cached_layout_stamp
+        if cached is not None and cached[0] == measurable._latest_layout_stamp:
+            return cached[1]
+        stamp = max(
+            self._layout_stamp,
+            max((row.layout_stamp for row in self._rows.values()), default=0)
+        )
+        self._cached_layout_stamp = (measurable._latest_layout_stamp, stamp)
+        return stamp
+
+    def invalidate_layout(self) -> None:
+        super().invalidate_layout()
+        self._rows.clear()
+        self._row_tops = None
+
+    def _layout_key_parts(self) -> Optional[Tuple[Hashable, ...]]:
+        return None
+
+    def flexibility(
+            self,
+            axis: Axis,
+            cross_constraint: Optional[int] = None
+    ) -> bool:
+        if axis is Axis.X:
+            return cross_constraint != 0 and self.count > 0
+        return False
+
+    def _measure(
+            self,
+            width_constraint: Optional[int] = None,
+            height_constraint: Optional[int] = None
+    ) -> Size:
+        if self.count == 0:
+            return Size.zero()
+        if width_constraint is None:
+            rows = range(0, self.count)
+            if self.row_height is not None and height_constraint is not None:
+                # Rows below the height constraint are not shown, so they do
+                # not widen the column.
+                num_rows = -(-height_constraint // self.row_height)
+                rows = range(0, min(self.count, num_rows))
+            width = max(
+                (self._measure_row(i, None).width for i in rows),
+                default=0
+            )
+        else:
+            width = width_constraint
+        height = self._content_height(width)
+        if height_constraint is not None:
+            height = min(height, height_constraint)
+        return Size(width=width, height=height)
+
+    def _get_rects(self, granted_size: Size) -> Tuple[Rect, ...]:
+        return tuple(
+            self._row_rect(i, granted_size.width)
+            for i in range(0, self.count)
+        )
+
+    def _render_subblocks_into(self, target: RenderTarget) -> None:
+        if target.clip is None:
+            return
+        width = target.size.width
+        for i in self._rows_between(
+            target.clip.top - target.origin.y,
+            target.clip.bottom - target.origin.y,
+            width
+        ):
+            self._render_row_into(i, target.region(self._row_rect(i, width)))
+
+    def render_in_bands(self, granted_size: Size) -> Iterator[Canvas]:
+        last_y = 0
+        for i in self._rows_between(0, granted_size.height, granted_size.width):
+            rect = self._row_rect(i, granted_size.width)
+            band_height = min(rect.bottom, granted_size.height) - last_y
+            builder = CanvasBuilder(
+                size=Size(width=granted_size.width, height=band_height),
+                pixel=' '
+            )
+            self._render_row_into(
+                i,
+                builder.target.region(rect.moved_by(y_delta=-last_y))
+            )
+            yield builder.build()
+            last_y += band_height
+        if granted_size.height > last_y:
+            yield Canvas.filled(
+                Size(
+                    width=granted_size.width,
+                    height=granted_size.height - last_y
+                ),
+                ' '
+            )
+
+    def _rows_between(self, top: int, bottom: int, width: int) -> range:
+        """Obtains the indices of the rows intersecting the rows of the
+        column from ``top`` up to ``bottom``."""
+        if bottom <= top:
+            return range(0, 0)
+        if self.row_height is not None:
+            return range(
+                min(self.count, max(0, top // self.row_height)),
+                min(self.count, -(-bottom // self.row_height))
+            )
+        tops = self._tops_at(width).tops
+        return range(
+            max(0, bisect_right(tops, top) - 1),
+            min(self.count, bisect_right(tops, bottom - 1))
+        )
+
+    def _row_rect(self, index: int, width: int) -> Rect:
+        if self.row_height is not None:
+            return Rect(
+                top_left=Point(x=0, y=index * self.row_height),
+                size=Size(width=width, height=self.row_height)
+            )
+        tops = self._tops_at(width).tops
+        return Rect(
+            top_left=Point(x=0, y=tops[index]),
+            size=Size(width=width, height=tops[index + 1] - tops[index])
+        )
+
+    def _content_height(self, width: int) -> int:
+        if self.row_height is not None:
+            return self.count * self.row_height
+        return self._tops_at(width).tops[-1]
+
+    def _tops_at(self, width: int) -> _RowTops:
+        row_tops = self._row_tops
+        if row_tops is None or not row_tops.is_valid_for(self, width):
+            heights = [
+                self._measure_row(i, width).height
+                for i in range(0, self.count)
+            ]
+            row_tops = self._row_tops = _RowTops(
+                count=self.count,
+                width=width,
+                layout_stamp=self.layout_stamp,
+                heights=heights
+            )
+        return row_tops
+
+    def _measure_row(self, index: int, width: Optional[int]) -> Size:
+        with self._row_layout_container(index) as row:
+            return row.measure(width_constraint=width)
+
+    def _render_row_into(self, index: int, target: RenderTarget) -> None:
+        with self._row_layout_container(index) as row:
+            row.render_into(target)
+
+    def _row_layout_container(self, index: int) -> _RowLayoutContainer:
+        return _RowLayoutContainer(self.row(index))
+
+
+@final
+class _RowLayoutContainer:
+    """Measures or renders a row in a layout container of its own, unless the
+    current container keeps a persistent cache.
+
+    A render normally caches measurements by the identities of blocks, but a
+    row that is evicted from the cache of a lazy column can be freed during
+    the render, and a new row could then take over its identity.
+    """
+
+    def __init__(self, row: Block):
+        self._row: Block = row
+        self._container: Optional[LayoutContainer] = None
+
+    def __enter__(self) -> Block:
+        container = current_layout_container()
+        if container is None or not container.is_persistent:
+            self._container = LayoutContainer(self._row)
+            self._container.__enter__()
+        return self._row
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if self._container is not None:
+            self._container.__exit__(exc_type, exc_val, exc_tb)
+        return False
+
+
+@final
+class _RowTops:
+    """The cumulative heights of the rows of a lazy column laid out at a
+    width."""
+
+    def __init__(
+            self,
+            count: int,
+            width: int,
+            layout_stamp: int,
+            heights: List[int]
+    ):
+        self.count: int = count
+        self.width: int = width
+        self.layout_stamp: int = layout_stamp
+        self.tops: List[int] = [0]
+        for height in heights:
+            self.tops.append(self.tops[-1] + height)
+
+    def is_valid_for(self, column: LazyColumn, width: int) -> bool:
+        return (
+            self.count == column.count and
+            self.width == width and
+            column.layout_stamp <= self.layout_stamp
+        )
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Optional, Tuple, final
+from typing import Hashable, Optional, Tuple, final
 
 from neonsign.block.block import LayoutBlock, Block
 from neonsign.core.point import Point
@@ -22,6 +22,16 @@ class PaddedBlock(LayoutBlock):
     def subblocks(self) -> Tuple[Block, ...]:
         return (self.original,)
 
+    def _layout_key_parts(self) -> Optional[Tuple[Hashable, ...]]:
+        return (
+            type(self),
+            self.padding_top,
+            self.padding_right,
+            self.padding_bottom,
+            self.padding_left,
+            self.original.layout_key,
+        )
+
     @property
     def padding_horizontal(self) -> int:
         return self.padding_left + self.padding_right
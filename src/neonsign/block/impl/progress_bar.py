@@ -1,5 +1,6 @@
-from typing import Optional
+from typing import Hashable, Optional, Tuple
 
+from neonsign.block.axis import Axis
 from neonsign.block.block import LeafBlock
 from neonsign.block.canvas import Canvas, PixelSource
 from neonsign.core.size import Size
@@ -23,6 +24,18 @@ class ProgressBar(LeafBlock):
             )
         self.progress = progress
 
+    def _layout_key_parts(self) -> Optional[Tuple[Hashable, ...]]:
+        # The progress only affects rendering, so all progress bars measure
+        # the same.
+        return type(self),
+
+    def flexibility(
+            self,
+            axis: Axis,
+            cross_constraint: Optional[int] = None
+    ) -> bool:
+        return axis is Axis.X and cross_constraint != 0
+
     def _measure(
             self,
             width_constraint: Optional[int] = None,
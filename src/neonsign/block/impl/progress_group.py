@@ -0,0 +1,332 @@
+from __future__ import annotations
+
+import threading
+import time
+from array import array
+from collections import deque
+from typing import (
+    Callable, Deque, Hashable, List, Optional, Set, Tuple, final
+)
+
+from neonsign.block.axis import Axis
+from neonsign.block.block import LeafBlock
+from neonsign.block.canvas import Canvas
+from neonsign.block.impl.progress_bar import BLOCK_CHARS
+from neonsign.core.size import Size
+from neonsign.string.style_table import PLAIN_STYLE_ID
+
+_SPACE: int = ord(' ')
+_BLOCK_CODE_POINTS: Tuple[int, ...] = tuple(ord(c) for c in BLOCK_CHARS)
+_PERCENTAGE_WIDTH: int = 5
+"""The width of the percentage after a bar, including the space before it."""
+_STATISTICS_WIDTH: int = 19
+"""The width of the rate and the ETA after the percentage, including the
+spaces before them."""
+
+
+@final
+class ProgressGroup(LeafBlock):
+    """Shows the progress of many tasks, one task per row, each with a label,
+    a progress bar, and its percentage.
+
+    Updating the progress of a task takes constant time and is safe to do
+    from any thread, so thousands of tasks running in parallel can report
+    their progress as often as they like. The rows are kept between renders,
+    and a render only redraws the rows of the tasks whose bar, measured in
+    eighths of a cell like :class:`~neonsign.ProgressBar`, or whose text
+    changed since the previous render. Renders from several threads take
+    turns, while tasks keep reporting their progress.
+
+    When ``show_rate`` is set, every row also shows the progress per second
+    over the last ``window`` seconds, and the estimated time until the task
+    completes. Every render samples the progress of every task, so the rate
+    of a task that stops reporting progress falls over the window, and its
+    ETA follows.
+
+    A progress group can be watched by a :class:`~neonsign.LiveDisplay`,
+    which then repaints it whenever a task reports progress::
+
+        group = ProgressGroup()
+        async with LiveDisplay(lambda: group, watch=[group]):
+            ...
+    """
+
+    DEFAULT_BAR_WIDTH: int = 20
+
+    def __init__(
+            self,
+            label_width: int = 16,
+            show_rate: bool = False,
+            window: float = 10.0,
+            clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Args:
+            label_width: The number of columns shown of every label.
+            show_rate: Whether to show the rate and the ETA of every task.
+            window: The number of seconds the rates are computed over.
+            clock: The source of the current time in seconds, used for rates.
+        """
+        if label_width < 0:
+            raise ValueError(
+                f'label_width must be a non-negative integer and not '
+                f'{label_width}!'
+            )
+        if window <= 0:
+            raise ValueError(
+                f'window must be a positive number and not {window}!'
+            )
+        self.label_width: int = label_width
+        self.show_rate: bool = show_rate
+        self.window: float = window
+        self.clock: Callable[[], float] = clock
+        self._lock = threading.Lock()
+        self._render_lock = threading.Lock()
+        self._listeners: List[Callable[[int], None]] = []
+
+        # The state of the tasks, indexed by task ID.
+        self._totals: List[float] = []
+        self._completed: List[float] = []
+        self._labels: List[array] = []
+        self._dirty: Set[int] = set()
+
+        # The rows drawn by the previous render, guarded by the render lock.
+        self._width: int = 0
+        self._chars: array = array('I')
+        self._styles: array = array('i')
+        self._drawn: List[Optional[Tuple[int, str]]] = []
+        self._samples: List[Deque[Tuple[float, float]]] = []
+
+    def __len__(self) -> int:
+        return len(self._totals)
+
+    def add_task(self, label: str, total: float = 1.0) -> int:
+        """Adds a task below the existing ones.
+
+        Args:
+            label: The label shown before the bar of the task.
+            total: The progress at which the task completes.
+
+        Returns:
+            The ID of the task.
+        """
+        if total <= 0:
+            raise ValueError(f'total must be a positive number and not {total}!')
+        label_chars = Canvas.of_lines(
+            Size(width=self.label_width, height=1),
+            [[(label, PLAIN_STYLE_ID)]]
+        ).chars
+        with self._lock:
+            task_id = len(self._totals)
+            self._totals.append(total)
+            self._completed.append(0.0)
+            self._labels.append(label_chars)
+            self._dirty.add(task_id)
+        # A new row changes the height of the group.
+        self.invalidate_layout()
+        self._notify(task_id)
+        return task_id
+
+    def advance(self, task_id: int, amount: float = 1.0) -> None:
+        """Adds to the progress of a task."""
+        with self._lock:
+            self._completed[task_id] += amount
+            self._dirty.add(task_id)
+        self._notify(task_id)
+
+    def update(self, task_id: int, completed: float) -> None:
+        """Sets the progress of a task."""
+        with self._lock:
+            self._completed[task_id] = completed
+            self._dirty.add(task_id)
+        self._notify(task_id)
+
+    def completed(self, task_id: int) -> float:
+        """Obtains the progress of a task."""
+        return self._completed[task_id]
+
+    def rate(self, task_id: int) -> Optional[float]:
+        """Obtains the progress per second of a task over the window, as of
+        its latest render, or None if it has not been rendered twice."""
+        samples = self._samples[task_id] if task_id < len(self._samples) else ()
+        if len(samples) < 2:
+            return None
+        (start_time, start), (end_time, end) = samples[0], samples[-1]
+        if end_time <= start_time:
+            return None
+        return (end - start) / (end_time - start_time)
+
+    def eta(self, task_id: int) -> Optional[float]:
+        """Estimates the number of seconds until a task completes, at its
+        current rate, or None if the rate is unknown or not positive."""
+        remaining = self._totals[task_id] - self._completed[task_id]
+        if remaining <= 0:
+            return 0.0
+        rate = self.rate(task_id)
+        if rate is None or rate <= 0:
+            return None
+        return remaining / rate
+
+    def subscribe(self, listener: Callable[[int], None]) -> Callable[[], None]:
+        """Registers a function to call with the ID of every task whose
+        progress changes, on the thread that changes it.
+
+        Returns:
+            A function that unregisters the listener.
+        """
+        with self._lock:
+            self._listeners = self._listeners + [listener]
+
+        def unsubscribe() -> None:
+            with self._lock:
+                self._listeners = [
+                    other for other in self._listeners if other is not listener
+                ]
+
+        return unsubscribe
+
+    def _notify(self, task_id: int) -> None:
+        for listener in self._listeners:
+            listener(task_id)
+
+    def _layout_key_parts(self) -> Optional[Tuple[Hashable, ...]]:
+        return None
+
+    @property
+    def _default_width(self) -> int:
+        return (
+            self.label_width + 1 + self.DEFAULT_BAR_WIDTH +
+            _PERCENTAGE_WIDTH + (_STATISTICS_WIDTH if self.show_rate else 0)
+        )
+
+    def flexibility(
+            self,
+            axis: Axis,
+            cross_constraint: Optional[int] = None
+    ) -> bool:
+        return axis is Axis.X and cross_constraint != 0 and len(self) > 0
+
+    def _measure(
+            self,
+            width_constraint: Optional[int] = None,
+            height_constraint: Optional[int] = None
+    ) -> Size:
+        width = (
+            self._default_width if width_constraint is None
+            else width_constraint
+        )
+        height = len(self)
+        if height_constraint is not None:
+            height = min(height, height_constraint)
+        return Size(width=width, height=height)
+
+    def _render(self, granted_size: Size) -> Canvas:
+        with self._render_lock:
+            return self._redraw(granted_size)
+
+    def _redraw(self, granted_size: Size) -> Canvas:
+        width = granted_size.width
+        with self._lock:
+            num_tasks = len(self._totals)
+            if width != self._width:
+                self._width = width
+                self._chars = array('I', [_SPACE]) * (width * num_tasks)
+                self._styles = array('i', [PLAIN_STYLE_ID]) * (
+                    width * num_tasks
+                )
+                self._drawn = [None] * num_tasks
+                dirty = range(0, num_tasks)
+                self._dirty = set()
+            elif self.show_rate:
+                # The rates of all tasks change over time.
+                dirty = range(0, num_tasks)
+                self._dirty = set()
+            else:
+                dirty = sorted(self._dirty)
+                self._dirty = set()
+            changes = [
+                (task_id, self._completed[task_id], self._totals[task_id])
+                for task_id in dirty
+            ]
+
+        # Rows of tasks added since the previous render start out blank.
+        num_new_rows = num_tasks - len(self._drawn)
+        if num_new_rows > 0:
+            self._chars.extend(array('I', [_SPACE]) * (width * num_new_rows))
+            self._styles.extend(
+                array('i', [PLAIN_STYLE_ID]) * (width * num_new_rows)
+            )
+            self._drawn.extend([None] * num_new_rows)
+        self._samples.extend(
+            deque() for _ in range(len(self._samples), num_tasks)
+        )
+
+        now = self.clock()
+        for task_id, completed, total in changes:
+            if self.show_rate:
+                self._sample(task_id, now, completed)
+            self._draw_row(task_id, completed, total)
+
+        end = granted_size.height * width
+        return Canvas(
+            width=width,
+            height=granted_size.height,
+            chars=self._chars[:end],
+            styles=self._styles[:end]
+        )
+
+    def _sample(self, task_id: int, now: float, completed: float) -> None:
+        samples = self._samples[task_id]
+        samples.append((now, completed))
+        # One sample from before the window is kept, so that the rate spans
+        # the whole window.
+        while len(samples) > 2 and samples[1][0] <= now - self.window:
+            samples.popleft()
+
+    def _draw_row(self, task_id: int, completed: float, total: float) -> None:
+        width = self._width
+        fraction = min(max(completed / total, 0.0), 1.0)
+        bar_width = max(
+            0,
+            width - self.label_width - 1 - _PERCENTAGE_WIDTH - (
+                _STATISTICS_WIDTH if self.show_rate else 0
+            )
+        )
+        num_units = int(fraction * bar_width * len(BLOCK_CHARS))
+        text = f' {int(fraction * 100):>3}%'
+        if self.show_rate:
+            text += _statistics_text(self.rate(task_id), self.eta(task_id))
+        drawn = (num_units, text)
+        if self._drawn[task_id] == drawn:
+            return
+        self._drawn[task_id] = drawn
+
+        num_full_blocks, num_units_in_last_block = divmod(
+            num_units, len(BLOCK_CHARS)
+        )
+        bar = [_BLOCK_CODE_POINTS[-1]] * num_full_blocks
+        if num_units_in_last_block > 0:
+            bar.append(_BLOCK_CODE_POINTS[num_units_in_last_block - 1])
+        bar.extend([_SPACE] * (bar_width - len(bar)))
+        row = array('I', self._labels[task_id])
+        row.append(_SPACE)
+        row.extend(bar)
+        row.extend(map(ord, text))
+        if len(row) < width:
+            row.extend([_SPACE] * (width - len(row)))
+        start = task_id * width
+        self._chars[start:start + width] = row[:width]
+
+
+def _statistics_text(rate: Optional[float], eta: Optional[float]) -> str:
+    rate_text = '' if rate is None else f'{rate:.1f}/s'
+    if eta is None:
+        eta_text = '--:--'
+    else:
+        minutes, seconds = divmod(int(eta), 60)
+        hours, minutes = divmod(minutes, 60)
+        eta_text = (
+            f'{hours}:{minutes:02}:{seconds:02}' if hours > 0
+            else f'{minutes}:{seconds:02}'
+        )
+    return f' {rate_text:>9} {eta_text:>8}'
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Dict, List, Optional, Tuple, final
+from typing import Dict, Hashable, List, Optional, Tuple, final
 
 from neonsign.block.alignment import Alignment
 from neonsign.block.layout_calculation import ItemsDistributor
@@ -25,6 +25,11 @@ class Row(LayoutBlock):
     def subblocks(self) -> Tuple[Block, ...]:
         return self.blocks
 
+    def _layout_key_parts(self) -> Optional[Tuple[Hashable, ...]]:
+        return (type(self),) + tuple(
+            block.layout_key for block in self.blocks
+        )
+
     def _measure_each(
             self,
             width_constraint: Optional[int] = None,
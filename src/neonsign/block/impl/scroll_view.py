@@ -0,0 +1,215 @@
+from __future__ import annotations
+
+from bisect import bisect_right
+from operator import is_
+from typing import Hashable, List, Optional, Tuple, final
+
+from neonsign.block.alignment import Alignment
+from neonsign.block.axis import Axis
+from neonsign.block.block import Block, LayoutBlock
+from neonsign.block.canvas_builder import RenderTarget
+from neonsign.block.impl.column import Column
+from neonsign.core.point import Point
+from neonsign.core.rect import Rect
+from neonsign.core.size import Size
+
+
+@final
+class ScrollView(LayoutBlock):
+    """A viewport showing the part of a block that starts at an offset.
+
+    The block is laid out at the width of the viewport, or at
+    ``content_width`` if it is set, and at the height it needs. A scroll view
+    takes all the space it is granted, and, in an axis without a constraint,
+    the size of the block, wherever it is scrolled to. So scrolling never
+    changes the layout of the blocks around a scroll view.
+
+    When the block is a :class:`~neonsign.Column`, only the children that
+    intersect the viewport are rendered. They are found by bisecting the
+    cumulative heights of the children, which the scroll view keeps between
+    renders: as long as the layouts of the children are not invalidated, a
+    later render only measures the children appended to the column since the
+    previous one. To
+    scroll, keep the scroll view and update its offsets::
+
+        view = ScrollView(Column(*lines))
+        view.offset_y = view.content_height(80) - 60
+        print(view.rendered(width_constraint=80, height_constraint=60))
+
+    Other blocks are laid out in full, but blocks composed of other blocks
+    skip the parts that are not visible when rendering.
+    """
+
+    def __init__(
+            self,
+            child: Block,
+            offset_x: int = 0,
+            offset_y: int = 0,
+            content_width: Optional[int] = None
+    ):
+        """
+        Args:
+            child: The block to show.
+            offset_x: The column of the block shown at the left edge of the
+                viewport.
+            offset_y: The row of the block shown at the top edge of the
+                viewport.
+            content_width: The width to lay out the block at. When this is
+                None, the block is laid out at the width of the viewport.
+        """
+        for name, offset in [('offset_x', offset_x), ('offset_y', offset_y)]:
+            if offset < 0:
+                raise ValueError(
+                    f'{name} must be a non-negative integer and not {offset}!'
+                )
+        self.child: Block = child
+        self.offset_x: int = offset_x
+        self.offset_y: int = offset_y
+        self.content_width: Optional[int] = content_width
+        self._column_index: Optional[_ColumnIndex] = None
+
+    @property
+    def subblocks(self) -> Tuple[Block, ...]:
+        return (self.child,)
+
+    def _layout_key_parts(self) -> Optional[Tuple[Hashable, ...]]:
+        return (
+            type(self),
+            self.child.layout_key,
+            self.content_width
+        )
+
+    def flexibility(
+            self,
+            axis: Axis,
+            cross_constraint: Optional[int] = None
+    ) -> bool:
+        if cross_constraint is None:
+            return super().flexibility(axis, cross_constraint)
+        return cross_constraint != 0
+
+    def content_height(self, width: Optional[int] = None) -> int:
+        """Measures the height of the block shown, when the viewport has the
+        specified width."""
+        return self._content_size(width).height
+
+    def _content_size(self, width: Optional[int]) -> Size:
+        layout_width = (
+            self.content_width if self.content_width is not None else width
+        )
+        if isinstance(self.child, Column):
+            index = self._index_of(self.child, layout_width)
+            return Size(width=index.max_width, height=index.tops[-1])
+        return self.child.measure(width_constraint=layout_width)
+
+    def _measure(
+            self,
+            width_constraint: Optional[int] = None,
+            height_constraint: Optional[int] = None
+    ) -> Size:
+        if width_constraint is not None and height_constraint is not None:
+            return Size(width=width_constraint, height=height_constraint)
+        content_size = self._content_size(width_constraint)
+        return Size(
+            width=(
+                width_constraint if width_constraint is not None
+                else content_size.width
+            ),
+            height=(
+                height_constraint if height_constraint is not None
+                else content_size.height
+            )
+        )
+
+    def _get_rects(self, granted_size: Size) -> Tuple[Rect, ...]:
+        return (
+            Rect(
+                top_left=Point(x=-self.offset_x, y=-self.offset_y),
+                size=self._content_size(granted_size.width)
+            ),
+        )
+
+    def _render_subblocks_into(self, target: RenderTarget) -> None:
+        if not isinstance(self.child, Column):
+            super()._render_subblocks_into(target)
+            return
+
+        column = self.child
+        layout_width = (
+            self.content_width if self.content_width is not None
+            else target.size.width
+        )
+        index = self._index_of(column, layout_width)
+        window_bottom = self.offset_y + target.size.height
+        i = max(0, bisect_right(index.tops, self.offset_y) - 1)
+        while i < len(index.sizes) and index.tops[i] < window_bottom:
+            size = index.sizes[i]
+            if size.height > 0:
+                x = {
+                    Alignment.START: 0,
+                    Alignment.CENTER: index.max_width // 2 - size.width // 2,
+                    Alignment.END: index.max_width - size.width,
+                }[column.alignment]
+                column.blocks[i].render_into(
+                    target.region(
+                        Rect(
+                            top_left=Point(
+                                x=x - self.offset_x,
+                                y=index.tops[i] - self.offset_y
+                            ),
+                            size=size
+                        )
+                    )
+                )
+            i += 1
+
+    def _index_of(self, column: Column, width: Optional[int]) -> _ColumnIndex:
+        index = self._column_index
+        if index is None or not index.can_extend_to(column, width):
+            index = self._column_index = _ColumnIndex(width)
+        index.extend_to(column)
+        return index
+
+
+@final
+class _ColumnIndex:
+    """The sizes and cumulative heights of the children of a column laid out
+    at a width, measured as by :class:`~neonsign.Column` when its height is
+    unconstrained."""
+
+    def __init__(self, width: Optional[int]):
+        self.width: Optional[int] = width
+        self.layout_stamp: int = 0
+        self.blocks: Tuple[Block, ...] = ()
+        self.sizes: List[Size] = []
+        self.tops: List[int] = [0]
+        self.max_width: int = 0
+
+    def can_extend_to(self, column: Column, width: Optional[int]) -> bool:
+        """Checks whether the children measured so far are the first children
+        of the column, with their layouts unchanged."""
+        blocks = column.blocks
+        return (
+            width == self.width and
+            column.layout_stamp <= self.layout_stamp and
+            (
+                blocks is self.blocks or
+                len(blocks) >= len(self.blocks) and
+                all(map(is_, blocks, self.blocks))
+            )
+        )
+
+    def extend_to(self, column: Column) -> None:
+        """Measures the children of the column appended since the last call.
+        """
+        for block in column.blocks[len(self.blocks):]:
+            if block.is_flexible_in_y_axis(self.width):
+                # A column of unconstrained height has no height to spare.
+                size = Size.zero()
+            else:
+                size = block.measure(width_constraint=self.width)
+            self.sizes.append(size)
+            self.tops.append(self.tops[-1] + size.height)
+            self.max_width = max(self.max_width, size.width)
+        self.blocks = column.blocks
+        self.layout_stamp = column.layout_stamp
@@ -1,6 +1,7 @@
 from dataclasses import dataclass
-from typing import Optional, final
+from typing import Hashable, Optional, Tuple, final
 
+from neonsign.block.axis import Axis
 from neonsign.block.canvas import Canvas
 from neonsign.block.block import LeafBlock
 from neonsign.core.size import Size
@@ -13,6 +14,16 @@ class HorizontalSeparator(LeafBlock):
 
     DEFAULT_WIDTH = 3
 
+    def _layout_key_parts(self) -> Optional[Tuple[Hashable, ...]]:
+        return type(self),
+
+    def flexibility(
+            self,
+            axis: Axis,
+            cross_constraint: Optional[int] = None
+    ) -> bool:
+        return axis is Axis.X and cross_constraint != 0
+
     def _measure(
             self,
             width_constraint: Optional[int] = None,
@@ -34,7 +45,7 @@ class HorizontalSeparator(LeafBlock):
             return Size(width=width_constraint, height=1)
 
     def _render(self, granted_size: Size) -> Canvas:
-        return Canvas.of(granted_size, lambda x, y: '─')
+        return Canvas.filled(granted_size, '─')
 
 
 @final
@@ -44,6 +55,16 @@ class VerticalSeparator(LeafBlock):
 
     DEFAULT_HEIGHT = 3
 
+    def _layout_key_parts(self) -> Optional[Tuple[Hashable, ...]]:
+        return type(self),
+
+    def flexibility(
+            self,
+            axis: Axis,
+            cross_constraint: Optional[int] = None
+    ) -> bool:
+        return axis is Axis.Y and cross_constraint != 0
+
     def _measure(
             self,
             width_constraint: Optional[int] = None,
@@ -65,4 +86,4 @@ class VerticalSeparator(LeafBlock):
             return Size(width=1, height=height_constraint)
 
     def _render(self, granted_size: Size) -> Canvas:
-        return Canvas.of(granted_size, lambda x, y: '│')
+        return Canvas.filled(granted_size, '│')
@@ -0,0 +1,64 @@
+from dataclasses import dataclass
+from typing import Hashable, Optional, Tuple, final
+
+from neonsign.block.axis import Axis
+from neonsign.block.block import LeafBlock
+from neonsign.block.canvas import Canvas
+from neonsign.block.impl.label import measure_label, render_label
+from neonsign.core.size import Size
+from neonsign.string.line_breaking import WrapMode
+from neonsign.string.styled_string import StyledString
+
+
+@final
+@dataclass
+class StyledLabel(LeafBlock):
+    """A label showing a styled string, laid out like :class:`Label`.
+
+    The characters and styles are copied into the canvas straight from the
+    spans of the string, instead of creating one pixel per character. When the
+    granted size is too small, the last visible character is replaced by an
+    ellipsis in the style of that character.
+    """
+
+    content: StyledString
+    wrap_mode: WrapMode = WrapMode.GREEDY
+    hyphenate: bool = False
+
+    def _layout_key_parts(self) -> Optional[Tuple[Hashable, ...]]:
+        # Styles never change the size of a label.
+        return (
+            type(self), self._laid_out_text, self.wrap_mode, self.hyphenate
+        )
+
+    def flexibility(
+            self,
+            axis: Axis,
+            cross_constraint: Optional[int] = None
+    ) -> bool:
+        return False
+
+    def _measure(
+            self,
+            width_constraint: Optional[int] = None,
+            height_constraint: Optional[int] = None
+    ) -> Size:
+        return measure_label(
+            self._laid_out_text,
+            width_constraint,
+            height_constraint,
+            self.wrap_mode,
+            self.hyphenate
+        )
+
+    @property
+    def _laid_out_text(self) -> str:
+        return ''.join(text for text, _ in self.content.spans)
+
+    def _render(self, granted_size: Size) -> Canvas:
+        return render_label(
+            granted_size,
+            self.content.spans,
+            self.wrap_mode,
+            self.hyphenate
+        )
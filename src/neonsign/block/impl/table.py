@@ -0,0 +1,405 @@
+from __future__ import annotations
+
+from array import array
+from dataclasses import dataclass
+from typing import Dict, Hashable, List, Optional, Sequence, Tuple, final
+
+from neonsign.block.alignment import Alignment
+from neonsign.block.axis import Axis
+from neonsign.block.block import Block, LayoutBlock
+from neonsign.block.canvas import Canvas
+from neonsign.block.canvas_builder import RenderTarget
+from neonsign.block.frame_styles import FrameStyle
+from neonsign.block.layout_calculation import distribute_proportionally
+from neonsign.core.point import Point
+from neonsign.core.rect import Rect
+from neonsign.core.size import Size
+from neonsign.string.style_table import PLAIN_STYLE_ID
+
+
+@final
+@dataclass(frozen=True)
+class ColumnSpec:
+    """How the width of a column of a :class:`Table` is chosen.
+
+    Attributes:
+        min_width: The width below which the column is only shrunk when the
+            table cannot fit otherwise.
+        max_width: The largest width of the column, or None if it is
+            unlimited.
+        flex: The share of the width left over in a width-constrained table
+            that the column takes. Columns with a flex of 0 keep the width of
+            their widest cell.
+        alignment: How the cells are aligned in the column.
+    """
+    min_width: int = 0
+    max_width: Optional[int] = None
+    flex: int = 0
+    alignment: Alignment = Alignment.START
+
+    def __post_init__(self):
+        if self.min_width < 0:
+            raise ValueError(
+                f'min_width must be a non-negative integer and not '
+                f'{self.min_width}!'
+            )
+        if self.max_width is not None and self.max_width < self.min_width:
+            raise ValueError(
+                f'max_width must be at least min_width ({self.min_width}) and '
+                f'not {self.max_width}!'
+            )
+        if self.flex < 0:
+            raise ValueError(
+                f'flex must be a non-negative integer and not {self.flex}!'
+            )
+
+
+@final
+class Table(LayoutBlock):
+    """A grid of cells whose columns and rows are shared by all cells.
+
+    Every column is as wide as its widest cell, within the limits of its
+    :class:`ColumnSpec`. When a table is wider than its width constraint, its
+    columns shrink in proportion to how much wider they are than their
+    minimum widths; when it is narrower, the columns with a flex share the
+    width left over. Every row is as tall as its tallest cell at the widths
+    of the columns.
+
+    Each cell is measured once without constraints and once at the width of
+    its column, and the widths and heights found are kept until the layout of
+    the table or of a cell is invalidated, so measuring and rendering a table
+    lays it out only once.
+
+    The grid is drawn with the characters of ``style``. When ``style`` is
+    None, columns are separated by a space, and rows are not separated.
+    """
+
+    def __init__(
+            self,
+            *rows: Sequence[Block],
+            columns: Sequence[ColumnSpec] = (),
+            style: Optional[FrameStyle] = FrameStyle.REGULAR,
+            row_separators: bool = True
+    ):
+        """
+        Args:
+            rows: The cells of each row. Rows may have fewer cells than the
+                table has columns.
+            columns: The specifications of the columns, from left to right.
+                Columns without one use the defaults of :class:`ColumnSpec`.
+            style: The characters to draw the grid with, or None to draw no
+                grid.
+            row_separators: Whether a line is drawn between every two rows.
+                Only used when ``style`` is not None.
+        """
+        self.rows: Tuple[Tuple[Block, ...], ...] = tuple(
+            tuple(row) for row in rows
+        )
+        num_columns = max(
+            [len(columns)] + [len(row) for row in self.rows]
+        )
+        self.columns: Tuple[ColumnSpec, ...] = (
+            tuple(columns) +
+            (ColumnSpec(),) * (num_columns - len(columns))
+        )
+        self.style: Optional[FrameStyle] = style
+        self.row_separators: bool = row_separators
+        self._layouts: Dict[Optional[int], _TableLayout] = {}
+        self._layouts_stamp: int = 0
+
+    @property
+    def subblocks(self) -> Tuple[Block, ...]:
+        return tuple(cell for row in self.rows for cell in row)
+
+    def _layout_key_parts(self) -> Optional[Tuple[Hashable, ...]]:
+        return (
+            type(self),
+            self.columns,
+            self.style is not None,
+            self.row_separators,
+            tuple(len(row) for row in self.rows),
+        ) + tuple(cell.layout_key for row in self.rows for cell in row)
+
+    def flexibility(
+            self,
+            axis: Axis,
+            cross_constraint: Optional[int] = None
+    ) -> bool:
+        # Only a column with a flex and without a maximum width can grow to
+        # fill any width. Otherwise the table is probed by measuring it.
+        if axis is Axis.X and any(
+                column.flex > 0 and column.max_width is None
+                for column in self.columns
+        ):
+            return cross_constraint != 0
+        return super().flexibility(axis, cross_constraint)
+
+    def _measure(
+            self,
+            width_constraint: Optional[int] = None,
+            height_constraint: Optional[int] = None
+    ) -> Size:
+        layout = self._layout_at(width_constraint)
+        if layout is None:
+            return Size.zero()
+        height = layout.ys[-1]
+        if height_constraint is not None:
+            height = min(height, height_constraint)
+        return Size(width=layout.xs[-1], height=height)
+
+    def _get_rects(self, granted_size: Size) -> Tuple[Rect, ...]:
+        layout = self._layout_at(granted_size.width)
+        if layout is None:
+            return tuple(
+                Rect.from_origin(size=Size.zero())
+                for _ in self.subblocks
+            )
+        rects: List[Rect] = []
+        for i, row in enumerate(self.rows):
+            for j, size in enumerate(layout.cell_sizes[i]):
+                column_width = layout.widths[j]
+                x_offset = {
+                    Alignment.START: 0,
+                    Alignment.CENTER: column_width // 2 - size.width // 2,
+                    Alignment.END: column_width - size.width,
+                }[self.columns[j].alignment]
+                rects.append(
+                    Rect(
+                        top_left=Point(
+                            x=layout.xs[j] + x_offset,
+                            y=layout.ys[i]
+                        ),
+                        size=size
+                    )
+                )
+        return tuple(rects)
+
+    def _render_subblocks_into(self, target: RenderTarget) -> None:
+        if self.style is not None:
+            layout = self._layout_at(target.size.width)
+            if layout is not None:
+                self._draw_grid(target, layout)
+        super()._render_subblocks_into(target)
+
+    def _draw_grid(self, target: RenderTarget, layout: _TableLayout) -> None:
+        """Draws the lines of the grid, one row of the table at a time,
+        leaving spaces where the cells are."""
+        style = self.style
+
+        def line(left: str, mid: str, right: str, fill: str) -> array:
+            text = left + mid.join(fill * width for width in layout.widths)
+            return array('I', map(ord, text + right))
+
+        top = line(
+            style.top_left,
+            style.top_mid,
+            style.top_right,
+            style.horizontal_line
+        )
+        middle = line(
+            style.left_mid,
+            style.center,
+            style.right_mid,
+            style.horizontal_line
+        )
+        bottom = line(
+            style.bottom_left,
+            style.bottom_mid,
+            style.bottom_right,
+            style.horizontal_line
+        )
+        content = line(
+            style.vertical_line,
+            style.vertical_line,
+            style.vertical_line,
+            ' '
+        )
+
+        chars = array('I', top)
+        for i, height in enumerate(layout.heights):
+            if i > 0 and self.row_separators:
+                chars.extend(middle)
+            chars.extend(content * height)
+        chars.extend(bottom)
+
+        size = Size(width=layout.xs[-1], height=layout.ys[-1])
+        target.draw(
+            Canvas(
+                width=size.width,
+                height=size.height,
+                chars=chars,
+                styles=array('i', [PLAIN_STYLE_ID]) * size.area
+            )
+        )
+
+    def _layout_at(
+            self,
+            width_constraint: Optional[int]
+    ) -> Optional[_TableLayout]:
+        """Obtains the widths of the columns and the heights of the rows of
+        this table under a width constraint, or None if the constraint leaves
+        no room for the grid."""
+        layout_stamp = self.layout_stamp
+        if self._layouts_stamp != layout_stamp:
+            self._layouts = {}
+            self._layouts_stamp = layout_stamp
+        if width_constraint in self._layouts:
+            return self._layouts[width_constraint]
+        layout = self._solve(width_constraint)
+        if len(self._layouts) >= 16:
+            self._layouts.clear()
+        self._layouts[width_constraint] = layout
+        return layout
+
+    def _solve(
+            self,
+            width_constraint: Optional[int]
+    ) -> Optional[_TableLayout]:
+        num_columns = len(self.columns)
+        if len(self.rows) == 0 or num_columns == 0:
+            return None
+        if self.style is not None:
+            grid_width = num_columns + 1
+            grid_height = (
+                len(self.rows) + 1 if self.row_separators else 2
+            )
+        else:
+            grid_width = num_columns - 1
+            grid_height = 0
+
+        natural_widths = [column.min_width for column in self.columns]
+        for row in self.rows:
+            for j, cell in enumerate(row):
+                natural_widths[j] = max(
+                    natural_widths[j],
+                    cell.measure().width
+                )
+        for j, column in enumerate(self.columns):
+            if column.max_width is not None:
+                natural_widths[j] = min(natural_widths[j], column.max_width)
+
+        if width_constraint is None:
+            # A column with a flex and a maximum width grows to its maximum
+            # width given any room, so that is its width when unconstrained.
+            widths = [
+                column.max_width if column.flex > 0 and
+                column.max_width is not None else width
+                for column, width in zip(self.columns, natural_widths)
+            ]
+        elif width_constraint < grid_width:
+            return None
+        else:
+            widths = self._fit_widths(
+                natural_widths,
+                width_constraint - grid_width
+            )
+
+        cell_sizes = [
+            [
+                cell.measure(width_constraint=widths[j])
+                if widths[j] > 0 else Size.zero()
+                for j, cell in enumerate(row)
+            ]
+            for row in self.rows
+        ]
+        heights = [
+            max([size.height for size in sizes], default=0)
+            for sizes in cell_sizes
+        ]
+
+        # Lines or spaces separate the columns, and lines surround the grid.
+        xs = [1 if self.style is not None else 0]
+        for width in widths:
+            xs.append(xs[-1] + width + 1)
+        if self.style is None:
+            xs[-1] -= 1
+        ys = [1 if self.style is not None else 0]
+        for i, height in enumerate(heights):
+            row_gap = (
+                1 if self.style is not None and (
+                    self.row_separators or i == len(heights) - 1
+                ) else 0
+            )
+            ys.append(ys[-1] + height + row_gap)
+        return _TableLayout(
+            widths=widths,
+            heights=heights,
+            xs=xs,
+            ys=ys,
+            cell_sizes=cell_sizes
+        )
+
+    def _fit_widths(
+            self,
+            natural_widths: List[int],
+            available_width: int
+    ) -> List[int]:
+        """Shrinks or grows the widths of the columns to fit in the available
+        width."""
+        excess_width = sum(natural_widths) - available_width
+        if excess_width > 0:
+            min_widths = [
+                min(column.min_width, width)
+                for column, width in zip(self.columns, natural_widths)
+            ]
+            shrinkable_widths = [
+                width - min_width
+                for width, min_width in zip(natural_widths, min_widths)
+            ]
+            if excess_width <= sum(shrinkable_widths):
+                cuts = distribute_proportionally(
+                    excess_width,
+                    shrinkable_widths
+                )
+                return [
+                    width - cut for width, cut in zip(natural_widths, cuts)
+                ]
+            cuts = distribute_proportionally(
+                sum(min_widths) - available_width,
+                min_widths
+            )
+            return [width - cut for width, cut in zip(min_widths, cuts)]
+
+        widths = list(natural_widths)
+        extra_width = -excess_width
+        growable = self._growable_columns(widths)
+        while extra_width > 0 and len(growable) > 0:
+            grants = distribute_proportionally(
+                extra_width,
+                [self.columns[j].flex for j in growable]
+            )
+            for j, grant in zip(growable, grants):
+                max_width = self.columns[j].max_width
+                if max_width is not None:
+                    grant = min(grant, max_width - widths[j])
+                widths[j] += grant
+                extra_width -= grant
+            growable = self._growable_columns(widths)
+        return widths
+
+    def _growable_columns(self, widths: List[int]) -> List[int]:
+        return [
+            j for j, column in enumerate(self.columns)
+            if column.flex > 0 and (
+                column.max_width is None or widths[j] < column.max_width
+            )
+        ]
+
+
+@final
+@dataclass
+class _TableLayout:
+    """The solved layout of a table.
+
+    Attributes:
+        widths: The widths of the columns.
+        heights: The heights of the rows.
+        xs: The left edges of the columns, followed by the width of the table.
+        ys: The top edges of the rows, followed by the height of the table.
+        cell_sizes: The sizes of the cells in each row.
+    """
+    widths: List[int]
+    heights: List[int]
+    xs: List[int]
+    ys: List[int]
+    cell_sizes: List[List[Size]]
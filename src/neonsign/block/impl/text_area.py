@@ -1,9 +1,13 @@
-import math
-from typing import Optional
+from typing import Hashable, Optional, Tuple
 
+from neonsign.block.axis import Axis
 from neonsign.block.block import LeafBlock
-from neonsign.block.canvas import Canvas, PixelSource
+from neonsign.block.canvas import Canvas
 from neonsign.core.size import Size
+from neonsign.block.impl.label import render_label
+from neonsign.string.display_width import display_width
+from neonsign.string.line_breaking import WrapMode, break_lines
+from neonsign.string.style_table import PLAIN_STYLE_ID
 
 
 class TextArea(LeafBlock):
@@ -14,8 +18,12 @@ class TextArea(LeafBlock):
             self,
             content: str,
             max_number_of_lines: Optional[int] = None,
+            wrap_mode: WrapMode = WrapMode.GREEDY,
+            hyphenate: bool = False
     ):
         self.content = content
+        self.wrap_mode = wrap_mode
+        self.hyphenate = hyphenate
 
         if max_number_of_lines is not None and max_number_of_lines <= 0:
             raise ValueError(
@@ -24,6 +32,20 @@ class TextArea(LeafBlock):
             )
         self.max_number_of_lines = max_number_of_lines
 
+    def _layout_key_parts(self) -> Optional[Tuple[Hashable, ...]]:
+        return (
+            type(self), self.content, self.max_number_of_lines,
+            self.wrap_mode, self.hyphenate
+        )
+
+    def flexibility(
+            self,
+            axis: Axis,
+            cross_constraint: Optional[int] = None
+    ) -> bool:
+        # Text wraps to fill any width, but never grows taller than its lines.
+        return axis is Axis.X and cross_constraint != 0
+
     def _measure(
             self,
             width_constraint: Optional[int] = None,
@@ -39,14 +61,14 @@ class TextArea(LeafBlock):
         if width_constraint is None and height_constraint is None:
             if len(self.content) == 0:
                 return Size(width=self.DEFAULT_WIDTH, height=1)
-            return Size(width=len(self.content), height=1)
+            return Size(width=display_width(self.content), height=1)
 
         elif width_constraint is not None and height_constraint is None:
             if width_constraint == 0:
                 return Size.zero()
             if len(self.content) == 0:
                 return Size(width=width_constraint, height=1)
-            num_lines = int(math.ceil(len(self.content) / width_constraint))
+            num_lines = self._count_lines(width_constraint)
             return Size(width=width_constraint, height=num_lines)
 
         elif width_constraint is None and height_constraint is not None:
@@ -56,7 +78,7 @@ class TextArea(LeafBlock):
                 return Size(width=self.DEFAULT_WIDTH, height=1)
             if height_constraint == 0:
                 return Size.zero()
-            return Size(width=len(self.content), height=1)
+            return Size(width=display_width(self.content), height=1)
 
         else:
             if width_constraint == 0 or height_constraint == 0:
@@ -64,19 +86,21 @@ class TextArea(LeafBlock):
             if len(self.content) == 0:
                 return Size(width=width_constraint, height=1)
             else:
-                num_lines = int(math.ceil(len(self.content) / width_constraint))
+                num_lines = self._count_lines(width_constraint)
                 return Size(
                     width=width_constraint,
                     height=min(num_lines, height_constraint)
                 )
 
-    def _render(self, granted_size: Size) -> Canvas:
-        if granted_size.area >= len(self.content):
-            content = self.content
-        else:
-            content = self.content[:granted_size.area - 1] + '…'
+    def _count_lines(self, width: int) -> int:
+        return len(
+            break_lines(self.content, width, self.wrap_mode, self.hyphenate)
+        )
 
-        def pixel_factory(x: int, y: int) -> PixelSource:
-            i = x + y * granted_size.width
-            return content[i] if i < len(content) else ' '
-        return Canvas.of(granted_size, pixel_factory)
+    def _render(self, granted_size: Size) -> Canvas:
+        return render_label(
+            granted_size,
+            ((self.content, PLAIN_STYLE_ID),),
+            self.wrap_mode,
+            self.hyphenate
+        )
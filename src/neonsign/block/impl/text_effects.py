@@ -1,8 +1,10 @@
 from __future__ import annotations
 
-from typing import Callable, final
+from functools import partial
+from typing import Callable, Iterator, final
 
 from neonsign.block.block import Block, WrapperBlock
+from neonsign.block.canvas_builder import RenderTarget
 from neonsign.block.canvas import (
     Canvas, Pixel, PixelSource,
     StyledStringPixel
@@ -24,53 +26,69 @@ class MappedBlock(WrapperBlock):
 
     def _render(self, granted_size: Size) -> Canvas:
         original_render: Canvas = self.original.render(granted_size)
-        def f(pixel: Pixel) -> PixelSource:
-            if isinstance(pixel, StyledStringPixel):
-                return self.f(pixel.styled_string)
-            else:
-                return pixel
-        return original_render.map(f)
+        return original_render.map(self._map_pixel)
+
+    def _map_pixel(self, pixel: Pixel) -> PixelSource:
+        if isinstance(pixel, StyledStringPixel):
+            return self.f(pixel.styled_string)
+        else:
+            return pixel
+
+    def render_in_bands(self, granted_size: Size) -> Iterator[Canvas]:
+        for band in self.original.render_in_bands(granted_size):
+            yield band.map(self._map_pixel)
+
+    def render_into(self, target: RenderTarget) -> None:
+        # The mapping applies to the pixels of the original block only, so
+        # they cannot be drawn into the shared target before being mapped.
+        target.draw(self.render(granted_size=target.size))
 
 
 @final
 class ForegroundColoredBlock(MappedBlock):
     def __init__(self, original: Block, color: Color):
-        super().__init__(original, lambda _: _.foreground(color))
+        super().__init__(
+            original,
+            partial(StyledString.foreground, color=color)
+        )
         self.color = color
 
 
 @final
 class BackgroundColoredBlock(MappedBlock):
     def __init__(self, original: Block, color: Color):
-        super().__init__(original, lambda _: _.background(color))
+        super().__init__(
+            original,
+            partial(StyledString.background, color=color)
+        )
         self.color = color
 
 
 @final
 class ColorInvertedBlock(MappedBlock):
     def __init__(self, original: Block):
-        super().__init__(original, lambda _: _.inverted())
+        super().__init__(original, StyledString.inverted)
 
 
 @final
 class BoldBlock(MappedBlock):
     def __init__(self, original: Block):
-        super().__init__(original, lambda _: _.bold())
+        super().__init__(original, StyledString.bold)
 
 
 @final
 class ItalicBlock(MappedBlock):
     def __init__(self, original: Block):
-        super().__init__(original, lambda _: _.italic())
+        super().__init__(original, StyledString.italic)
 
 
 @final
 class UnderlinedBlock(MappedBlock):
     def __init__(self, original: Block):
-        super().__init__(original, lambda _: _.underlined())
+        super().__init__(original, StyledString.underlined)
 
 
 @final
 class BlinkingBlock(MappedBlock):
     def __init__(self, original: Block):
-        super().__init__(original, lambda _: _.blinking())
+        super().__init__(original, StyledString.blinking)
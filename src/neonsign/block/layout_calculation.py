@@ -1,3 +1,6 @@
+from typing import List, Sequence
+
+
 class ItemsDistributor:
     avg: int
     mod: int
@@ -21,3 +24,28 @@ class ItemsDistributor:
             return self.avg + 1
         else:
             return self.avg
+
+
+def distribute_proportionally(
+        num_items: int,
+        weights: Sequence[int]
+) -> List[int]:
+    """Splits a number of items among recipients in proportion to their
+    weights.
+
+    Every recipient first gets its share rounded down, and the items left over
+    go one each to the recipients with the largest remainders, the earlier
+    recipient first when they are equal. No recipient gets items when all
+    weights are 0.
+    """
+    total_weight = sum(weights)
+    if total_weight == 0:
+        return [0] * len(weights)
+    shares = [num_items * weight // total_weight for weight in weights]
+    remainders = sorted(
+        range(0, len(weights)),
+        key=lambda i: -(num_items * weights[i] % total_weight)
+    )
+    for i in remainders[:num_items - sum(shares)]:
+        shares[i] += 1
+    return shares
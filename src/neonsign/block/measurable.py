@@ -1,14 +1,41 @@
 import sys
 from abc import ABC, abstractmethod
-from typing import Optional
+from itertools import count
+from typing import Any, Hashable, Optional, Tuple
 
-from neonsign.block.cache import current_layout_container
+from neonsign.block.axis import Axis
+from neonsign.block.cache import LayoutKey, current_layout_container
 from neonsign.core.size import Size
 
+_LAYOUT_STAMPS = count(1)
+"""The source of layout stamps. Each stamp is greater than all earlier ones."""
+
+_latest_layout_stamp: int = 0
+"""The stamp assigned most recently to any object. Stamps that composite
+objects derive from their components are kept until this changes."""
+
+_MISSING = object()
+
 
 class Measurable(ABC):
     """An object whose size can be measured."""
 
+    _layout_stamp: int = 0
+    _cached_layout_key: Optional[Tuple[int, int, Optional[LayoutKey]]] = None
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        # Assigning a public field of an object that has been measured may
+        # change its measurements, so it invalidates the layout of the
+        # object, and thereby the layout keys of the objects containing it.
+        changes_layout = (
+            name[0] != '_' and
+            self._cached_layout_key is not None and
+            getattr(self, name, _MISSING) is not value
+        )
+        super().__setattr__(name, value)
+        if changes_layout:
+            self.invalidate_layout()
+
     @abstractmethod
     def _measure(
             self,
@@ -113,37 +140,111 @@ class Measurable(ABC):
         cache_key = ctx.get_cache_key(self, width_constraint, height_constraint)
         return ctx.cache.get(key=cache_key, compute=compute)
 
+    def invalidate_layout(self) -> None:
+        """Notifies layout caches that this object changed in a way that
+        affects its measurements.
+
+        This is called when a public field of this object is assigned after
+        it was measured. The call is needed when this object changes in any
+        other way, for example when a list it keeps is modified in place.
+        """
+        global _latest_layout_stamp
+        self._layout_stamp = _latest_layout_stamp = next(_LAYOUT_STAMPS)
+
+    @property
+    def layout_stamp(self) -> int:
+        """The latest stamp assigned by :func:`invalidate_layout` to this
+        object or anything its measurements depend on, or 0 if there is none.
+        """
+        return self._layout_stamp
+
+    def _layout_key_parts(self) -> Optional[Tuple[Hashable, ...]]:
+        """The values that fully determine the measurements of this object,
+        for example its type and its text, or None if there aren't any.
+
+        Objects returning equal parts share cached measurements. A composite
+        object should include the layout keys of its components; if any of
+        them is None, so is the layout key of the composite.
+        """
+        return None
+
+    @property
+    def layout_key(self) -> Optional[LayoutKey]:
+        """The interned key of the measurements of this object, or None if
+        it is measured by identity.
+
+        The key is computed once, and only recomputed after the
+        :attr:`layout_stamp` of this object changes, that is, after the
+        layout of this object or of anything it contains is invalidated.
+        """
+        cached = self._cached_layout_key
+        if cached is not None and cached[0] == _latest_layout_stamp:
+            return cached[2]
+        stamp = self.layout_stamp
+        if cached is not None and cached[1] == stamp:
+            key = cached[2]
+        else:
+            parts = self._layout_key_parts()
+            if parts is None or None in parts:
+                key = None
+            else:
+                key = LayoutKey.of(parts)
+        self._cached_layout_key = (_latest_layout_stamp, stamp, key)
+        return key
+
     @property
     def unconstrained_size(self) -> Size:
         return self.measure(width_constraint=None, height_constraint=None)
 
+    def flexibility(
+            self,
+            axis: Axis,
+            cross_constraint: Optional[int] = None
+    ) -> bool:
+        """Checks whether this object is flexible in an axis, that is, it
+        shrinks to nothing when constrained to 0 in that axis, and grows to
+        fill any constraint in that axis.
+
+        Args:
+            axis: The axis to check.
+            cross_constraint: The constraint in the cross axis.
+
+        The default implementation measures this object constrained to 0 and
+        to ``sys.maxsize`` in the axis. Objects that know their flexibility
+        should override this method to answer without measuring.
+        """
+        if axis is Axis.X:
+            min_size: Size = self.measure(
+                width_constraint=0,
+                height_constraint=cross_constraint
+            )
+            max_size: Size = self.measure(
+                width_constraint=sys.maxsize,
+                height_constraint=cross_constraint
+            )
+            return min_size.width == 0 and max_size.width >= sys.maxsize
+        else:
+            min_size: Size = self.measure(
+                width_constraint=cross_constraint,
+                height_constraint=0
+            )
+            max_size: Size = self.measure(
+                width_constraint=cross_constraint,
+                height_constraint=sys.maxsize
+            )
+            return min_size.height == 0 and max_size.height >= sys.maxsize
+
     def is_flexible_in_x_axis(
             self,
             height_constraint: Optional[int] = None
     ) -> bool:
-        min_width: int = self.measure(
-            width_constraint=0,
-            height_constraint=height_constraint
-        ).width
-        max_width: int = self.measure(
-            width_constraint=sys.maxsize,
-            height_constraint=height_constraint
-        ).width
-        return min_width == 0 and max_width >= sys.maxsize
+        return self.flexibility(Axis.X, cross_constraint=height_constraint)
 
     def is_flexible_in_y_axis(
             self,
             width_constraint: Optional[int] = None
     ) -> bool:
-        min_height: int = self.measure(
-            width_constraint=width_constraint,
-            height_constraint=0
-        ).height
-        max_height: int = self.measure(
-            width_constraint=width_constraint,
-            height_constraint=sys.maxsize
-        ).height
-        return min_height == 0 and max_height >= sys.maxsize
+        return self.flexibility(Axis.Y, cross_constraint=width_constraint)
 
 
 class FlexibleMeasurable(Measurable):
@@ -152,6 +253,21 @@ class FlexibleMeasurable(Measurable):
     def default_size(self) -> Size:
         return Size(width=1, height=1)
 
+    def _layout_key_parts(self) -> Optional[Tuple[Hashable, ...]]:
+        return type(self), self.default_size
+
+    def flexibility(
+            self,
+            axis: Axis,
+            cross_constraint: Optional[int] = None
+    ) -> bool:
+        if cross_constraint is None:
+            default_size = self.default_size
+            return (
+                default_size.height if axis is Axis.X else default_size.width
+            ) != 0
+        return cross_constraint != 0
+
     def _measure(
             self,
             width_constraint: Optional[int] = None,
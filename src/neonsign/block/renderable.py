@@ -1,9 +1,15 @@
+from __future__ import annotations
+
 import logging
 from abc import ABC, abstractmethod
+from typing import Iterator, TYPE_CHECKING
 
 from neonsign.block.canvas import Canvas
 from neonsign.core.size import Size
 
+if TYPE_CHECKING:
+    from neonsign.block.canvas_builder import RenderTarget
+
 
 class Renderable(ABC):
     """An object that can be rendered on a two-dimensional canvas."""
@@ -33,3 +39,23 @@ class Renderable(ABC):
             return canvas.crop_or_pad_to(granted_size)
         else:
             return canvas
+
+    def render_into(self, target: RenderTarget) -> None:
+        """Renders the text block into a render target, using the size of the
+        target as the granted size.
+
+        Transparent pixels leave the contents already in the target visible.
+        Blocks composed of other blocks override this method so that their
+        subblocks draw into the shared target directly.
+        """
+        target.draw(self.render(granted_size=target.size))
+
+    def render_in_bands(self, granted_size: Size) -> Iterator[Canvas]:
+        """Renders the text block as a sequence of canvases, which are as wide
+        as the granted size and, stacked from top to bottom, form the render.
+
+        By default, the whole render is yielded as one band. Blocks that can
+        render one part at a time, such as :class:`~neonsign.Column`, override
+        this method so that only one band needs to be in memory at a time.
+        """
+        yield self.render(granted_size=granted_size)
@@ -23,7 +23,10 @@ _SIMPLE_COLOR_COMMANDS = {
 
 
 def command_for_foreground(color: Color) -> StyleCommand:
-    """Creates a style command that sets the terminal's foreground color.
+    """Obtains the style command that sets the terminal's foreground color.
+
+    The command is created once per color, and kept by the color as
+    :attr:`~neonsign.core.colors.Color.foreground_command`.
 
     Args:
         color: The foreground color.
@@ -35,22 +38,14 @@ def command_for_foreground(color: Color) -> StyleCommand:
         TypeError: when the type of the color is not recognized.
 
     """
-
-    if isinstance(color, SimpleColor):
-        return StyleCommand(command=_SIMPLE_COLOR_COMMANDS[color])
-    elif isinstance(color, Color8):
-        return StyleCommand(command=38, args=(5, color.index))
-    elif isinstance(color, Color24):
-        return StyleCommand(
-            command=38,
-            args=(2, color.red, color.green, color.blue)
-        )
-    else:
-        raise TypeError(f'Unknown color type {type(color)}!')
+    return color.foreground_command
 
 
 def command_for_background(color: Color) -> StyleCommand:
-    """Creates a style command that sets the terminal's background color.
+    """Obtains the style command that sets the terminal's background color.
+
+    The command is created once per color, and kept by the color as
+    :attr:`~neonsign.core.colors.Color.background_command`.
 
     Args:
         color: The background color.
@@ -62,9 +57,18 @@ def command_for_background(color: Color) -> StyleCommand:
         TypeError: when the type of the color is not recognized.
 
     """
+    return color.background_command
+
 
-    foreground_command: StyleCommand = command_for_foreground(color)
-    return StyleCommand(
-        command=foreground_command.command + 10,
-        args=foreground_command.args
-    )
+def _create_foreground_command(color: Color) -> StyleCommand:
+    if isinstance(color, SimpleColor):
+        return StyleCommand.of(command=_SIMPLE_COLOR_COMMANDS[color])
+    elif isinstance(color, Color8):
+        return StyleCommand.of(command=38, args=(5, color.index))
+    elif isinstance(color, Color24):
+        return StyleCommand.of(
+            command=38,
+            args=(2, color.red, color.green, color.blue)
+        )
+    else:
+        raise TypeError(f'Unknown color type {type(color)}!')
@@ -0,0 +1,315 @@
+"""Converts colors in batches, and maps colors to the palettes of terminals
+that support fewer colors.
+
+Large batches are converted with NumPy when it is installed, and with
+:mod:`colorsys` otherwise. Both compute the same colors as converting the
+colors one at a time.
+"""
+from __future__ import annotations
+
+import colorsys
+from functools import lru_cache
+from typing import List, Sequence, Tuple
+
+from neonsign.core.colors import Color, Color24, Color8, SimpleColor
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None
+
+_MIN_NUMPY_BATCH_SIZE: int = 64
+"""The smallest batch worth converting with NumPy."""
+
+RGB = Tuple[int, int, int]
+
+_SIMPLE_COLOR_RGBS: Tuple[Tuple[SimpleColor, RGB], ...] = (
+    (Color.BLACK, (0, 0, 0)),
+    (Color.RED, (205, 0, 0)),
+    (Color.GREEN, (0, 205, 0)),
+    (Color.YELLOW, (205, 205, 0)),
+    (Color.BLUE, (0, 0, 238)),
+    (Color.MAGENTA, (205, 0, 205)),
+    (Color.CYAN, (0, 205, 205)),
+    (Color.WHITE, (229, 229, 229)),
+    (Color.BRIGHT_BLACK, (127, 127, 127)),
+    (Color.BRIGHT_RED, (255, 0, 0)),
+    (Color.BRIGHT_GREEN, (0, 255, 0)),
+    (Color.BRIGHT_YELLOW, (255, 255, 0)),
+    (Color.BRIGHT_BLUE, (92, 92, 255)),
+    (Color.BRIGHT_MAGENTA, (255, 0, 255)),
+    (Color.BRIGHT_CYAN, (0, 255, 255)),
+    (Color.BRIGHT_WHITE, (255, 255, 255)),
+)
+"""The simple colors, in the order of their 8-bit color indices, with the
+values xterm shows them in by default."""
+
+_CUBE_LEVELS: Tuple[int, ...] = (0, 95, 135, 175, 215, 255)
+"""The values of each component in the 6 × 6 × 6 color cube of the 8-bit
+colors 16 to 231."""
+
+
+def rgb_of(color: Color) -> RGB:
+    """Obtains the red, green and blue components of a color.
+
+    The simple colors and the first 16 8-bit colors are configured in the
+    terminal; the values xterm shows them in by default are used for them.
+
+    Raises:
+        TypeError: when the type of the color is not recognized.
+    """
+    if isinstance(color, Color24):
+        return color.red, color.green, color.blue
+    if isinstance(color, Color8):
+        return _color8_rgb(color.index)
+    if isinstance(color, SimpleColor):
+        return _simple_color_rgb(color)
+    raise TypeError(f'Unknown color type {type(color)}!')
+
+
+def _color8_rgb(index: int) -> RGB:
+    if index < 16:
+        return _SIMPLE_COLOR_RGBS[index][1]
+    if index < 232:
+        index -= 16
+        return (
+            _CUBE_LEVELS[index // 36],
+            _CUBE_LEVELS[index // 6 % 6],
+            _CUBE_LEVELS[index % 6]
+        )
+    gray = 8 + (index - 232) * 10
+    return gray, gray, gray
+
+
+def _simple_color_rgb(color: SimpleColor) -> RGB:
+    for simple_color, rgb in _SIMPLE_COLOR_RGBS:
+        if simple_color == color:
+            return rgb
+    raise ValueError(f'Unknown simple color {color}!')  # pragma: no cover
+
+
+def gradient(start: Color, end: Color, steps: int) -> List[Color24]:
+    """Obtains the colors evenly spaced from one color to another, both
+    included, interpolating their red, green and blue components.
+
+    Raises:
+        ValueError: when the number of steps is not positive.
+    """
+    if steps <= 0:
+        raise ValueError(f'steps must be a positive integer and not {steps}!')
+    start_rgb = rgb_of(start)
+    end_rgb = rgb_of(end)
+    if steps == 1:
+        return [Color24.of(*start_rgb)]
+    # Components are rounded half up in integer arithmetic, which is exact.
+    denominator = 2 * (steps - 1)
+    if numpy is not None and steps >= _MIN_NUMPY_BATCH_SIZE:
+        i = numpy.arange(steps)
+        components = [
+            (a + (2 * (b - a) * i + steps - 1) // denominator).tolist()
+            for a, b in zip(start_rgb, end_rgb)
+        ]
+        return [Color24.of(*rgb) for rgb in zip(*components)]
+    return [
+        Color24.of(
+            *(
+                a + (2 * (b - a) * i + steps - 1) // denominator
+                for a, b in zip(start_rgb, end_rgb)
+            )
+        )
+        for i in range(0, steps)
+    ]
+
+
+def from_hsl_array(
+        hues: Sequence[float],
+        saturations: Sequence[float],
+        lightnesses: Sequence[float]
+) -> List[Color24]:
+    """Converts colors from the HSL color model in one pass.
+
+    Args:
+        hues: The hues, between 0 and 360, inclusive.
+        saturations: The saturations, between 0 and 100, inclusive.
+        lightnesses: The lightnesses, between 0 and 100, inclusive.
+
+    Returns:
+        The 24-bit colors, in order.
+
+    Raises:
+        ValueError: when the sequences have different lengths, or a value is
+            not within its valid range.
+    """
+    _require_valid_arrays(
+        ('hues', hues, 360),
+        ('saturations', saturations, 100),
+        ('lightnesses', lightnesses, 100)
+    )
+    if numpy is not None and len(hues) >= _MIN_NUMPY_BATCH_SIZE:
+        return _numpy_colors_of_hls(
+            numpy.asarray(hues, dtype=float) / 360.0,
+            numpy.asarray(lightnesses, dtype=float) / 100.0,
+            numpy.asarray(saturations, dtype=float) / 100.0
+        )
+    return [
+        _color_of_components(
+            colorsys.hls_to_rgb(h=h / 360.0, l=l / 100.0, s=s / 100.0)
+        )
+        for h, s, l in zip(hues, saturations, lightnesses)
+    ]
+
+
+def from_hsv_array(
+        hues: Sequence[float],
+        saturations: Sequence[float],
+        values: Sequence[float]
+) -> List[Color24]:
+    """Converts colors from the HSV color model in one pass.
+
+    Args:
+        hues: The hues, between 0 and 360, inclusive.
+        saturations: The saturations, between 0 and 100, inclusive.
+        values: The values, between 0 and 100, inclusive.
+
+    Returns:
+        The 24-bit colors, in order.
+
+    Raises:
+        ValueError: when the sequences have different lengths, or a value is
+            not within its valid range.
+    """
+    _require_valid_arrays(
+        ('hues', hues, 360),
+        ('saturations', saturations, 100),
+        ('values', values, 100)
+    )
+    if numpy is not None and len(hues) >= _MIN_NUMPY_BATCH_SIZE:
+        return _numpy_colors_of_hsv(
+            numpy.asarray(hues, dtype=float) / 360.0,
+            numpy.asarray(saturations, dtype=float) / 100.0,
+            numpy.asarray(values, dtype=float) / 100.0
+        )
+    return [
+        _color_of_components(
+            colorsys.hsv_to_rgb(h=h / 360.0, s=s / 100.0, v=v / 100.0)
+        )
+        for h, s, v in zip(hues, saturations, values)
+    ]
+
+
+def _color_of_components(components: Tuple[float, float, float]) -> Color24:
+    r, g, b = components
+    return Color24.of(round(r * 255), round(g * 255), round(b * 255))
+
+
+# The NumPy conversions repeat the arithmetic of colorsys operation by
+# operation, so that they round to the same colors as Color.hsl and Color.hsv.
+
+def _numpy_colors_of_hls(h, l, s) -> List[Color24]:
+    m2 = numpy.where(l <= 0.5, l * (1.0 + s), l + s - (l * s))
+    m1 = 2.0 * l - m2
+
+    def component(hue):
+        hue = hue % 1.0
+        return numpy.select(
+            [hue < 1.0 / 6.0, hue < 0.5, hue < 2.0 / 3.0],
+            [
+                m1 + (m2 - m1) * hue * 6.0,
+                m2,
+                m1 + (m2 - m1) * (2.0 / 3.0 - hue) * 6.0
+            ],
+            m1
+        )
+
+    gray = s == 0.0
+    return _numpy_colors_of_components(
+        numpy.where(gray, l, component(h + 1.0 / 3.0)),
+        numpy.where(gray, l, component(h)),
+        numpy.where(gray, l, component(h - 1.0 / 3.0))
+    )
+
+
+def _numpy_colors_of_hsv(h, s, v) -> List[Color24]:
+    i = (h * 6.0).astype(int)
+    f = (h * 6.0) - i
+    p = v * (1.0 - s)
+    q = v * (1.0 - s * f)
+    t = v * (1.0 - s * (1.0 - f))
+    sectors = [i % 6 == sector for sector in range(0, 6)]
+    gray = s == 0.0
+    return _numpy_colors_of_components(
+        numpy.where(gray, v, numpy.select(sectors, [v, q, p, p, t, v])),
+        numpy.where(gray, v, numpy.select(sectors, [t, v, v, q, p, p])),
+        numpy.where(gray, v, numpy.select(sectors, [p, p, t, v, v, q]))
+    )
+
+
+def _numpy_colors_of_components(r, g, b) -> List[Color24]:
+    components = [
+        numpy.rint(component * 255).astype(int).tolist()
+        for component in (r, g, b)
+    ]
+    return [Color24.of(*rgb) for rgb in zip(*components)]
+
+
+def _require_valid_arrays(*arrays: Tuple[str, Sequence[float], int]) -> None:
+    length = len(arrays[0][1])
+    for name, values, max_value in arrays:
+        if len(values) != length:
+            raise ValueError(
+                f'{name} must have {length} values like {arrays[0][0]}, and '
+                f'not {len(values)}!'
+            )
+        if length > 0 and not (0 <= min(values) and max(values) <= max_value):
+            raise ValueError(
+                f'{name} must be between 0 and {max_value}, inclusive, but '
+                f'{min(values)} and {max(values)} were found!'
+            )
+
+
+@lru_cache(maxsize=4096)
+def quantize_to_color8(color: Color) -> Color8:
+    """Obtains the 8-bit color closest to a color, among the colors of the
+    color cube and the grayscale ramp, which unlike the first 16 colors do not
+    depend on the configuration of the terminal. The results are memoized.
+    """
+    if isinstance(color, Color8):
+        return color
+    r, g, b = rgb_of(color)
+    cube_indices = [_nearest_cube_index(component) for component in (r, g, b)]
+    cube_rgb = tuple(_CUBE_LEVELS[i] for i in cube_indices)
+    gray_index = min(23, max(0, round(((r + g + b) / 3 - 8) / 10)))
+    gray = 8 + gray_index * 10
+    if (
+        _squared_distance((r, g, b), (gray, gray, gray)) <
+        _squared_distance((r, g, b), cube_rgb)
+    ):
+        return Color8.of(232 + gray_index)
+    return Color8.of(
+        16 + 36 * cube_indices[0] + 6 * cube_indices[1] + cube_indices[2]
+    )
+
+
+@lru_cache(maxsize=4096)
+def quantize_to_simple_color(color: Color) -> SimpleColor:
+    """Obtains the simple color closest to a color, as shown by xterm by
+    default. The results are memoized."""
+    if isinstance(color, SimpleColor):
+        return color
+    rgb = rgb_of(color)
+    return min(
+        _SIMPLE_COLOR_RGBS,
+        key=lambda entry: _squared_distance(rgb, entry[1])
+    )[0]
+
+
+def _nearest_cube_index(component: int) -> int:
+    if component < 48:
+        return 0
+    if component < 115:
+        return 1
+    return (component - 35) // 40
+
+
+def _squared_distance(a: RGB, b: RGB) -> int:
+    return (a[0] - b[0]) ** 2 + (a[1] - b[1]) ** 2 + (a[2] - b[2]) ** 2
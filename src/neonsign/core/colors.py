@@ -3,7 +3,10 @@ from __future__ import annotations
 import colorsys
 from abc import ABC
 from dataclasses import dataclass
-from typing import Dict, Set, Tuple, final
+from functools import cached_property, lru_cache
+from typing import Dict, List, Sequence, Set, Tuple, final
+
+from neonsign.core.style_command import StyleCommand
 
 _ALLOWED_SIMPLE_COLOR_NAMES: Set[str] = {
     'black',
@@ -49,6 +52,10 @@ class Color(ABC):
 
      - ``Color.rgb(255, 10, 20)`` obtains the 24-bit color, (255, 10, 20).
 
+    Colors obtained through these methods are interned: all 8-bit colors and
+    the 24-bit colors used most recently are cached, so that equal colors are
+    the same instance, and each color creates the style commands that apply
+    it only once.
     """
 
     BLACK: Color
@@ -113,10 +120,10 @@ class Color(ABC):
             The 24-bit color with the specified components.
 
         Raises:
-            ValueError: when the red, green or blue value is not between 0 and
-                255.
+            ValueError: when the red, green or blue value is not an integer
+                between 0 and 255.
         """
-        return Color24(red, green, blue)
+        return Color24.of(red, green, blue)
 
     @classmethod
     def hex(cls, hex_string: str) -> Color:
@@ -186,6 +193,81 @@ class Color(ABC):
             value=value
         )
 
+    @classmethod
+    def gradient(cls, start: Color, end: Color, steps: int) -> List[Color]:
+        """Obtains the 24-bit colors evenly spaced from one color to another,
+        both included.
+
+        Args:
+            start: The first color.
+            end: The last color.
+            steps: The number of colors. Must be positive.
+
+        Returns:
+            The colors, with their red, green and blue components interpolated
+            linearly.
+
+        Raises:
+            ValueError: when the number of steps is not positive.
+        """
+        from neonsign.core.color_conversion import gradient
+        return gradient(start, end, steps)
+
+    @classmethod
+    def from_hsl_array(
+            cls,
+            hues: Sequence[float],
+            saturations: Sequence[float],
+            lightnesses: Sequence[float]
+    ) -> List[Color]:
+        """Obtains the 24-bit colors with the specified hues, saturations and
+        lightnesses using the HSL color model, converting them in one pass.
+
+        Args:
+            hues: The hue values.
+                Must be between 0 and 360, inclusive.
+            saturations: The saturation values.
+                Must be between 0 and 100, inclusive.
+            lightnesses: The lightness values.
+                Must be between 0 and 100, inclusive.
+
+        Returns:
+            The 24-bit colors, in order.
+
+        Raises:
+            ValueError: when the sequences have different lengths, or a value
+                is not within its valid range.
+        """
+        from neonsign.core.color_conversion import from_hsl_array
+        return from_hsl_array(hues, saturations, lightnesses)
+
+    @classmethod
+    def from_hsv_array(
+            cls,
+            hues: Sequence[float],
+            saturations: Sequence[float],
+            values: Sequence[float]
+    ) -> List[Color]:
+        """Obtains the 24-bit colors with the specified hues, saturations and
+        values using the HSV color model, converting them in one pass.
+
+        Args:
+            hues: The hue values.
+                Must be between 0 and 360, inclusive.
+            saturations: The saturation values.
+                Must be between 0 and 100, inclusive.
+            values: The values.
+                Must be between 0 and 100, inclusive.
+
+        Returns:
+            The 24-bit colors, in order.
+
+        Raises:
+            ValueError: when the sequences have different lengths, or a value
+                is not within its valid range.
+        """
+        from neonsign.core.color_conversion import from_hsv_array
+        return from_hsv_array(hues, saturations, values)
 
     @classmethod
     def color8(cls, index: int) -> Color:
@@ -201,7 +283,32 @@ class Color(ABC):
         Raises:
             ValueError: when the index is not between 0 and 255.
         """
-        return Color8(index)
+        return Color8.of(index)
+
+    @cached_property
+    def foreground_command(self) -> StyleCommand:
+        """The style command that sets the foreground color of the terminal
+        to this color.
+
+        Raises:
+            TypeError: when the type of the color is not recognized.
+        """
+        from neonsign.core.color_commands import _create_foreground_command
+        return _create_foreground_command(self)
+
+    @cached_property
+    def background_command(self) -> StyleCommand:
+        """The style command that sets the background color of the terminal
+        to this color.
+
+        Raises:
+            TypeError: when the type of the color is not recognized.
+        """
+        foreground_command = self.foreground_command
+        return StyleCommand.of(
+            command=foreground_command.command + 10,
+            args=foreground_command.args
+        )
 
 
 @final
@@ -244,6 +351,15 @@ class Color8(Color):
                 f'not {self.index}!'
             )
 
+    @classmethod
+    def of(cls, index: int) -> Color8:
+        """Obtains the interned 8-bit color at the index specified.
+
+        Raises:
+            ValueError: when the index is not between 0 and 255.
+        """
+        return _interned_color8(index)
+
 
 @final
 @dataclass(frozen=True)
@@ -263,17 +379,45 @@ class Color24(Color):
     """The blue component of the color. Must be between 0 and 255."""
 
     def __post_init__(self):
-        _require_values_to_be_in_range(
-            values_by_name={
-                'red': self.red,
-                'green': self.green,
-                'blue': self.blue,
-            },
-            required_ranges_by_name={
-                name: (0, 255)
-                for name in ('red', 'green', 'blue')
-            }
-        )
+        if not (
+            0 <= self.red <= 255 and
+            0 <= self.green <= 255 and
+            0 <= self.blue <= 255
+        ):
+            _require_values_to_be_in_range(
+                values_by_name={
+                    'red': self.red,
+                    'green': self.green,
+                    'blue': self.blue,
+                },
+                required_ranges_by_name={
+                    name: (0, 255)
+                    for name in ('red', 'green', 'blue')
+                }
+            )
+
+    @classmethod
+    def of(cls, red: int, green: int, blue: int) -> Color24:
+        """Obtains the interned 24-bit color with the specified red, green
+        and blue components.
+
+        Components given as integral floats, such as ``10.0``, are converted
+        to integers first, so that they share the color of the integers.
+
+        Raises:
+            ValueError: when the red, green or blue value is not an integer
+                between 0 and 255.
+        """
+        if not (
+            type(red) is int and type(green) is int and type(blue) is int
+        ):
+            red, green, blue = (
+                _integral_component(name, value)
+                for name, value in (
+                    ('red', red), ('green', green), ('blue', blue)
+                )
+            )
+        return _interned_color24(red, green, blue)
 
     @classmethod
     def from_hex(cls, hex_string: str) -> Color24:
@@ -306,7 +450,7 @@ class Color24(Color):
                 f"6-character long, excluding the # sign at the beginning, but "
                 f"'{hex_value}' is {len(hex_value)}-character long!"
             )
-        return Color24(
+        return Color24.of(
             red=int(expanded_hex_value[0:2], base=16),
             green=int(expanded_hex_value[2:4], base=16),
             blue=int(expanded_hex_value[4:6], base=16)
@@ -349,7 +493,7 @@ class Color24(Color):
             l=1.0 * lightness / 100.0,
             s=1.0 * saturation / 100.0
         )
-        return Color24(
+        return Color24.of(
             red=round(red * 255),
             green=round(green * 255),
             blue=round(blue * 255)
@@ -392,13 +536,32 @@ class Color24(Color):
             s=1.0 * saturation / 100.0,
             v=1.0 * value / 100.0
         )
-        return Color24(
+        return Color24.of(
             red=round(red * 255),
             green=round(green * 255),
             blue=round(blue * 255)
         )
 
 
+@lru_cache(maxsize=None)
+def _interned_color8(index: int) -> Color8:
+    return Color8(index)
+
+
+@lru_cache(maxsize=4096)
+def _interned_color24(red: int, green: int, blue: int) -> Color24:
+    return Color24(red, green, blue)
+
+
+def _integral_component(name: str, value: float) -> int:
+    integer = int(value)
+    if integer != value:
+        raise ValueError(
+            f'The {name} component must be an integer and not {value}!'
+        )
+    return integer
+
+
 def _require_values_to_be_in_range(
         values_by_name: Dict[str, int],
         required_ranges_by_name: Dict[str, Tuple[int, int]],
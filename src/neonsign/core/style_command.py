@@ -1,4 +1,7 @@
+from __future__ import annotations
+
 from dataclasses import dataclass, field
+from functools import cached_property, lru_cache
 from typing import Tuple, final
 
 
@@ -7,6 +10,10 @@ from typing import Tuple, final
 class StyleCommand:
     """A command that tells the terminal to stylize the text it renders.
 
+    Style commands are immutable, so the same command can be shared by any
+    number of styled strings. Use :func:`StyleCommand.of` to obtain the
+    interned instance of a command.
+
     Examples:
 
         - ``StyleCommand(1)`` makes text bold.
@@ -38,3 +45,31 @@ class StyleCommand:
         returns ``(2, 255, 0, 0)``.
         """
         return (self.command,) + self.args
+
+    @cached_property
+    def parameters(self) -> str:
+        """The terminal code of this command as parameters of an SGR
+        sequence, for example ``'38;2;255;0;0'``. Computed once per command.
+        """
+        return ';'.join(map(str, self.terminal_code))
+
+    @classmethod
+    def of(cls, command: int, args: Tuple[int, ...] = ()) -> StyleCommand:
+        """Obtains the interned style command with the specified number and
+        arguments. The commands obtained most recently are cached, so that
+        equal commands are the same instance."""
+        return _interned_style_command(command, args)
+
+
+def sgr_parameters(commands: Tuple[StyleCommand, ...]) -> str:
+    """Joins the terminal codes of the style commands into the parameters of
+    an SGR sequence, for example ``'1;32'``."""
+    return ';'.join(command.parameters for command in commands)
+
+
+@lru_cache(maxsize=4096)
+def _interned_style_command(
+        command: int,
+        args: Tuple[int, ...]
+) -> StyleCommand:
+    return StyleCommand(command, args)
@@ -0,0 +1,239 @@
+"""Keeps a block up to date on the terminal screen as the state it shows
+changes.
+
+Example::
+
+    progress = Observable(0.0)
+
+    async def main():
+        view = lambda: ProgressBar(progress.value)
+        async with LiveDisplay(view, watch=[progress]):
+            for i in range(0, 1001):
+                progress.value = i / 1000
+                await asyncio.sleep(0.001)
+
+    asyncio.run(main())
+"""
+from __future__ import annotations
+
+import asyncio
+import shutil
+import sys
+import threading
+from concurrent.futures import Executor
+from typing import (
+    Callable, Generic, Iterable, List, Optional, TextIO, TypeVar, final
+)
+
+from neonsign.block.block import Block
+from neonsign.block.canvas import Canvas
+from neonsign.block.frame_differ import FrameDiffer, move_cursor
+from neonsign.string.color_profile import ColorProfile
+
+T = TypeVar('T')
+
+
+@final
+class Observable(Generic[T]):
+    """A value that notifies its listeners whenever it is set.
+
+    Listeners are called on the thread that sets the value, so they should
+    return quickly, as :func:`LiveDisplay.refresh` does.
+    """
+
+    def __init__(self, value: T):
+        self._value: T = value
+        self._listeners: List[Callable[[T], None]] = []
+        self._lock = threading.Lock()
+
+    @property
+    def value(self) -> T:
+        return self._value
+
+    @value.setter
+    def value(self, value: T) -> None:
+        self._value = value
+        for listener in self._listeners:
+            listener(value)
+
+    def subscribe(self, listener: Callable[[T], None]) -> Callable[[], None]:
+        """Registers a function to call with every new value.
+
+        Returns:
+            A function that unregisters the listener.
+        """
+        with self._lock:
+            self._listeners = self._listeners + [listener]
+
+        def unsubscribe() -> None:
+            with self._lock:
+                self._listeners = [
+                    other for other in self._listeners if other is not listener
+                ]
+
+        return unsubscribe
+
+
+@final
+class LiveDisplay:
+    """Repaints a block on the terminal screen whenever it may have changed,
+    at most a number of times per second.
+
+    The block is created by calling ``view``, after :func:`refresh` is called
+    or any of the watched observables is set. However many refreshes are
+    requested while a frame is being painted, or within the minimum interval
+    between frames, they are coalesced into a single next frame. Frames are
+    rendered in an executor, so that rendering does not block the event loop,
+    and are written through a :class:`~neonsign.block.frame_differ.FrameDiffer`
+    so that only the cells that changed are written.
+
+    ``view`` runs on a thread of the executor, and it should not depend on
+    state that other threads modify while it runs.
+
+    A live display is started and stopped by ``async with``, or by
+    :func:`start` and :func:`stop`. When it stops, it paints the last frame,
+    if a refresh is pending, and moves the cursor below the frame. A stopped
+    live display can be started again, and then paints over its last frame.
+    """
+
+    def __init__(
+            self,
+            view: Callable[[], Block],
+            watch: Iterable[Observable] = (),
+            max_fps: float = 30.0,
+            stream: Optional[TextIO] = None,
+            width_constraint: Optional[int] = None,
+            height_constraint: Optional[int] = None,
+            executor: Optional[Executor] = None,
+            profile: ColorProfile = ColorProfile.TRUECOLOR,
+            differ: Optional[FrameDiffer] = None
+    ):
+        """
+        Args:
+            view: Creates the block to show.
+            watch: The observables whose changes refresh the display.
+            max_fps: The maximum number of frames painted per second.
+            stream: The stream to write to. When this is None, the standard
+                output is used.
+            width_constraint: The maximum width of a frame. When this is None,
+                the width of the terminal is used.
+            height_constraint: The maximum height of a frame. When this is
+                None, the height of the terminal is used.
+            executor: The executor to render frames in. When this is None, the
+                default executor of the event loop is used.
+            profile: The colors the terminal supports.
+            differ: The frame differ to write frames with. When this is None,
+                frames are painted from the top left corner of the screen.
+        """
+        if max_fps <= 0:
+            raise ValueError(
+                f'max_fps must be a positive number and not {max_fps}!'
+            )
+        self.view: Callable[[], Block] = view
+        self.max_fps: float = max_fps
+        self.stream: TextIO = stream if stream is not None else sys.stdout
+        self.width_constraint: Optional[int] = width_constraint
+        self.height_constraint: Optional[int] = height_constraint
+        self.executor: Optional[Executor] = executor
+        self.differ: FrameDiffer = (
+            differ if differ is not None else FrameDiffer(profile=profile)
+        )
+        self.num_frames: int = 0
+        self._watched: List[Observable] = list(watch)
+        self._unsubscribers: List[Callable[[], None]] = []
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._wake_up: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+        self._is_pending: bool = True
+        self._is_stopping: bool = False
+
+    def refresh(self) -> None:
+        """Requests a new frame. Safe to call from any thread, and cheap to
+        call many times in a row."""
+        if self._is_pending:
+            return
+        self._is_pending = True
+        loop = self._loop
+        if loop is not None:
+            loop.call_soon_threadsafe(self._wake_up.set)
+
+    async def start(self) -> None:
+        """Starts painting frames on the running event loop."""
+        if self._task is not None:
+            raise RuntimeError('The live display has already been started!')
+        self._loop = asyncio.get_running_loop()
+        self._wake_up = asyncio.Event()
+        # The view may have changed while the display was stopped, so a
+        # restarted display paints a frame right away too.
+        self._is_pending = True
+        self._is_stopping = False
+        self._wake_up.set()
+        self._unsubscribers = [
+            observable.subscribe(lambda _: self.refresh())
+            for observable in self._watched
+        ]
+        self._task = asyncio.create_task(self._paint_frames())
+
+    async def stop(self) -> None:
+        """Paints the pending frame, if any, and stops painting frames."""
+        if self._task is None:
+            return
+        for unsubscribe in self._unsubscribers:
+            unsubscribe()
+        self._unsubscribers = []
+        self._is_stopping = True
+        self._wake_up.set()
+        try:
+            await self._task
+        finally:
+            self._task = None
+            self._loop = None
+        previous = self.differ.previous
+        if previous is not None:
+            self.stream.write(
+                move_cursor(self.differ.top + previous.height, 1)
+            )
+            self.stream.flush()
+
+    async def __aenter__(self) -> LiveDisplay:
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.stop()
+        return False
+
+    async def _paint_frames(self) -> None:
+        loop = asyncio.get_running_loop()
+        min_interval = 1.0 / self.max_fps
+        while True:
+            await self._wake_up.wait()
+            self._wake_up.clear()
+            if not self._is_pending:
+                # Woken up to stop, with every refresh already painted.
+                return
+            self._is_pending = False
+            frame_start = loop.time()
+            canvas = await loop.run_in_executor(self.executor, self._render)
+            self.differ.write(canvas, self.stream)
+            self.num_frames += 1
+            if self._is_stopping and not self._is_pending:
+                return
+            if not self._is_stopping:
+                delay = min_interval - (loop.time() - frame_start)
+                if delay > 0:
+                    await asyncio.sleep(delay)
+
+    def _render(self) -> Canvas:
+        width_constraint = self.width_constraint
+        height_constraint = self.height_constraint
+        if width_constraint is None or height_constraint is None:
+            terminal_size = shutil.get_terminal_size()
+            if width_constraint is None:
+                width_constraint = terminal_size.columns
+            if height_constraint is None:
+                height_constraint = terminal_size.lines
+        return self.view().rendered(
+            width_constraint=width_constraint,
+            height_constraint=height_constraint
+        )
@@ -0,0 +1,113 @@
+"""Adapts styles to the colors a terminal supports, when text is serialized.
+
+Canvases and styled strings always keep the colors they were created with.
+The colors are mapped to those of the target terminal only when a canvas is
+converted to terminal output with a :class:`ColorProfile`, so the same canvas
+can be written to several terminals that support different colors.
+"""
+from __future__ import annotations
+
+import os
+from enum import Enum
+from functools import lru_cache
+from typing import Mapping, Optional
+
+from neonsign.core.color_conversion import (
+    quantize_to_color8, quantize_to_simple_color
+)
+from neonsign.core.colors import Color, Color24, Color8
+from neonsign.core.style_command import StyleCommand
+from neonsign.string.style_table import PLAIN_STYLE_ID, STYLE_TABLE
+
+
+class ColorProfile(Enum):
+    """The colors a terminal supports.
+
+    - ``TRUECOLOR`` supports all 24-bit colors. Styles are emitted unchanged.
+    - ``COLOR256`` supports the 256 8-bit colors. Every 24-bit color is
+      replaced by the closest 8-bit color.
+    - ``COLOR16`` supports the 16 simple colors only. Every 8-bit or 24-bit
+      color is replaced by the closest simple color.
+    - ``NONE`` supports no styles at all, for example when writing to a log
+      file. Only the text is emitted.
+    """
+
+    TRUECOLOR = 'truecolor'
+    COLOR256 = '256'
+    COLOR16 = '16'
+    NONE = 'none'
+
+    @classmethod
+    def detect(
+            cls,
+            environment: Optional[Mapping[str, str]] = None
+    ) -> ColorProfile:
+        """Guesses the colors the terminal supports from environment
+        variables.
+
+        ``NO_COLOR`` (see https://no-color.org) or a ``dumb`` ``TERM``
+        disables styles, a ``COLORTERM`` of ``truecolor`` or ``24bit`` enables
+        24-bit colors, and a ``TERM`` mentioning ``256color`` enables 8-bit
+        colors. Otherwise, only the simple colors are assumed to be supported.
+
+        Args:
+            environment: The environment variables to inspect. When this is
+                None, those of the current process are inspected.
+        """
+        if environment is None:
+            environment = os.environ
+        term = environment.get('TERM', '')
+        if environment.get('NO_COLOR', '') != '' or term == 'dumb':
+            return ColorProfile.NONE
+        if environment.get('COLORTERM', '').lower() in ('truecolor', '24bit'):
+            return ColorProfile.TRUECOLOR
+        if '256color' in term:
+            return ColorProfile.COLOR256
+        return ColorProfile.COLOR16
+
+
+@lru_cache(maxsize=None)
+def style_id_for_profile(style_id: int, profile: ColorProfile) -> int:
+    """Obtains the ID of the interned style that looks closest to a style on a
+    terminal with the specified color profile. The results are memoized."""
+    if profile is ColorProfile.TRUECOLOR or style_id == PLAIN_STYLE_ID:
+        return style_id
+    if profile is ColorProfile.NONE:
+        return PLAIN_STYLE_ID
+    return STYLE_TABLE.intern(
+        tuple(
+            _command_for_profile(command, profile)
+            for command in STYLE_TABLE.commands(style_id)
+        )
+    )
+
+
+def _command_for_profile(
+        command: StyleCommand,
+        profile: ColorProfile
+) -> StyleCommand:
+    if command.command not in (38, 48):
+        return command
+    color = _color_of_arguments(command)
+    if color is None:
+        return command
+    if profile is ColorProfile.COLOR256:
+        if isinstance(color, Color8):
+            return command
+        color = quantize_to_color8(color)
+    else:
+        color = quantize_to_simple_color(color)
+    if command.command == 38:
+        return color.foreground_command
+    return color.background_command
+
+
+def _color_of_arguments(command: StyleCommand) -> Optional[Color]:
+    """Obtains the color set by an extended color command, or None if the
+    arguments are not recognized."""
+    args = command.args
+    if len(args) == 4 and args[0] == 2:
+        return Color24.of(args[1], args[2], args[3])
+    if len(args) == 2 and args[0] == 5:
+        return Color8.of(args[1])
+    return None
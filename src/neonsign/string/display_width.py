@@ -0,0 +1,116 @@
+"""Measures how many columns of the terminal text takes.
+
+Most characters take one column. Wide characters, such as the CJK ideographs
+and most emoji, take two, and combining marks take none, since they are drawn
+over the character before them.
+
+The width of every code point is looked up in a two-stage table: code points
+are grouped into blocks of 256, and identical blocks are stored only once.
+The widths of the characters seen so far are also kept in a dictionary, which
+lets whole strings be measured by :func:`char_widths` without a function call
+per character.
+"""
+from array import array
+from functools import lru_cache
+from typing import List, Tuple
+
+from neonsign.string.width_table import WIDE_RANGES, ZERO_WIDTH_RANGES
+
+_BLOCK_BITS: int = 8
+_BLOCK_MASK: int = (1 << _BLOCK_BITS) - 1
+_NUM_CODE_POINTS: int = 0x110000
+
+
+def _build_table() -> Tuple[array, bytes]:
+    widths = bytearray(b'\x01') * _NUM_CODE_POINTS
+    for start, end in ZERO_WIDTH_RANGES:
+        widths[start:end + 1] = bytes(end + 1 - start)
+    for start, end in WIDE_RANGES:
+        widths[start:end + 1] = b'\x02' * (end + 1 - start)
+
+    block_indices = array('H')
+    blocks = {}
+    for start in range(0, _NUM_CODE_POINTS, 1 << _BLOCK_BITS):
+        block = bytes(widths[start:start + (1 << _BLOCK_BITS)])
+        block_indices.append(blocks.setdefault(block, len(blocks)))
+    return block_indices, b''.join(blocks)
+
+
+_BLOCK_INDICES, _BLOCKS = _build_table()
+
+
+def code_point_width(code_point: int) -> int:
+    """Obtains the number of columns a code point takes: 0, 1 or 2."""
+    return _BLOCKS[
+        (_BLOCK_INDICES[code_point >> _BLOCK_BITS] << _BLOCK_BITS) |
+        (code_point & _BLOCK_MASK)
+    ]
+
+
+class _CharWidths(dict):
+
+    def __missing__(self, char: str) -> int:
+        width = code_point_width(ord(char))
+        self[char] = width
+        return width
+
+
+_CHAR_WIDTHS: _CharWidths = _CharWidths()
+
+
+def char_width(char: str) -> int:
+    """Obtains the number of columns a character takes: 0, 1 or 2."""
+    return _CHAR_WIDTHS[char]
+
+
+def char_widths(text: str) -> bytes:
+    """Obtains the number of columns each character of the text takes."""
+    if text.isascii():
+        return b'\x01' * len(text)
+    return bytes(map(_CHAR_WIDTHS.__getitem__, text))
+
+
+def display_width(text: str) -> int:
+    """Obtains the number of columns the text takes when printed on one line.
+    """
+    if text.isascii():
+        return len(text)
+    return _display_width(text)
+
+
+@lru_cache(maxsize=4096)
+def _display_width(text: str) -> int:
+    return sum(char_widths(text))
+
+
+def wrap_offsets(text: str, width: int) -> List[int]:
+    """Obtains the offsets of the characters that start each row when the
+    text is broken into rows of the specified number of columns.
+
+    A wide character that does not fit at the end of a row moves to the next
+    row, and a character wider than a whole row takes a row of its own. A
+    character that takes no column stays on the row of the character before
+    it.
+    """
+    if text.isascii():
+        return list(range(0, len(text), width))
+    offsets: List[int] = []
+    x = width
+    for i, columns in enumerate(char_widths(text)):
+        if columns == 0:
+            continue
+        if columns > width:
+            columns = width
+        if x + columns > width:
+            offsets.append(i)
+            x = 0
+        x += columns
+    return offsets
+
+
+def count_rows(text: str, width: int) -> int:
+    """Counts the rows of the specified number of columns the text fills, as
+    broken by :func:`wrap_offsets`."""
+    if text.isascii():
+        return -(-len(text) // width)
+    return len(wrap_offsets(text, width))
@@ -0,0 +1,305 @@
+"""Breaks text into lines that fit in a number of columns of the terminal."""
+import re
+from bisect import bisect_right
+from dataclasses import dataclass
+from enum import Enum
+from functools import lru_cache
+from itertools import accumulate
+from typing import List, Optional, Sequence, Tuple, final
+
+from neonsign.string.display_width import (
+    char_widths, display_width, wrap_offsets
+)
+
+
+class WrapMode(Enum):
+    """How text is broken into lines.
+
+    - ``CHARACTERS`` breaks a line after the last character that fits, even in
+      the middle of a word.
+    - ``GREEDY`` breaks lines between words, putting as many words on each line
+      as fit.
+    - ``BALANCED`` breaks lines between words so that the lines are as even as
+      possible. It minimizes the sum of the squares of the number of columns
+      left empty at the end of every line but the last.
+
+    In the last two modes, the spaces at a line break are dropped, and a word
+    that is wider than a line is broken by characters.
+    """
+
+    CHARACTERS = 'characters'
+    GREEDY = 'greedy'
+    BALANCED = 'balanced'
+
+
+@final
+@dataclass(frozen=True)
+class Line:
+    """A line of wrapped text, consisting of the characters from ``start`` up
+    to ``end``, followed by a hyphen when ``hyphenated`` is True."""
+    start: int
+    end: int
+    hyphenated: bool = False
+
+
+HYPHEN: str = '-'
+"""The character appended to a line that ends in the middle of a word."""
+
+_WORD = re.compile(r'[^ ]+')
+
+
+@final
+@dataclass(frozen=True)
+class _Item:
+    """A word, or a fragment of a word that is wider than a line."""
+    start: int
+    end: int
+    continues_word: bool = False
+    hyphenated: bool = False
+
+
+@lru_cache(maxsize=1024)
+def break_lines(
+        text: str,
+        width: int,
+        mode: WrapMode = WrapMode.GREEDY,
+        hyphenate: bool = False
+) -> Tuple[Line, ...]:
+    """Breaks text into lines that take at most the specified number of
+    columns.
+
+    The breaks are memoized, so that measuring and rendering the same text at
+    the same width, for example on every frame, breaks it only once.
+
+    Args:
+        text: The text to break.
+        width: The maximum number of columns of a line.
+        mode: How the breaks are chosen.
+        hyphenate: Whether a word may be broken with a hyphen. A word that does
+            not fit at the end of a line is then split, if at least two
+            letters of it fit there with the hyphen and at least two are left
+            for the next line (only in the greedy mode). A word wider than a
+            line is broken with hyphens as well, in both word modes.
+
+    Returns:
+        The lines, in order. There are none when the text is empty.
+
+    Raises:
+        ValueError: when the width is not positive.
+    """
+    if width <= 0:
+        raise ValueError(f'width must be a positive integer and not {width}!')
+    if len(text) == 0:
+        return ()
+    if display_width(text) <= width:
+        return Line(start=0, end=len(text)),
+
+    columns = [0, *accumulate(char_widths(text))]
+    words = _words(text, mode)
+    if mode is WrapMode.CHARACTERS:
+        hyphenate = False
+    if mode is WrapMode.BALANCED:
+        items = _items(text, words, columns, width, hyphenate)
+        return _break_balanced(items, columns, width)
+    return _break_greedily(text, words, columns, width, hyphenate)
+
+
+def _words(text: str, mode: WrapMode) -> List[Tuple[int, int]]:
+    """Finds the offsets where every word of the text starts and ends."""
+    words = [match.span() for match in _WORD.finditer(text)]
+    if mode is WrapMode.CHARACTERS or len(words) == 0:
+        return [(0, len(text))]
+    # Spaces at the start of the text are kept as part of the first word.
+    words[0] = (0, words[0][1])
+    return words
+
+
+def _fragments(
+        text: str,
+        columns: List[int],
+        start: int,
+        end: int,
+        width: int,
+        hyphenate: bool
+) -> List[Line]:
+    """Breaks the characters from ``start`` up to ``end`` into lines of the
+    specified width, all but the last of which end with a hyphen if
+    ``hyphenate`` is True and the hyphen fits."""
+    if columns[end] - columns[start] <= width:
+        return [Line(start, end)]
+    hyphenate = hyphenate and width >= 2
+    fragment_width = width - len(HYPHEN) if hyphenate else width
+    offsets = [
+        start + offset
+        for offset in wrap_offsets(text[start:end], fragment_width)
+    ]
+    offsets.append(end)
+    return [
+        Line(
+            offset,
+            next_offset,
+            hyphenated=hyphenate and next_offset < end and
+            columns[next_offset] - columns[offset] <= fragment_width
+        )
+        for offset, next_offset in zip(offsets, offsets[1:])
+    ]
+
+
+def _items(
+        text: str,
+        words: Sequence[Tuple[int, int]],
+        columns: List[int],
+        width: int,
+        hyphenate: bool
+) -> List[_Item]:
+    items: List[_Item] = []
+    for start, end in words:
+        fragments = _fragments(text, columns, start, end, width, hyphenate)
+        items.extend(
+            _Item(
+                start=fragment.start,
+                end=fragment.end,
+                continues_word=i > 0,
+                hyphenated=fragment.hyphenated
+            )
+            for i, fragment in enumerate(fragments)
+        )
+    return items
+
+
+def _break_greedily(
+        text: str,
+        words: Sequence[Tuple[int, int]],
+        columns: List[int],
+        width: int,
+        hyphenate: bool
+) -> Tuple[Line, ...]:
+    lines: List[Line] = []
+    line: Optional[Line] = None
+    for start, end in words:
+        if line is not None:
+            if columns[end] - columns[line.start] <= width:
+                line = Line(line.start, end)
+                continue
+            split = _hyphenation_point(
+                text,
+                columns,
+                start,
+                end,
+                width - (columns[start] - columns[line.start])
+            ) if hyphenate else None
+            if split is not None:
+                lines.append(Line(line.start, split, hyphenated=True))
+                start = split
+            else:
+                lines.append(line)
+        # The rest of a word that was split is broken again from the split,
+        # so that only the last line of a word wider than a line is short.
+        fragments = _fragments(text, columns, start, end, width, hyphenate)
+        lines.extend(fragments[:-1])
+        line = fragments[-1]
+    if line is not None:
+        lines.append(line)
+    return tuple(lines)
+
+
+def _hyphenation_point(
+        text: str,
+        columns: List[int],
+        start: int,
+        end: int,
+        available_width: int
+) -> Optional[int]:
+    """Finds the offset at which to split the word from ``start`` up to
+    ``end``, so that the part before it and a hyphen take at most the
+    available columns."""
+    split = bisect_right(
+        columns,
+        columns[start] + available_width - len(HYPHEN),
+        lo=start,
+        hi=end
+    ) - 1
+    split = min(split, end - 2)
+    if (
+        split >= start + 2 and
+        text[split - 1].isalpha() and
+        text[split].isalpha()
+    ):
+        return split
+    return None
+
+
+def _break_balanced(
+        items: Sequence[_Item],
+        columns: List[int],
+        width: int
+) -> Tuple[Line, ...]:
+    # best_costs[j] is the lowest cost of breaking the first j items into
+    # lines, the last of which starts with the item first_items[j].
+    num_items = len(items)
+    best_costs = [0] + [float('inf')] * num_items
+    first_items = [0] * (num_items + 1)
+    for j in range(1, num_items + 1):
+        last = items[j - 1]
+        for i in range(j - 1, -1, -1):
+            if i < j - 1 and (
+                items[i + 1].continues_word or items[i].hyphenated
+            ):
+                break
+            line_width = (
+                columns[last.end] - columns[items[i].start] +
+                (len(HYPHEN) if last.hyphenated else 0)
+            )
+            if i < j - 1 and line_width > width:
+                break
+            slack = width - line_width
+            cost = best_costs[i] + (0 if j == num_items else slack * slack)
+            if cost < best_costs[j]:
+                best_costs[j] = cost
+                first_items[j] = i
+
+    lines: List[Line] = []
+    j = num_items
+    while j > 0:
+        i = first_items[j]
+        last = items[j - 1]
+        lines.append(Line(items[i].start, last.end, last.hyphenated))
+        j = i
+    return tuple(reversed(lines))
+
+
+def slice_spans(
+        spans: Sequence[Tuple[str, int]],
+        start: int,
+        stop: int
+) -> List[Tuple[str, int]]:
+    """Obtains the pieces of styled text (see
+    :attr:`~neonsign.string.styled_string.StyledString.spans`) covering the
+    characters from an offset up to another one."""
+    sliced: List[Tuple[str, int]] = []
+    span_start = 0
+    for text, style_id in spans:
+        span_stop = span_start + len(text)
+        if span_stop > start and span_start < stop:
+            sliced.append(
+                (text[max(0, start - span_start):stop - span_start], style_id)
+            )
+        elif span_start >= stop:
+            break
+        span_start = span_stop
+    return sliced
+
+
+def spans_of_lines(
+        spans: Sequence[Tuple[str, int]],
+        lines: Sequence[Line]
+) -> List[List[Tuple[str, int]]]:
+    """Obtains the pieces of styled text on each line of wrapped text. A
+    hyphen has the style of the character before it."""
+    result: List[List[Tuple[str, int]]] = []
+    for line in lines:
+        line_spans = slice_spans(spans, line.start, line.end)
+        if line.hyphenated:
+            line_spans.append((HYPHEN, line_spans[-1][1]))
+        result.append(line_spans)
+    return result
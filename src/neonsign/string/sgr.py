@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+from functools import lru_cache
+
+from neonsign.core.style_command import sgr_parameters
+from neonsign.string.style_table import PLAIN_STYLE_ID, STYLE_TABLE
+
+RESET: str = '\033[m'
+"""The SGR sequence that resets all styles."""
+
+
+@lru_cache(maxsize=None)
+def style_transition(from_style_id: int, to_style_id: int) -> str:
+    """Obtains the shortest SGR sequence that switches the terminal from one
+    interned style to another.
+
+    Returns:
+        The empty string when both styles are the same; a reset when switching
+        to the plain style; only the additional commands when the new style
+        extends the stack of the old one; otherwise a reset followed by all
+        commands of the new style, in a single sequence.
+    """
+    if from_style_id == to_style_id:
+        return ''
+    if to_style_id == PLAIN_STYLE_ID:
+        return RESET
+    to_style = STYLE_TABLE.style(to_style_id)
+    if from_style_id == PLAIN_STYLE_ID:
+        return to_style.prefix
+    from_commands = STYLE_TABLE.commands(from_style_id)
+    to_commands = to_style.commands
+    if to_commands[:len(from_commands)] == from_commands:
+        added_commands = to_commands[len(from_commands):]
+        return f'\033[{sgr_parameters(added_commands)}m'
+    return f'\033[0;{sgr_parameters(to_commands)}m'
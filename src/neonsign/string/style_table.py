@@ -0,0 +1,163 @@
+from __future__ import annotations
+
+import threading
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple, final
+
+from neonsign.core.style_command import StyleCommand, sgr_parameters
+
+PLAIN_STYLE_ID: int = 0
+"""The ID of the style without any style commands."""
+
+_FOREGROUND_COMMANDS = frozenset([*range(30, 40), *range(90, 98)])
+"""The commands that set the foreground color, including the default one."""
+
+_BACKGROUND_COMMANDS = frozenset([*range(40, 50), *range(100, 108)])
+"""The commands that set the background color, including the default one."""
+
+
+def _color_slot_of(command: StyleCommand) -> Optional[str]:
+    """Identifies which color a command sets, if any."""
+    if command.command in _FOREGROUND_COMMANDS:
+        return 'foreground'
+    if command.command in _BACKGROUND_COMMANDS:
+        return 'background'
+    return None
+
+
+def collapse_style_commands(
+        commands: Tuple[StyleCommand, ...]
+) -> Tuple[StyleCommand, ...]:
+    """Removes the commands that have no effect from a stack of style commands.
+
+    Commands are applied in order, so a color is overridden by any later color
+    of the same kind, and only the last foreground and background colors are
+    kept. For example, the stack of
+    ``s('a').foreground(Color.RED).foreground(Color.GREEN)`` collapses to the
+    red foreground only, since the inner color is applied last. Any other
+    command that is repeated is only kept where it first appears.
+    """
+    last_color_index: Dict[str, int] = {}
+    for i, command in enumerate(commands):
+        slot = _color_slot_of(command)
+        if slot is not None:
+            last_color_index[slot] = i
+    collapsed: List[StyleCommand] = []
+    for i, command in enumerate(commands):
+        slot = _color_slot_of(command)
+        if slot is None:
+            if command not in collapsed:
+                collapsed.append(command)
+        elif last_color_index[slot] == i:
+            collapsed.append(command)
+    return tuple(collapsed)
+
+
+@final
+@dataclass(frozen=True)
+class CompiledStyle:
+    """An interned stack of style commands, compiled into the SGR sequence
+    that applies it."""
+
+    style_id: int
+    """The ID of this style in its style table."""
+
+    commands: Tuple[StyleCommand, ...]
+    """The collapsed stack of style commands, outermost first."""
+
+    prefix: str
+    """The SGR sequence that applies this style, or the empty string if this
+    is the plain style."""
+
+    @property
+    def is_plain(self) -> bool:
+        return self.style_id == PLAIN_STYLE_ID
+
+
+class StyleTable:
+    """Interns stacks of style commands as small integer IDs.
+
+    Stacks are collapsed first (see :func:`collapse_style_commands`), so all
+    stacks with the same effect map to the same ID, and the same
+    :class:`CompiledStyle`. An ID can therefore stand in for a whole stack
+    wherever many cells or spans share the same style, for example in a
+    :class:`Canvas`.
+    """
+
+    def __init__(self):
+        plain = CompiledStyle(style_id=PLAIN_STYLE_ID, commands=(), prefix='')
+        self._ids: Dict[Tuple[StyleCommand, ...], int] = {(): PLAIN_STYLE_ID}
+        self._styles: List[CompiledStyle] = [plain]
+        self._applied: Dict[Tuple[int, StyleCommand], int] = {}
+        self._composed: Dict[Tuple[int, int], int] = {}
+        self._lock = threading.Lock()
+
+    def intern(self, commands: Tuple[StyleCommand, ...]) -> int:
+        """Obtains the ID of the specified stack of style commands, assigning a
+        new ID if no stack with the same effect has been seen before."""
+        style_id = self._ids.get(commands)
+        if style_id is not None:
+            return style_id
+        collapsed = collapse_style_commands(commands)
+        with self._lock:
+            style_id = self._ids.get(collapsed)
+            if style_id is None:
+                style_id = len(self._styles)
+                self._styles.append(
+                    CompiledStyle(
+                        style_id=style_id,
+                        commands=collapsed,
+                        prefix=f'\033[{sgr_parameters(collapsed)}m'
+                    )
+                )
+                self._ids[collapsed] = style_id
+            self._ids[commands] = style_id
+            return style_id
+
+    def with_command(self, style_id: int, command: StyleCommand) -> int:
+        """Obtains the ID of the style that applies the command after the
+        commands of the specified style."""
+        key = (style_id, command)
+        applied_style_id = self._applied.get(key)
+        if applied_style_id is None:
+            applied_style_id = self.intern(
+                self._styles[style_id].commands + (command,)
+            )
+            self._applied[key] = applied_style_id
+        return applied_style_id
+
+    def compose(self, outer_style_id: int, inner_style_id: int) -> int:
+        """Obtains the ID of the style that applies the commands of the inner
+        style after those of the outer style."""
+        key = (outer_style_id, inner_style_id)
+        composed_style_id = self._composed.get(key)
+        if composed_style_id is None:
+            composed_style_id = self.intern(
+                self._styles[outer_style_id].commands +
+                self._styles[inner_style_id].commands
+            )
+            self._composed[key] = composed_style_id
+        return composed_style_id
+
+    def style(self, style_id: int) -> CompiledStyle:
+        """Obtains the compiled style identified by the ID."""
+        return self._styles[style_id]
+
+    def commands(self, style_id: int) -> Tuple[StyleCommand, ...]:
+        """Obtains the collapsed stack of style commands identified by the
+        ID."""
+        return self._styles[style_id].commands
+
+
+STYLE_TABLE = StyleTable()
+"""The style table shared by all styled strings and canvases."""
+
+
+def intern_style(commands: Tuple[StyleCommand, ...]) -> int:
+    """A shorthand for ``STYLE_TABLE.intern``."""
+    return STYLE_TABLE.intern(commands)
+
+
+def commands_for_style(style_id: int) -> Tuple[StyleCommand, ...]:
+    """A shorthand for ``STYLE_TABLE.commands``."""
+    return STYLE_TABLE.commands(style_id)
@@ -1,15 +1,22 @@
 from __future__ import annotations
 
-from abc import ABC, abstractmethod
+from abc import ABC
+from bisect import bisect_right
 from dataclasses import dataclass
-from itertools import chain
-from typing import Tuple, final
-
-from neonsign.core.color_commands import (
-    command_for_background, command_for_foreground
+from functools import lru_cache
+from itertools import accumulate
+from typing import (
+    Iterator, List, Optional, Sequence, Tuple, Union, final, overload
 )
+
 from neonsign.core.colors import Color
 from neonsign.core.style_command import StyleCommand
+from neonsign.string.display_width import char_widths, display_width
+from neonsign.string.line_breaking import (
+    WrapMode, break_lines, slice_spans, spans_of_lines
+)
+from neonsign.string.sgr import RESET
+from neonsign.string.style_table import PLAIN_STYLE_ID, STYLE_TABLE
 
 
 class StyledString(ABC):
@@ -215,6 +222,122 @@ class StyledString(ABC):
         """
         return PaddedString(self, padding_left=0, padding_right=num_spaces)
 
+    @overload
+    def __getitem__(self, key: int) -> StyledString: ...
+
+    @overload
+    def __getitem__(self, key: slice) -> StyledString: ...
+
+    def __getitem__(self, key: Union[int, slice]) -> StyledString:
+        """Obtains the characters at an index or a slice of this string, with
+        their styles.
+
+        Indices count the characters as laid out, that is, they cover the
+        padding too, so that ``s('ab').padded()[0]`` is a space. Padding
+        sliced out of a string becomes part of the content of the slice.
+
+        Raises:
+            IndexError: when an integer index is out of range.
+        """
+        size = sum(len(text) for text, _ in self.spans)
+        if isinstance(key, slice):
+            start, stop, step = key.indices(size)
+            if step != 1:
+                chars = list(self.iter_chars())
+                return StyledString.from_spans(
+                    [chars[i].spans[0] for i in range(start, stop, step)]
+                )
+            return StyledString.from_spans(
+                slice_spans(self.spans, start, stop)
+            )
+        index = key + size if key < 0 else key
+        if index < 0 or index >= size:
+            raise IndexError(
+                f'Index {key} is out of range for a styled string of '
+                f'{size} characters!'
+            )
+        return StyledString.from_spans(
+            slice_spans(self.spans, index, index + 1)
+        )
+
+    def split_at(self, width: int) -> Tuple[StyledString, StyledString]:
+        """Splits this string into the characters that fit in the specified
+        number of columns of the terminal and the rest, keeping their styles.
+
+        A wide character that straddles the split goes to the rest, so the
+        first part can be a column narrower than ``width``. Characters that
+        take no column stay with the character before them.
+
+        Raises:
+            ValueError: when the width is negative.
+        """
+        if width < 0:
+            raise ValueError(
+                f'width must be a non-negative integer and not {width}!'
+            )
+        text = ''.join(text for text, _ in self.spans)
+        if text.isascii():
+            index = width
+        else:
+            columns = [0, *accumulate(char_widths(text))]
+            index = bisect_right(columns, width) - 1
+        return self[:index], self[index:]
+
+    def iter_chars(self) -> Iterator[StyledString]:
+        """Iterates over the characters of this string as laid out, each as a
+        styled string of one character, which can be used as a pixel.
+
+        Equal characters with equal styles are the same object.
+        """
+        for text, style_id in self.spans:
+            for char in text:
+                yield _styled_char(char, style_id)
+
+    def wrap(
+            self,
+            width: int,
+            mode: WrapMode = WrapMode.GREEDY,
+            hyphenate: bool = False
+    ) -> List[StyledString]:
+        """Breaks this string into lines that take at most the specified number
+        of columns of the terminal, keeping their styles.
+
+        See :func:`~neonsign.string.line_breaking.break_lines` for the
+        arguments.
+
+        Raises:
+            ValueError: when the width is not positive.
+        """
+        spans = self.spans
+        text = ''.join(text for text, _ in spans)
+        return [
+            StyledString.from_spans(line_spans)
+            for line_spans in spans_of_lines(
+                spans, break_lines(text, width, mode, hyphenate)
+            )
+        ]
+
+    @classmethod
+    def from_spans(cls, spans: Sequence[Tuple[str, int]]) -> StyledString:
+        """Creates a styled string from pieces of text, each paired with the
+        ID of an interned style (see :attr:`spans`)."""
+        if len(spans) == 1:
+            string = _styled_text(*spans[0])
+        else:
+            string = ConcatenatedString(
+                tuple(_styled_text(text, style_id) for text, style_id in spans)
+            )
+        # The spans are known, so there is no need to flatten the new string.
+        object.__setattr__(
+            string,
+            '_flattened_cache',
+            _FlattenedString(
+                spans=tuple(spans),
+                is_content=(True,) * len(spans)
+            )
+        )
+        return string
+
     @property
     def rendered(self) -> str:
         """The rendered string containing the terminal commands that style this
@@ -225,7 +348,13 @@ class StyledString(ABC):
         calls this method for you, so you can simply pass a ``StyledString``
         object to Python's :func:`str` directly to print it.
         """
-        return self._render_impl(commands=())
+        flattened = self._flattened
+        if flattened.rendered is None:
+            flattened.rendered = ''.join(
+                _render_with_style(content=text, style_id=style_id)
+                for text, style_id in flattened.spans
+            )
+        return flattened.rendered
 
     def __str__(self) -> str:
         """Renders this string as a Python string containing the terminal
@@ -238,22 +367,47 @@ class StyledString(ABC):
         """
         return self.rendered
 
-    @abstractmethod
-    def _render_impl(self, commands: Tuple[StyleCommand, ...]) -> str:
-        pass
+    @property
+    def spans(self) -> Tuple[Tuple[str, int], ...]:
+        """This string flattened into pieces of text, each paired with the ID
+        of the interned style applied to it.
+
+        The pieces appear in order, and include the padding. Pieces are never
+        merged, so every piece is styled on its own when rendered. The spans
+        are computed once and cached.
+        """
+        return self._flattened.spans
+
+    def _iter_content(self) -> Iterator[Tuple[str, int]]:
+        """Iterates over the non-empty pieces of the text-only content of this
+        string, each paired with the ID of the interned style applied to it."""
+        flattened = self._flattened
+        for (text, style_id), is_content in zip(
+                flattened.spans, flattened.is_content
+        ):
+            if is_content and len(text) > 0:
+                yield text, style_id
 
     @property
-    @abstractmethod
     def content(self) -> str:
         """The text-only content of this styled string."""
-        pass
+        return self._flattened.content
 
     @property
-    @abstractmethod
     def layout_size(self) -> int:
-        """The number of characters this string will appear to have when printed
-        to the terminal."""
-        pass
+        """The number of columns of the terminal this string takes when
+        printed, which is not the number of its characters when it has wide
+        characters or combining marks."""
+        return self._flattened.layout_size
+
+    @property
+    def _flattened(self) -> _FlattenedString:
+        flattened = self.__dict__.get('_flattened_cache')
+        if flattened is None:
+            flattened = _flatten(self)
+            # Bypasses the frozen dataclasses, whose fields stay immutable.
+            object.__setattr__(self, '_flattened_cache', flattened)
+        return flattened
 
 
 @final
@@ -262,19 +416,13 @@ class PlainString(StyledString):
     """A plain string without any styles."""
     _content: str
 
-    def _render_impl(self, commands: Tuple[StyleCommand, ...]) -> str:
-        return _render_with_style_commands(
-            content=self._content,
-            commands=commands
-        )
-
     @property
     def content(self) -> str:
         return self._content
 
     @property
     def layout_size(self) -> int:
-        return len(self._content)
+        return display_width(self._content)
 
 
 @final
@@ -283,17 +431,6 @@ class ConcatenatedString(StyledString):
     """A styled string consisting of concatenated substrings."""
     substrings: Tuple[StyledString, ...]
 
-    def _render_impl(self, commands: Tuple[StyleCommand, ...]) -> str:
-        return ''.join(m._render_impl(commands) for m in self.substrings)
-
-    @property
-    def content(self) -> str:
-        return ''.join(m.content for m in self.substrings)
-
-    @property
-    def layout_size(self) -> int:
-        return sum(m.layout_size for m in self.substrings)
-
 
 class StringWithCommand(StyledString):
     """A styled string with a terminal style command applied."""
@@ -301,24 +438,13 @@ class StringWithCommand(StyledString):
         self.original =original
         self.command = command
 
-    def _render_impl(self, commands: Tuple[StyleCommand, ...]) -> str:
-        return self.original._render_impl(commands + (self.command,))
-
-    @property
-    def content(self) -> str:
-        return self.original.content
-
-    @property
-    def layout_size(self) -> int:
-        return self.original.layout_size
-
 
 @final
 @dataclass
 class BoldString(StringWithCommand):
     """A string with the terminal style command ``\\033[1m`` applied."""
     def __init__(self, original: StyledString):
-        super().__init__(original=original, command=StyleCommand(command=1))
+        super().__init__(original=original, command=StyleCommand.of(command=1))
 
 
 @final
@@ -326,70 +452,70 @@ class BoldString(StringWithCommand):
 class LightString(StringWithCommand):
     """A string with the terminal style command ``\\033[2m`` applied."""
     def __init__(self, original: StyledString):
-        super().__init__(original=original, command=StyleCommand(command=2))
+        super().__init__(original=original, command=StyleCommand.of(command=2))
 
 
 @final
 @dataclass
 class ItalicString(StringWithCommand):
     def __init__(self, original: StyledString):
-        super().__init__(original=original, command=StyleCommand(command=3))
+        super().__init__(original=original, command=StyleCommand.of(command=3))
 
 
 @final
 @dataclass
 class UnderlinedString(StringWithCommand):
     def __init__(self, original: StyledString):
-        super().__init__(original=original, command=StyleCommand(command=4))
+        super().__init__(original=original, command=StyleCommand.of(command=4))
 
 
 @final
 @dataclass
 class BlinkingString(StringWithCommand):
     def __init__(self, original: StyledString):
-        super().__init__(original=original, command=StyleCommand(command=5))
+        super().__init__(original=original, command=StyleCommand.of(command=5))
 
 
 @final
 @dataclass
 class HiddenString(StringWithCommand):
     def __init__(self, original: StyledString):
-        super().__init__(original=original, command=StyleCommand(command=8))
+        super().__init__(original=original, command=StyleCommand.of(command=8))
 
 
 @final
 @dataclass
 class CrossedOutString(StringWithCommand):
     def __init__(self, original: StyledString):
-        super().__init__(original=original, command=StyleCommand(command=9))
+        super().__init__(original=original, command=StyleCommand.of(command=9))
 
 
 @final
 @dataclass
 class DoublyUnderlinedString(StringWithCommand):
     def __init__(self, original: StyledString):
-        super().__init__(original=original, command=StyleCommand(command=21))
+        super().__init__(original=original, command=StyleCommand.of(command=21))
 
 
 @final
 @dataclass
 class FramedString(StringWithCommand):
     def __init__(self, original: StyledString):
-        super().__init__(original=original, command=StyleCommand(command=51))
+        super().__init__(original=original, command=StyleCommand.of(command=51))
 
 
 @final
 @dataclass
 class OverlinedString(StringWithCommand):
     def __init__(self, original: StyledString):
-        super().__init__(original=original, command=StyleCommand(command=53))
+        super().__init__(original=original, command=StyleCommand.of(command=53))
 
 
 @final
 @dataclass
 class ColorInvertedString(StringWithCommand):
     def __init__(self, original: StyledString):
-        super().__init__(original=original, command=StyleCommand(command=7))
+        super().__init__(original=original, command=StyleCommand.of(command=7))
 
 
 @final
@@ -399,7 +525,7 @@ class ForegroundColoredString(StringWithCommand):
         self.color: Color = color
         super().__init__(
             original=original,
-            command=command_for_foreground(color)
+            command=color.foreground_command
         )
 
 
@@ -410,7 +536,7 @@ class BackgroundColoredString(StringWithCommand):
         self.color: Color = color
         super().__init__(
             original=original,
-            command=command_for_background(color)
+            command=color.background_command
         )
 
 
@@ -421,41 +547,89 @@ class PaddedString(StyledString):
     padding_left: int
     padding_right: int
 
-    def _render_impl(self, commands: Tuple[StyleCommand, ...]) -> str:
-        spaces_left: str = _render_with_style_commands(
-            content=' ' * self.padding_left,
-            commands=commands
-        ) if self.padding_left > 0 else ''
-        spaces_right: str = _render_with_style_commands(
-            content=' ' * self.padding_right,
-            commands=commands
-        ) if self.padding_right > 0 else ''
-        content: str = self.original._render_impl(commands)
-        return f'{spaces_left}{content}{spaces_right}'
 
-    @property
-    def content(self) -> str:
-        return self.original.content
+def _styled_text(text: str, style_id: int) -> StyledString:
+    string: StyledString = PlainString(text)
+    for command in reversed(STYLE_TABLE.commands(style_id)):
+        string = StringWithCommand(string, command)
+    return string
 
-    @property
-    def layout_size(self) -> int:
-        return (
-            self.original.layout_size +
-            self.padding_left +
-            self.padding_right
-        )
+
+@lru_cache(maxsize=4096)
+def _styled_char(char: str, style_id: int) -> StyledString:
+    return StyledString.from_spans(((char, style_id),))
 
 
-def _render_with_style_commands(
-        content: str,
-        commands: Tuple[StyleCommand, ...]
-) -> str:
-    if len(commands) == 0:
+def _render_with_style(content: str, style_id: int) -> str:
+    if style_id == PLAIN_STYLE_ID:
         return content
-    render_code: str = ';'.join(
-        map(
-            str,
-            chain.from_iterable(c.terminal_code for c in commands)
+    return f'{STYLE_TABLE.style(style_id).prefix}{content}{RESET}'
+
+
+class _FlattenedString:
+    """The flattened form of a styled string, cached on the string."""
+
+    __slots__ = ('spans', 'is_content', 'content', 'layout_size', 'rendered')
+
+    def __init__(
+            self,
+            spans: Tuple[Tuple[str, int], ...],
+            is_content: Tuple[bool, ...]
+    ):
+        self.spans: Tuple[Tuple[str, int], ...] = spans
+        self.is_content: Tuple[bool, ...] = is_content
+        self.content: str = ''.join(
+            text for (text, _), c in zip(spans, is_content) if c
+        )
+        self.layout_size: int = sum(display_width(text) for text, _ in spans)
+        self.rendered: Optional[str] = None
+
+
+def _flatten(string: StyledString) -> _FlattenedString:
+    spans: List[Tuple[str, int]] = []
+    is_content: List[bool] = []
+
+    # The tree is walked with an explicit stack, so that strings nested deeper
+    # than the recursion limit can be flattened. Padding is pushed as str.
+    stack: List[Tuple[Union[StyledString, str], int]] = [
+        (string, PLAIN_STYLE_ID)
+    ]
+    while len(stack) > 0:
+        node, style_id = stack.pop()
+        if isinstance(node, str):
+            spans.append((node, style_id))
+            is_content.append(False)
+            continue
+
+        flattened: Optional[_FlattenedString] = node.__dict__.get(
+            '_flattened_cache'
         )
-    )
-    return f'\033[{render_code}m{content}\033[m'
+        if flattened is not None:
+            if style_id == PLAIN_STYLE_ID:
+                spans.extend(flattened.spans)
+            else:
+                spans.extend(
+                    (text, STYLE_TABLE.compose(style_id, span_style_id))
+                    for text, span_style_id in flattened.spans
+                )
+            is_content.extend(flattened.is_content)
+        elif isinstance(node, PlainString):
+            spans.append((node.content, style_id))
+            is_content.append(True)
+        elif isinstance(node, ConcatenatedString):
+            stack.extend((m, style_id) for m in reversed(node.substrings))
+        elif isinstance(node, StringWithCommand):
+            stack.append(
+                (node.original, STYLE_TABLE.with_command(style_id, node.command))
+            )
+        elif isinstance(node, PaddedString):
+            if node.padding_right > 0:
+                stack.append((' ' * node.padding_right, style_id))
+            stack.append((node.original, style_id))
+            if node.padding_left > 0:
+                stack.append((' ' * node.padding_left, style_id))
+        else:
+            raise TypeError(
+                f'Styled string type {type(node)} is not supported!'
+            )
+    return _FlattenedString(spans=tuple(spans), is_content=tuple(is_content))
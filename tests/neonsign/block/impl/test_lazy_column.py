@@ -0,0 +1,121 @@
+from typing import List
+from unittest import TestCase
+
+from neonsign import Column, Label, LazyColumn, ScrollView, TextArea
+from neonsign.block.block import Block
+from neonsign.block.cache import LayoutCache, LayoutContainer
+from neonsign.core.size import Size
+
+
+class TestLazyColumn(TestCase):
+
+    def setUp(self):
+        self.created: List[int] = []
+
+    def label_factory(self, index: int) -> Block:
+        self.created.append(index)
+        return Label(f'{index:05}')
+
+    def test_rendering_like_a_column(self):
+        texts = ['lorem ipsum', 'dolor', 'sit amet consectetur']
+        lazy_column = LazyColumn(len(texts), lambda i: TextArea(texts[i]))
+        column = Column(*[TextArea(text) for text in texts])
+        for width, height in [(5, None), (8, None), (8, 3), (30, 10)]:
+            self.assertEqual(
+                str(column.rendered(width, height)),
+                str(lazy_column.rendered(width, height))
+            )
+            self.assertEqual(
+                list(column.iter_lines(width, height)),
+                list(lazy_column.iter_lines(width, height))
+            )
+        self.assertEqual(
+            Size(width=20, height=3),
+            lazy_column.measure()
+        )
+        self.assertEqual(Size.zero(), LazyColumn(0, Label).measure(10))
+
+    def test_creating_visible_rows_only(self):
+        column = LazyColumn(1_000_000, self.label_factory, row_height=1)
+        self.assertEqual(
+            Size(width=5, height=1_000_000),
+            column.measure(width_constraint=5)
+        )
+        self.assertEqual([], self.created)
+
+        view = ScrollView(column, offset_y=500_000)
+        self.assertEqual(
+            '500000\n500001\n500002',
+            str(view.rendered(width_constraint=6, height_constraint=3))
+        )
+        self.assertEqual([500_000, 500_001, 500_002], self.created)
+
+        self.created = []
+        view.rendered(width_constraint=6, height_constraint=3)
+        self.assertEqual([], self.created)
+
+    def test_measuring_rows_within_the_height_constraint(self):
+        column = LazyColumn(100_000, self.label_factory, row_height=1)
+        self.assertEqual(
+            '00000\n00001\n00002\n00003\n00004',
+            str(column.rendered(height_constraint=5))
+        )
+        self.assertEqual([0, 1, 2, 3, 4], self.created)
+
+    def test_following_changes_to_kept_rows(self):
+        column = LazyColumn(2, lambda i: Label('ab'))
+        self.assertEqual('ab\nab', str(column.rendered(width_constraint=2)))
+        column.row(0).content = 'abcd'
+        self.assertEqual(
+            'ab\ncd\nab',
+            str(column.rendered(width_constraint=2))
+        )
+
+    def test_evicting_rows(self):
+        column = LazyColumn(10, self.label_factory, cache_size=3)
+        with LayoutContainer(column):
+            self.assertEqual(10, column.measure(width_constraint=5).height)
+        self.assertEqual(list(range(0, 10)), self.created)
+
+        self.created = []
+        self.assertEqual(
+            '00000\n00001\n00002',
+            str(column.rendered(width_constraint=5, height_constraint=3))
+        )
+        self.assertEqual([0, 1, 2], self.created)
+        self.assertEqual(
+            '00000\n00001',
+            str(
+                column.rendered(
+                    width_constraint=5,
+                    height_constraint=2,
+                    layout_cache=LayoutCache()
+                )
+            )
+        )
+        self.assertEqual([0, 1, 2], self.created)
+
+        column.count = 12
+        column.invalidate_layout()
+        self.created = []
+        self.assertEqual(12, column.measure(width_constraint=5).height)
+        self.assertEqual(list(range(0, 12)), self.created)
+
+    def test_validating_arguments(self):
+        for kwargs, message in [
+            (
+                {'count': -1},
+                'count must be a non-negative integer and not -1!'
+            ),
+            (
+                {'count': 1, 'row_height': 0},
+                'row_height must be a positive integer and not 0!'
+            ),
+            (
+                {'count': 1, 'cache_size': 0},
+                'cache_size must be a positive integer and not 0!'
+            ),
+        ]:
+            with self.assertRaises(ValueError) as e:
+                LazyColumn(row_factory=Label, **kwargs)
+            self.assertEqual(message, str(e.exception))
@@ -0,0 +1,186 @@
+from concurrent.futures import ThreadPoolExecutor
+from unittest import TestCase
+from unittest.mock import patch
+
+from neonsign import ProgressGroup
+from neonsign.block.impl import progress_group
+from neonsign.core.size import Size
+
+
+class TestProgressGroup(TestCase):
+
+    def test_rendering(self):
+        group = ProgressGroup(label_width=4)
+        self.assertEqual(Size.zero(), group.rendered().size)
+        first = group.add_task('first', total=10)
+        second = group.add_task('二番目', total=4)
+        self.assertEqual(2, len(group))
+        self.assertEqual(Size(width=30, height=2), group.rendered().size)
+
+        group.advance(first, 3)
+        group.update(second, 5)
+        self.assertEqual(
+            'firs ███         30%\n'
+            '二番 ██████████ 100%',
+            str(group.rendered(width_constraint=20))
+        )
+        self.assertEqual(
+            'firs ███         30%',
+            str(group.rendered(width_constraint=20, height_constraint=1))
+        )
+        group.advance(first, 0.2)
+        self.assertEqual(
+            'firs ███▏        32%\n'
+            '二番 ██████████ 100%',
+            str(group.rendered(width_constraint=20))
+        )
+        self.assertEqual(
+            'firs █▌     32%\n'
+            '二番 █████ 100%',
+            str(group.rendered(width_constraint=15))
+        )
+        self.assertEqual(3.2, group.completed(first))
+
+    def test_redrawing_changed_rows_only(self):
+        group = ProgressGroup(label_width=1)
+        tasks = [group.add_task(str(i), total=100) for i in range(0, 4)]
+        group.rendered(width_constraint=16)
+        with patch.object(
+                ProgressGroup,
+                '_draw_row',
+                autospec=True,
+                side_effect=ProgressGroup._draw_row
+        ) as draw_row:
+            group.advance(tasks[1], 50)
+            group.advance(tasks[2], 50)
+            group.rendered(width_constraint=16)
+            self.assertEqual(
+                [1, 2],
+                [call.args[1] for call in draw_row.call_args_list]
+            )
+        with patch.object(progress_group, 'array', wraps=progress_group.array) \
+                as create_array:
+            # Neither the bar nor the percentage of the task changes.
+            group.advance(tasks[1], 0.01)
+            group.rendered(width_constraint=16)
+            self.assertEqual(0, create_array.call_count)
+
+    def test_rates(self):
+        now = [0.0]
+        group = ProgressGroup(
+            label_width=1,
+            show_rate=True,
+            window=2.0,
+            clock=lambda: now[0]
+        )
+        task = group.add_task('a', total=100)
+        group.rendered(width_constraint=40)
+        self.assertIsNone(group.rate(task))
+        self.assertIsNone(group.eta(task))
+        for _ in range(0, 4):
+            now[0] += 1
+            group.advance(task, 10)
+            group.rendered(width_constraint=40)
+        self.assertEqual(10.0, group.rate(task))
+        self.assertEqual(6.0, group.eta(task))
+        self.assertEqual(
+            'a ████        40%    10.0/s     0:06',
+            str(group.rendered(width_constraint=36))
+        )
+        now[0] += 1
+        group.advance(task, 60)
+        group.rendered(width_constraint=40)
+        self.assertEqual(35.0, group.rate(task))
+        self.assertEqual(0.0, group.eta(task))
+
+    def test_rates_of_stalled_tasks(self):
+        now = [0.0]
+        group = ProgressGroup(
+            label_width=1,
+            show_rate=True,
+            window=2.0,
+            clock=lambda: now[0]
+        )
+        stalled = group.add_task('a', total=100)
+        group.add_task('b', total=100)
+        group.rendered(width_constraint=36)
+        for _ in range(0, 2):
+            now[0] += 1
+            group.advance(stalled, 10)
+            group.rendered(width_constraint=36)
+        self.assertEqual(
+            'a ██          20%    10.0/s     0:08',
+            str(group.rendered(width_constraint=36, height_constraint=1))
+        )
+        now[0] += 1
+        self.assertEqual(
+            'a ██          20%     5.0/s     0:16',
+            str(group.rendered(width_constraint=36, height_constraint=1))
+        )
+        now[0] += 2
+        group.rendered(width_constraint=36)
+        self.assertEqual(0.0, group.rate(stalled))
+        self.assertIsNone(group.eta(stalled))
+
+    def test_rendering_from_many_threads(self):
+        group = ProgressGroup(label_width=4, show_rate=True)
+        tasks = [group.add_task(f'task {i}', total=100) for i in range(0, 8)]
+
+        def render(width: int) -> str:
+            for task_id in tasks:
+                group.advance(task_id)
+            return str(group.rendered(width_constraint=width))
+
+        widths = [40 + i % 7 for i in range(0, 200)]
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            for width, text in zip(widths, executor.map(render, widths)):
+                lines = text.splitlines()
+                self.assertEqual(8, len(lines))
+                self.assertTrue(
+                    all(len(line) == width for line in lines)
+                )
+                self.assertTrue(
+                    all(line.startswith('task') for line in lines)
+                )
+
+    def test_updating_from_many_threads(self):
+        group = ProgressGroup()
+        tasks = [group.add_task(f'task {i}', total=1000) for i in range(0, 8)]
+        notifications = []
+        unsubscribe = group.subscribe(notifications.append)
+
+        def work(task_id: int) -> None:
+            for _ in range(0, 1000):
+                group.advance(task_id)
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            for _ in executor.map(work, tasks):
+                group.rendered(width_constraint=50)
+        unsubscribe()
+        group.advance(tasks[0])
+        self.assertEqual(8000, len(notifications))
+        self.assertEqual(
+            [1001.0] + [1000.0] * 7,
+            [group.completed(task) for task in tasks]
+        )
+        self.assertTrue(
+            all(
+                line.endswith('100%')
+                for line in str(group.rendered(width_constraint=50))
+                .splitlines()
+            )
+        )
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError) as e:
+            ProgressGroup(window=0)
+        self.assertEqual(
+            'window must be a positive number and not 0!',
+            str(e.exception)
+        )
+        with self.assertRaises(ValueError) as e:
+            ProgressGroup().add_task('a', total=0)
+        self.assertEqual(
+            'total must be a positive number and not 0!',
+            str(e.exception)
+        )
@@ -0,0 +1,127 @@
+from typing import List, Optional
+from unittest import TestCase
+
+from neonsign import Alignment, Column, Label, ScrollView
+from neonsign.block.block import LeafBlock
+from neonsign.block.canvas import Canvas
+from neonsign.core.point import Point
+from neonsign.core.rect import Rect
+from neonsign.core.size import Size
+
+
+class RecordingBlock(LeafBlock):
+
+    measured: List['RecordingBlock'] = []
+    rendered: List['RecordingBlock'] = []
+
+    def __init__(self, content: str):
+        self.content = content
+
+    def _measure(
+            self,
+            width_constraint: Optional[int] = None,
+            height_constraint: Optional[int] = None
+    ) -> Size:
+        RecordingBlock.measured.append(self)
+        return Size(width=len(self.content), height=1)
+
+    def _render(self, granted_size: Size) -> Canvas:
+        RecordingBlock.rendered.append(self)
+        return Canvas.of(granted_size, lambda x, _: self.content[x])
+
+
+class TestScrollView(TestCase):
+
+    def setUp(self):
+        RecordingBlock.measured = []
+        RecordingBlock.rendered = []
+
+    def test_showing_a_window(self):
+        for alignment in Alignment:
+            column = Column(
+                *[
+                    Label(f'line {i}').padded_vertically(i % 2)
+                    for i in range(0, 20)
+                ],
+                alignment=alignment
+            )
+            full = column.rendered(width_constraint=10)
+            for offset_x, offset_y in [(0, 0), (0, 7), (2, 13), (0, 40)]:
+                expected = full.crop_or_pad_to_rect(
+                    Rect(
+                        top_left=Point(x=offset_x, y=offset_y),
+                        size=Size(width=8, height=5)
+                    ),
+                    filler=lambda: ' '
+                )
+                self.assertEqual(
+                    str(expected),
+                    str(
+                        ScrollView(column, offset_x, offset_y, content_width=10)
+                        .rendered(width_constraint=8, height_constraint=5)
+                    )
+                )
+
+    def test_rendering_visible_children_only(self):
+        blocks = [RecordingBlock(f'{i:04}') for i in range(0, 1000)]
+        view = ScrollView(Column(*blocks), offset_y=500)
+        self.assertEqual(
+            '0500\n0501\n0502',
+            str(view.rendered(width_constraint=4, height_constraint=3))
+        )
+        self.assertEqual(blocks[500:503], RecordingBlock.rendered)
+        self.assertEqual(1000, view.measure(width_constraint=4).height)
+        self.assertEqual(1000, view.content_height(4))
+
+    def test_measuring_appended_children_only(self):
+        blocks = [RecordingBlock(f'{i:04}') for i in range(0, 1000)]
+        view = ScrollView(Column(*blocks))
+        view.rendered(width_constraint=4, height_constraint=3)
+        self.assertEqual(set(blocks), set(RecordingBlock.measured))
+
+        RecordingBlock.measured = []
+        blocks.append(RecordingBlock('1000'))
+        view.child = Column(*blocks)
+        view.offset_y = view.content_height(4) - 2
+        self.assertEqual(
+            '0999\n1000\n    ',
+            str(view.rendered(width_constraint=4, height_constraint=3))
+        )
+        self.assertEqual({blocks[-1]}, set(RecordingBlock.measured))
+
+    def test_following_changes_to_children(self):
+        child = Label('a')
+        view = ScrollView(Column(child, Label('b')))
+        self.assertEqual(
+            'a    \nb    \n     \n     ',
+            str(view.rendered(width_constraint=5, height_constraint=4))
+        )
+        child.content = 'aaaaaaaaaaaa'
+        self.assertEqual(
+            'aaaaa\naaaaa\naa   \nb    ',
+            str(view.rendered(width_constraint=5, height_constraint=4))
+        )
+
+    def test_scrolling_other_blocks(self):
+        view = ScrollView(Label('lorem ipsum dolor'), offset_x=1, offset_y=1)
+        self.assertEqual(
+            'psum \nolor ',
+            str(view.rendered(width_constraint=5, height_constraint=2))
+        )
+        self.assertEqual(
+            'psum \nolor \n     ',
+            str(view.rendered(width_constraint=5))
+        )
+        # Scrolling changes neither the size nor the layout key.
+        self.assertEqual(Size(width=5, height=3), view.measure(5))
+        key = view.layout_key
+        view.offset_y = 0
+        self.assertIs(key, view.layout_key)
+        self.assertEqual(Size(width=5, height=3), view.measure(5))
+
+        with self.assertRaises(ValueError) as e:
+            ScrollView(Label('a'), offset_y=-1)
+        self.assertEqual(
+            'offset_y must be a non-negative integer and not -1!',
+            str(e.exception)
+        )
@@ -0,0 +1,56 @@
+from unittest import TestCase
+
+from neonsign import Label, StyledLabel, s
+from neonsign.block.canvas import Canvas, px
+from neonsign.core.size import Size
+
+
+class TestStyledLabel(TestCase):
+
+    def test_measuring_like_a_label(self):
+        string = s('ab', s('cde').bold())
+        for width in [None, 0, 1, 2, 4, 5, 6]:
+            for height in [None, 0, 1, 2, 3]:
+                self.assertEqual(
+                    Label('abcde').measure(width, height),
+                    StyledLabel(string).measure(width, height)
+                )
+        self.assertIs(
+            StyledLabel(s('abc').bold()).layout_key,
+            StyledLabel(s('abc')).layout_key
+        )
+
+    def test_rendering(self):
+        label = StyledLabel(s('ab', s('cde').bold()))
+        self.assertEqual(
+            Canvas.from_pixels(
+                [
+                    [px('a'), px('b'), px(s('c').bold())],
+                    [px(s('d').bold()), px(s('e').bold()), px(' ')],
+                ]
+            ),
+            label.render(Size(width=3, height=2))
+        )
+        self.assertEqual(
+            'ab\033[1mc…\033[m',
+            str(label.render(Size(width=4, height=1)))
+        )
+        self.assertEqual(
+            'ab\033[1mcde\033[m',
+            str(label.rendered())
+        )
+
+    def test_wrapping_words(self):
+        label = StyledLabel(s('lorem ', s('ipsum').bold(), ' dolor'))
+        self.assertEqual(
+            'lorem \033[1mipsum\033[m\n'
+            'dolor      ',
+            str(label.rendered(11))
+        )
+        self.assertEqual(
+            'lorem \033[1mip-\033[m\n'
+            '\033[1msum\033[m dolor',
+            str(
+                StyledLabel(label.content, hyphenate=True).rendered(9)
+            )
+        )
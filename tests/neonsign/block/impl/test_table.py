@@ -0,0 +1,142 @@
+from unittest import TestCase
+
+from neonsign import (
+    Alignment, ColumnSpec, FrameStyle, Label, Row, Table, TextArea
+)
+from neonsign.block.cache import LayoutContainer
+from neonsign.core.size import Size
+
+
+class TestTable(TestCase):
+
+    def test_aligning_columns(self):
+        table = Table(
+            [Label('Name'), Label('Qty')],
+            [Label('apple'), Label('12')],
+            [Label('fig')],
+            columns=[ColumnSpec(), ColumnSpec(alignment=Alignment.END)]
+        )
+        self.assertEqual(
+            '┌─────┬───┐\n'
+            '│Name │Qty│\n'
+            '├─────┼───┤\n'
+            '│apple│ 12│\n'
+            '├─────┼───┤\n'
+            '│fig  │   │\n'
+            '└─────┴───┘',
+            str(table.rendered())
+        )
+        self.assertEqual(Size(width=11, height=7), table.measure(40))
+        self.assertEqual(Size(width=11, height=3), table.measure(40, 3))
+        self.assertEqual(Size.zero(), table.measure(2))
+        self.assertEqual(Size.zero(), Table().measure())
+
+    def test_drawing_separators(self):
+        rows = [[Label('a'), Label('b')], [Label('ccc')]]
+        self.assertEqual(
+            '╔═══╦═╗\n'
+            '║a  ║b║\n'
+            '║ccc║ ║\n'
+            '╚═══╩═╝',
+            str(
+                Table(
+                    *rows,
+                    style=FrameStyle.DOUBLE,
+                    row_separators=False
+                ).rendered()
+            )
+        )
+        self.assertEqual(
+            'a   b\nccc  ',
+            str(Table(*rows, style=None).rendered())
+        )
+
+    def test_shrinking_columns(self):
+        table = Table(
+            [TextArea('lorem ipsum dolor sit'), Label('amet')],
+            columns=[ColumnSpec(), ColumnSpec(min_width=4)]
+        )
+        self.assertEqual(
+            '┌───────────┬────┐\n'
+            '│lorem ipsum│amet│\n'
+            '│dolor sit  │    │\n'
+            '└───────────┴────┘',
+            str(table.rendered(width_constraint=18))
+        )
+
+        table = Table(
+            [TextArea('lorem ipsum'), TextArea('dolor sit amet')],
+            style=None
+        )
+        # 25 columns shrink by 5, in proportion to their widths.
+        self.assertEqual(
+            'lorem     dolor sit  \n'
+            'ipsum     amet       ',
+            str(table.rendered(width_constraint=21))
+        )
+
+    def test_growing_flexible_columns(self):
+        table = Table(
+            [Label('a'), Label('b'), Label('c')],
+            columns=[
+                ColumnSpec(flex=1),
+                ColumnSpec(flex=2, max_width=3),
+                ColumnSpec(flex=1)
+            ]
+        )
+        self.assertTrue(table.is_flexible_in_x_axis())
+        self.assertEqual(
+            '┌─────┬───┬────┐\n'
+            '│a    │b  │c   │\n'
+            '└─────┴───┴────┘',
+            str(table.rendered(width_constraint=16))
+        )
+
+        capped = Table(
+            [Label('a'), Label('b')],
+            columns=[ColumnSpec(flex=1, max_width=3)]
+        )
+        self.assertFalse(capped.is_flexible_in_x_axis())
+        for width_constraint in (None, 30):
+            self.assertEqual(
+                '┌───┬─┐END\n'
+                '│a  │b│   \n'
+                '└───┴─┘   ',
+                str(
+                    Row(capped, Label('END')).rendered(
+                        width_constraint=width_constraint
+                    )
+                )
+            )
+
+        with self.assertRaises(ValueError) as e:
+            ColumnSpec(min_width=3, max_width=2)
+        self.assertEqual(
+            'max_width must be at least min_width (3) and not 2!',
+            str(e.exception)
+        )
+
+    def test_laying_out_once(self):
+        table = Table(
+            *[
+                [Label(f'{i}'), TextArea(f'row {i} of the table')]
+                for i in range(0, 20)
+            ],
+            columns=[ColumnSpec(min_width=2)]
+        )
+        with LayoutContainer(table):
+            table.rendered(width_constraint=14)
+            layout = table._layouts[14]
+            table.rendered(width_constraint=14)
+            self.assertIs(layout, table._layouts[14])
+        self.assertEqual(
+            [2, 9],
+            table._layouts[14].widths
+        )
+
+    def test_following_changes_to_cells(self):
+        cell = Label('a')
+        table = Table([cell, Label('b')], style=None)
+        self.assertEqual('a b', str(table.rendered()))
+        cell.content = 'abc'
+        self.assertEqual('abc b', str(table.rendered()))
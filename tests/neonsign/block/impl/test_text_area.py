@@ -1,6 +1,6 @@
 from unittest import TestCase
 
-from neonsign import TextArea
+from neonsign import TextArea, WrapMode
 from neonsign.block.canvas import Canvas, px
 from neonsign.core.size import Size
 from tests.neonsign.block.utilities import run_size_and_render_tests
@@ -168,3 +168,21 @@ class TestTextArea(TestCase):
             str(e.exception),
             'max_number_of_lines must be a positive integer and not -1!'
         )
+
+    def test_wrapping_words(self):
+        text_area = TextArea('lorem ipsum dolor', max_number_of_lines=2)
+        self.assertEqual(Size(width=8, height=2), text_area.measure(8))
+        self.assertEqual(
+            'lorem   \n'
+            'ipsum…  ',
+            str(text_area.rendered(8))
+        )
+        self.assertEqual(
+            'lorem\n'
+            'ipsum\n'
+            'dolor',
+            str(
+                TextArea('lorem ipsum dolor', wrap_mode=WrapMode.BALANCED)
+                .rendered(5)
+            )
+        )
@@ -1,12 +1,14 @@
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from unittest import TestCase
 
 from neonsign import (
-    Color, Column, FixedHeightBlock, FixedSizeBlock, FixedWidthBlock,
+    Alignment, Color, Column, FixedHeightBlock, FixedSizeBlock, FixedWidthBlock,
     FlexibleSpace, FrameStyle, HorizontalSeparator, Label, PaddedBlock,
     Rectangle, Row,
-    VerticalSeparator, s
+    VerticalSeparator, WrapMode, s
 )
-from neonsign.block.block import WrapperBlock
+from neonsign.block.block import LeafBlock, WrapperBlock
+from neonsign.block.cache import LayoutCache
 from neonsign.block.canvas import Canvas, px
 from neonsign.block.impl.framed import _Frame
 from neonsign.block.impl.text_effects import MappedBlock
@@ -132,6 +134,50 @@ class TestBlocks(TestCase):
             expected_canvas=expected_canvas
         )
 
+    def test_label_with_wide_characters(self):
+        label = Label('中文ab')
+        self.assertEqual(Size(width=6, height=1), label.measure())
+        self.assertEqual(Size(width=3, height=3), label.measure(3))
+        self.assertEqual(Size(width=3, height=2), label.measure(3, 2))
+        self.assertEqual('中文ab', str(label.rendered()))
+        self.assertEqual('中 \n文a\nb  ', str(label.rendered(3)))
+        self.assertEqual('中 \n文…', str(label.rendered(3, 2)))
+        self.assertEqual(
+            '┌──────┐\n'
+            '│中文ab│\n'
+            '└──────┘',
+            str(label.framed().rendered())
+        )
+
+    def test_label_wrapping_words(self):
+        label = Label('lorem ipsum dolor')
+        self.assertEqual(Size(width=11, height=2), label.measure(11))
+        self.assertEqual(
+            'lorem ipsum\n'
+            'dolor      ',
+            str(label.rendered(11))
+        )
+        self.assertEqual('lorem ipsu…', str(label.rendered(11, 1)))
+        self.assertEqual('lorem…  ', str(label.rendered(8, 1)))
+        self.assertEqual(
+            'lorem ip\n'
+            'sum dolo\n'
+            'r       ',
+            str(
+                Label('lorem ipsum dolor', wrap_mode=WrapMode.CHARACTERS)
+                .rendered(8)
+            )
+        )
+        self.assertEqual(
+            'lorem ip-\n'
+            'sum dolor',
+            str(Label('lorem ipsum dolor', hyphenate=True).rendered(9))
+        )
+        self.assertNotEqual(
+            Label('a b').layout_key,
+            Label('a b', wrap_mode=WrapMode.BALANCED).layout_key
+        )
+
     def test_flexible_space(self):
 
         def expected_size_given_width_constraint_only(w: int) -> Size:
@@ -1055,3 +1101,103 @@ class TestBlocks(TestCase):
             '└───┘',
             str(Label('123').framed())
         )
+
+    def test_iterating_lines(self):
+        blocks = [
+            Label(''),
+            Label('123').framed(),
+            Column(
+                Label('title').bold(),
+                Column(Label('a'), Label('bb'), alignment=Alignment.END),
+                Row(Label('x'), FlexibleSpace(), Label('y')),
+                HorizontalSeparator(),
+                Column(Label('c').padded(1)).foreground(Color.RED),
+                alignment=Alignment.CENTER,
+            ),
+        ]
+        for block in blocks:
+            for w, h in [(None, None), (6, None), (None, 4), (3, 2), (0, 5)]:
+                with self.subTest(block=block, w=w, h=h):
+                    self.assertEqual(
+                        str(block.rendered(w, h)),
+                        '\n'.join(block.iter_lines(w, h))
+                    )
+
+    def test_iterating_lines_one_block_at_a_time(self):
+        rendered = []
+
+        class RecordingBlock(LeafBlock):
+            def __init__(self, content: str):
+                self.content = content
+
+            def _measure(self, width_constraint=None, height_constraint=None):
+                return Size(width=1, height=1)
+
+            def _render(self, granted_size: Size) -> Canvas:
+                rendered.append(self)
+                return Canvas.filled(granted_size, self.content)
+
+        column = Column(*[RecordingBlock(str(i)) for i in range(0, 3)])
+        lines = column.iter_lines()
+        self.assertEqual([], rendered)
+        self.assertEqual('0', next(lines))
+        self.assertEqual(1, len(rendered))
+        self.assertEqual(['1', '2'], list(lines))
+        self.assertEqual(3, len(rendered))
+
+    def test_rendering_in_parallel(self):
+        report = Column(
+            Label('Report').bold(),
+            *[
+                Row(
+                    Label(f'Section {i}').foreground(Color.rgb(i, 100, 200)),
+                    Label(f'{i * 37 % 1000}').framed().padded(1)
+                ).framed(FrameStyle.BOLD)
+                for i in range(0, 12)
+            ]
+        )
+        expected = str(report.rendered(width_constraint=40))
+
+        class CountingExecutor(ThreadPoolExecutor):
+            num_submitted = 0
+
+            def submit(self, *args, **kwargs):
+                CountingExecutor.num_submitted += 1
+                return super().submit(*args, **kwargs)
+
+        with CountingExecutor(max_workers=4) as executor:
+            self.assertEqual(
+                expected,
+                str(
+                    report.rendered(
+                        width_constraint=40,
+                        executor=executor,
+                        min_parallel_area=100
+                    )
+                )
+            )
+            self.assertEqual(12, CountingExecutor.num_submitted)
+
+            # The sections are smaller than the default minimum area.
+            report.rendered(width_constraint=40, executor=executor)
+            self.assertEqual(12, CountingExecutor.num_submitted)
+
+            with self.assertRaises(ValueError) as e:
+                report.rendered(executor=executor, layout_cache=LayoutCache())
+            self.assertEqual(
+                'The layout cache shared with worker threads must be a '
+                'ConcurrentLayoutCache!',
+                str(e.exception)
+            )
+
+        with ProcessPoolExecutor(max_workers=2) as executor:
+            self.assertEqual(
+                expected,
+                str(
+                    report.rendered(
+                        width_constraint=40,
+                        executor=executor,
+                        min_parallel_area=100
+                    )
+                )
+            )
@@ -0,0 +1,284 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+from unittest import TestCase
+from unittest.mock import patch
+
+from neonsign import Column, Label, Row
+from neonsign.block.block import LeafBlock
+from neonsign.block.cache import (
+    ConcurrentLayoutCache, LayoutCache, LayoutContainer, LayoutKey,
+    current_layout_container
+)
+from neonsign.block.canvas import Canvas
+from neonsign.core.size import Size
+
+
+class CountingBlock(LeafBlock):
+
+    num_measurements: int = 0
+
+    def __init__(self, content: str):
+        self.content = content
+
+    def _layout_key_parts(self):
+        return type(self), self.content
+
+    def _measure(
+            self,
+            width_constraint: Optional[int] = None,
+            height_constraint: Optional[int] = None
+    ) -> Size:
+        CountingBlock.num_measurements += 1
+        return Size(width=len(self.content), height=1)
+
+    def _render(self, granted_size: Size) -> Canvas:
+        return Canvas.of(granted_size, lambda x, _: self.content[x])
+
+
+class TestLayoutKey(TestCase):
+
+    def test_value_based_keys(self):
+        self.assertIs(Label('a').layout_key, Label('a').layout_key)
+        self.assertIsNot(Label('a').layout_key, Label('b').layout_key)
+        self.assertIs(
+            Row(Label('a'), Label('b').padded(1)).layout_key,
+            Row(Label('a'), Label('b').padded(1)).layout_key
+        )
+        self.assertNotEqual(
+            Row(Label('a'), Label('b')).layout_key,
+            Column(Label('a'), Label('b')).layout_key
+        )
+        self.assertEqual(
+            hash(LayoutKey.of(('a', 1))),
+            hash(LayoutKey(('a', 1)))
+        )
+        self.assertEqual(LayoutKey.of(('a', 1)), LayoutKey(('a', 1)))
+
+    def test_blocks_without_keys(self):
+        class Unkeyed(CountingBlock):
+            def _layout_key_parts(self):
+                return None
+
+        self.assertIsNone(Unkeyed('a').layout_key)
+        self.assertIsNone(Row(Label('a'), Unkeyed('a')).layout_key)
+
+    def test_measuring_repeated_blocks_once(self):
+        def count_measurements(blocks) -> int:
+            CountingBlock.num_measurements = 0
+            block = Column(*[Row(b, Label('c')) for b in blocks])
+            self.assertEqual('\n'.join(['abc'] * 50), str(block.rendered()))
+            return CountingBlock.num_measurements
+
+        shared = CountingBlock('ab')
+        self.assertEqual(
+            count_measurements([shared] * 50),
+            count_measurements([CountingBlock('ab') for _ in range(0, 50)])
+        )
+
+    def test_following_changes(self):
+        label = Label('a')
+        row = Row(label)
+        key = row.layout_key
+        self.assertIs(key, row.layout_key)
+
+        label.content = 'b'
+        self.assertIsNot(key, row.layout_key)
+        self.assertIs(Row(Label('b')).layout_key, row.layout_key)
+
+    def test_recomputing_changed_keys_only(self):
+        label = Label('a')
+        changed = Column(Row(label), Label('b'))
+        unchanged = Column(Row(Label('c')), Label('d'))
+        keys = changed.layout_key, unchanged.layout_key
+
+        label.content = 'e'
+        with patch.object(
+                Row,
+                '_layout_key_parts',
+                autospec=True,
+                side_effect=Row._layout_key_parts
+        ) as layout_key_parts:
+            self.assertIs(keys[1], unchanged.layout_key)
+            self.assertEqual(0, layout_key_parts.call_count)
+            self.assertIsNot(keys[0], changed.layout_key)
+            self.assertEqual(1, layout_key_parts.call_count)
+
+    def test_mutating_blocks_between_renders(self):
+        a, b = Label('a'), Label('a')
+        column = Column(a, b)
+        self.assertEqual('a\na', str(column.rendered()))
+        b.content = 'hello'
+        self.assertEqual('a    \nhello', str(column.rendered()))
+
+        cache = LayoutCache()
+        self.assertEqual(
+            'a    \nhello',
+            str(column.rendered(layout_cache=cache))
+        )
+        a.content = 'hi'
+        self.assertEqual(
+            'hi   \nhello',
+            str(column.rendered(layout_cache=cache))
+        )
+
+
+
+class TestLayoutCache(TestCase):
+
+    def test_reusing_measurements_across_renders(self):
+        cache = LayoutCache()
+        unchanged = Row(Label('a'), Label('b'))
+
+        Column(unchanged, Label('c')).rendered(layout_cache=cache)
+        hits, misses = cache.hits, cache.misses
+
+        Column(unchanged, Label('d')).rendered(layout_cache=cache)
+        self.assertGreater(cache.hits - hits, hits)
+        self.assertLess(cache.misses - misses, misses)
+
+    def test_invalidation(self):
+        cache = LayoutCache()
+        label = Label('a')
+        block = Column(Row(label))
+        self.assertEqual('a', str(block.rendered(layout_cache=cache)))
+
+        label.content = 'abc'
+        label.invalidate_layout()
+        self.assertEqual('abc', str(block.rendered(layout_cache=cache)))
+
+    def test_eviction(self):
+        cache = LayoutCache(max_size=2)
+        cache.get('a', lambda: 1)
+        cache.get('b', lambda: 2)
+        cache.get('a', lambda: 0)
+        cache.get('c', lambda: 3)
+        self.assertEqual(2, len(cache))
+        self.assertEqual(1, cache.get('a', lambda: 0))
+        self.assertEqual(0, cache.get('b', lambda: 0))
+
+        with self.assertRaises(ValueError) as e:
+            LayoutCache(max_size=0)
+        self.assertEqual(
+            'max_size must be a positive integer and not 0!',
+            str(e.exception)
+        )
+
+
+class TestConcurrentLayoutCache(TestCase):
+
+    def test_computing_each_entry_once(self):
+        cache = ConcurrentLayoutCache()
+        started = threading.Event()
+        release = threading.Event()
+        num_computations = []
+
+        def compute() -> int:
+            num_computations.append(1)
+            started.set()
+            release.wait()
+            return 42
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            first = executor.submit(cache.get, 'key', compute)
+            started.wait()
+            others = [
+                executor.submit(cache.get, 'key', compute)
+                for _ in range(0, 3)
+            ]
+            while cache.waits < 3:
+                threading.Event().wait(0.001)
+            release.set()
+            results = [first.result()] + [f.result() for f in others]
+
+        self.assertEqual([42] * 4, results)
+        self.assertEqual(1, len(num_computations))
+        self.assertEqual((0, 1, 3), (cache.hits, cache.misses, cache.waits))
+        self.assertEqual(42, cache.get('key', lambda: 0))
+        self.assertEqual(1, cache.hits)
+
+    def test_failing_computations(self):
+        cache = ConcurrentLayoutCache()
+        started = threading.Event()
+        release = threading.Event()
+
+        def compute() -> int:
+            started.set()
+            release.wait()
+            raise RuntimeError('Measuring failed!')
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            first = executor.submit(cache.get, 'key', compute)
+            started.wait()
+            second = executor.submit(cache.get, 'key', lambda: 0)
+            while cache.waits < 1:
+                threading.Event().wait(0.001)
+            release.set()
+            for future in (first, second):
+                with self.assertRaises(RuntimeError):
+                    future.result()
+        self.assertEqual(0, len(cache))
+        self.assertEqual(1, cache.get('key', lambda: 1))
+
+    def test_rendering_in_parallel(self):
+        sections = [
+            Column(
+                *[
+                    Row(CountingBlock(f'{i % 10}x'), Label(str(j)))
+                    for i in range(0, 40)
+                ]
+            )
+            for j in range(0, 16)
+        ]
+        expected = [
+            str(section.rendered(width_constraint=20)) for section in sections
+        ]
+
+        CountingBlock.num_measurements = 0
+        sequential_cache = LayoutCache()
+        for section in sections:
+            section.rendered(
+                width_constraint=20,
+                layout_cache=sequential_cache
+            )
+        num_sequential_measurements = CountingBlock.num_measurements
+
+        CountingBlock.num_measurements = 0
+        cache = ConcurrentLayoutCache()
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            rendered = list(
+                executor.map(
+                    lambda section: str(
+                        section.rendered(
+                            width_constraint=20,
+                            layout_cache=cache
+                        )
+                    ),
+                    sections
+                )
+            )
+        self.assertEqual(expected, rendered)
+        self.assertEqual(
+            num_sequential_measurements,
+            CountingBlock.num_measurements
+        )
+
+    def test_sharing_a_container_across_threads(self):
+        block = Label('a')
+        container = LayoutContainer(block, cache=ConcurrentLayoutCache())
+
+        def measure_in_container() -> bool:
+            with container:
+                block.measure()
+                is_current = current_layout_container() is container
+            return is_current and current_layout_container() is None
+
+        with container:
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                results = list(
+                    executor.map(lambda _: measure_in_container(), range(0, 8))
+                )
+            self.assertIs(container, current_layout_container())
+        self.assertIsNone(current_layout_container())
+        self.assertEqual([True] * 8, results)
+        self.assertEqual(1, len(container.cache))
@@ -1,13 +1,16 @@
+import pickle
 from unittest import TestCase
 
-from neonsign import s
+from neonsign import Color, s
 from neonsign.block.canvas import (
-    Canvas, CanvasAnchor, StyledStringPixel,
-    TransparentPixel, px
+    Canvas, CanvasAnchor, StyledStringPixel, TRANSPARENT_STYLE_ID,
+    TransparentPixel, WIDE_CHARACTER_CONTINUATION, px
 )
 from neonsign.core.point import Point
 from neonsign.core.rect import Rect
 from neonsign.core.size import Size
+from neonsign.string.style_table import PLAIN_STYLE_ID, intern_style
+from neonsign.core.style_command import StyleCommand
 
 
 class TestCanvas(TestCase):
@@ -48,6 +51,59 @@ class TestCanvas(TestCase):
             canvas_2.pixels
         )
 
+    def test_array_storage(self):
+        canvas: Canvas = Canvas.from_pixels(
+            [
+                [px('a'), px(s('b').bold().foreground(Color.RED))],
+                [px(), px(s('d').bold().foreground(Color.RED))],
+            ]
+        )
+        self.assertEqual([ord(c) for c in 'ab d'], list(canvas.chars))
+        self.assertEqual(TRANSPARENT_STYLE_ID, canvas.styles[2])
+        self.assertEqual(canvas.styles[1], canvas.styles[3])
+        self.assertNotEqual(canvas.styles[0], canvas.styles[1])
+
+        self.assertEqual(px('a'), canvas.at(x=0, y=0))
+        self.assertEqual(px(), canvas.at(x=0, y=1))
+        self.assertEqual(
+            str(px(s('b').bold().foreground(Color.RED))),
+            str(canvas.at(x=1, y=0))
+        )
+        self.assertEqual(
+            Canvas.from_pixels([[px('x'), px('x')]]),
+            Canvas.filled(Size(width=2, height=1), 'x')
+        )
+
+    def test_replacing(self):
+        canvas = Canvas.filled(Size(width=4, height=2), '.')
+        new_canvas = Canvas.from_pixels([[px('a'), px(), px('c')]])
+        self.assertEqual(
+            Canvas.from_pixels(
+                [
+                    [px('.'), px('.'), px('.'), px('.')],
+                    [px('.'), px('a'), px('.'), px('c')],
+                ]
+            ),
+            canvas.replace(
+                start=Point(x=1, y=1),
+                size=new_canvas.size,
+                new_canvas=new_canvas
+            )
+        )
+        self.assertEqual(
+            Canvas.from_pixels(
+                [
+                    [px('.'), px('.'), px('.'), px('.')],
+                    [px('.'), px('.'), px('.'), px('a')],
+                ]
+            ),
+            canvas.replace(
+                start=Point(x=3, y=1),
+                size=new_canvas.size,
+                new_canvas=new_canvas
+            )
+        )
+
     def test_pixel_construction(self):
         self.assertEqual(TransparentPixel(), px())
         self.assertEqual(StyledStringPixel(s('a')), px('a'))
@@ -600,3 +656,179 @@ class TestCanvas(TestCase):
                 )
             )
         )
+        self.assertEqual(
+            '\033[1ma\033[m \n'
+            'bb',
+            str(
+                Canvas.from_pixels(
+                    [
+                        [px(s('a').bold()), px()],
+                        [px('b'), px('b')],
+                    ]
+                )
+            )
+        )
+
+    def test_serialization(self):
+        canvas = Canvas.from_pixels(
+            [
+                [
+                    px(s('a').bold()), px(s('b').bold()),
+                    px(s('c').bold().foreground(Color.RED)), px('d')
+                ],
+                [px(s('e').italic()), px(s('f').bold()), px(), px()],
+            ]
+        )
+        self.assertEqual(
+            '\033[1mab\033[0;31;1mc\033[md\n'
+            '\033[3me\033[0;1mf\033[m  ',
+            str(canvas)
+        )
+        self.assertEqual(
+            '\033[1ma\033[m\033[1mb\033[m\033[31;1mc\033[md\n'
+            '\033[3me\033[m\033[1mf\033[m  ',
+            canvas.serialized(per_cell=True)
+        )
+
+    def test_converting_to_bytes(self):
+        canvas = Canvas.of_lines(
+            Size(width=4, height=2),
+            [
+                [('a', intern_style((StyleCommand(1),))), ('界', 0)],
+                [('é', intern_style((StyleCommand(38, (2, 1, 2, 3)),)))],
+            ]
+        ).replace(
+            Point(x=3, y=1),
+            Size(width=1, height=1),
+            Canvas.filled(Size(width=1, height=1), TransparentPixel())
+        )
+        for encoding in ('utf-32', 'utf-8'):
+            data = canvas.to_bytes(encoding)
+            self.assertEqual(canvas, Canvas.from_bytes(data))
+            buffer = bytearray(b'prefix' + data + b'suffix')
+            self.assertEqual(
+                canvas,
+                Canvas.from_bytes(memoryview(buffer)[6:6 + len(data)])
+            )
+        self.assertEqual(24 + 4 * 8 + 8 + 2 * 11, len(canvas.to_bytes()))
+        self.assertEqual(24 + 11 + 8 + 2 * 11, len(canvas.to_bytes('utf-8')))
+        self.assertEqual(canvas, pickle.loads(pickle.dumps(canvas)))
+        self.assertEqual(
+            Canvas.empty(),
+            Canvas.from_bytes(Canvas.empty().to_bytes())
+        )
+
+        many_styles = Canvas.of_lines(
+            Size(width=300, height=1),
+            [
+                [
+                    (
+                        'x',
+                        intern_style(
+                            (
+                                StyleCommand(38, (5, i % 256)),
+                                StyleCommand(1 + i // 256)
+                            )
+                        )
+                    )
+                    for i in range(0, 300)
+                ]
+            ]
+        )
+        self.assertEqual(
+            many_styles,
+            Canvas.from_bytes(many_styles.to_bytes())
+        )
+
+        data = canvas.to_bytes()
+        for corrupted, message in [
+            (b'', 'The data is not a stored canvas!'),
+            (b'XXXX' + data[4:], 'The data is not a stored canvas!'),
+            (
+                data[:4] + bytes([2]) + data[5:],
+                'Canvas format version 2 is not supported!'
+            ),
+            (data[:-3], 'The stored canvas is corrupted!'),
+            (data[:-2], 'The stored canvas is corrupted!'),
+            (data[:30], 'The stored canvas is corrupted!'),
+        ]:
+            with self.assertRaises(ValueError) as e:
+                Canvas.from_bytes(corrupted)
+            self.assertEqual(message, str(e.exception))
+        with self.assertRaises(ValueError) as e:
+            canvas.to_bytes('latin-1')
+        self.assertEqual(
+            "encoding must be 'utf-32' or 'utf-8', and not 'latin-1'!",
+            str(e.exception)
+        )
+
+    def test_laying_out_text(self):
+        bold = intern_style((StyleCommand(1),))
+        canvas = Canvas.of_text(
+            Size(width=3, height=3),
+            [('ab中', PLAIN_STYLE_ID), ('文e\u0301', bold)]
+        )
+        self.assertEqual(
+            [
+                ord('a'), ord('b'), ord(' '),
+                ord('中'), WIDE_CHARACTER_CONTINUATION, ord(' '),
+                ord('文'), WIDE_CHARACTER_CONTINUATION, ord('é'),
+            ],
+            list(canvas.chars)
+        )
+        self.assertEqual(
+            [0, 0, 0, 0, 0, 0, bold, bold, bold],
+            list(canvas.styles)
+        )
+        self.assertEqual('ab \n中 \n\033[1m文é\033[m', str(canvas))
+
+        self.assertEqual(
+            'ab…',
+            str(Canvas.of_text(Size(width=3, height=1), [('abcd', 0)]))
+        )
+        self.assertEqual(
+            'a… ',
+            str(Canvas.of_text(Size(width=3, height=1), [('a中文', 0)]))
+        )
+        self.assertEqual(
+            'abc…',
+            str(Canvas.of_text(Size(width=4, height=1), [('abc中', 0)]))
+        )
+
+    def test_constructing_with_wide_characters(self):
+        canvas = Canvas.of(Size(width=3, height=2), lambda x, y: '中')
+        self.assertEqual(
+            [
+                ord('中'), WIDE_CHARACTER_CONTINUATION, ord('…'),
+                ord('中'), WIDE_CHARACTER_CONTINUATION, ord('…'),
+            ],
+            list(canvas.chars)
+        )
+        self.assertEqual('中…\n中…', str(canvas))
+        self.assertEqual(
+            '中',
+            str(Canvas.of(Size(width=2, height=1), lambda x, y: '中'))
+        )
+        self.assertEqual(
+            'a中',
+            str(Canvas.from_pixels([[px('a'), px('中'), px('b')]]))
+        )
+        self.assertEqual(
+            '中…',
+            str(Canvas.filled(Size(width=3, height=1), '中'))
+        )
+
+    def test_serializing_clipped_wide_characters(self):
+        canvas = Canvas.of_text(Size(width=4, height=1), [('中文', 0)])
+        self.assertEqual('中文', str(canvas))
+        self.assertEqual(' 文', canvas.serialized_row(0, x_start=1))
+        self.assertEqual('中 ', canvas.serialized_row(0, x_end=3))
+        self.assertEqual(
+            ' 文',
+            str(
+                canvas.crop_or_pad_to(
+                    Size(width=3, height=1),
+                    CanvasAnchor.TOP_RIGHT
+                )
+            )
+        )
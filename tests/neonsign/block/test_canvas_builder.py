@@ -0,0 +1,51 @@
+from unittest import TestCase
+
+from neonsign.block.canvas import Canvas, px
+from neonsign.block.canvas_builder import CanvasBuilder
+from neonsign.core.point import Point
+from neonsign.core.rect import Rect
+from neonsign.core.size import Size
+
+
+class TestCanvasBuilder(TestCase):
+
+    def test_drawing_into_regions(self):
+        builder = CanvasBuilder(size=Size(width=4, height=3), pixel='.')
+        target = builder.target
+        region = target.region(
+            Rect(top_left=Point(x=1, y=1), size=Size(width=5, height=5))
+        )
+        self.assertEqual(Size(width=5, height=5), region.size)
+
+        region.draw(
+            Canvas.from_pixels(
+                [
+                    [px('a'), px(), px('c'), px('d')],
+                    [px('e'), px('f'), px('g'), px('h')],
+                ]
+            )
+        )
+        region.region(
+            Rect(top_left=Point(x=-1, y=0), size=Size(width=2, height=1))
+        ).fill('x')
+
+        self.assertEqual(
+            Canvas.from_pixels(
+                [
+                    [px('.'), px('.'), px('.'), px('.')],
+                    [px('.'), px('x'), px('.'), px('c')],
+                    [px('.'), px('e'), px('f'), px('g')],
+                ]
+            ),
+            builder.build()
+        )
+
+    def test_building_twice(self):
+        builder = CanvasBuilder(size=Size(width=1, height=1))
+        self.assertEqual(Canvas.of(Size(width=1, height=1)), builder.build())
+        with self.assertRaises(Exception) as e:
+            builder.build()
+        self.assertEqual(
+            'The canvas builder has already been built!',
+            str(e.exception)
+        )
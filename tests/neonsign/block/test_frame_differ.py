@@ -0,0 +1,81 @@
+import io
+from unittest import TestCase
+
+from neonsign import s
+from neonsign.block.canvas import Canvas, px
+from neonsign.block.frame_differ import FrameDiffer
+from neonsign.core.size import Size
+
+
+def canvas_of(*rows: str) -> Canvas:
+    return Canvas.from_pixels([[px(c) for c in row] for row in rows])
+
+
+class TestFrameDiffer(TestCase):
+
+    def test_painting_in_full(self):
+        differ = FrameDiffer(top=2, left=3)
+        self.assertEqual(
+            '\033[2;3Hab\033[K'
+            '\033[3;3Hcd\033[K',
+            differ.diff(canvas_of('ab', 'cd'))
+        )
+        self.assertEqual(
+            '\033[2;3Habc\033[K'
+            '\033[3;3H\033[K',
+            differ.diff(canvas_of('abc'))
+        )
+
+        differ.reset()
+        self.assertEqual(
+            '\033[2;3Habc\033[K',
+            differ.diff(canvas_of('abc'))
+        )
+
+    def test_painting_changes_only(self):
+        differ = FrameDiffer(max_gap=2)
+        differ.diff(canvas_of('0123456789', '0123456789'))
+
+        self.assertEqual('', differ.diff(canvas_of('0123456789', '0123456789')))
+        self.assertEqual(
+            '\033[1;2HX\033[1;6HY',
+            differ.diff(canvas_of('0X23456789', '0123456789'))
+            + differ.diff(canvas_of('0X234Y6789', '0123456789'))
+        )
+        self.assertEqual(
+            '\033[2;1HA23B',
+            differ.diff(canvas_of('0X234Y6789', 'A23B456789'))
+        )
+
+        styled = Canvas.from_pixels(
+            [
+                [px(c) for c in '0X234Y6789'],
+                [px(s('A').bold())] + [px(c) for c in '23B456789'],
+            ]
+        )
+        self.assertEqual('\033[2;1H\033[1mA\033[m', differ.diff(styled))
+
+    def test_writing(self):
+        differ = FrameDiffer()
+        stream = io.StringIO()
+        differ.write(canvas_of('a'), stream)
+        differ.write(canvas_of('a'), stream)
+        differ.write(canvas_of('b'), stream)
+        self.assertEqual('\033[1;1Ha\033[K\033[1;1Hb', stream.getvalue())
+        self.assertEqual(canvas_of('b'), differ.previous)
+
+    def test_painting_wide_characters(self):
+        differ = FrameDiffer(max_gap=0)
+        differ.diff(Canvas.of_text(Size(width=6, height=1), [('ab中文', 0)]))
+        self.assertEqual(
+            '\033[1;5H字',
+            differ.diff(
+                Canvas.of_text(Size(width=6, height=1), [('ab中字', 0)])
+            )
+        )
+        self.assertEqual(
+            '\033[1;3Hx中 ',
+            differ.diff(
+                Canvas.of_text(Size(width=6, height=1), [('abx中', 0)])
+            )
+        )
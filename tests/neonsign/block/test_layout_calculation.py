@@ -1,6 +1,8 @@
 from typing import List
 
-from neonsign.block.layout_calculation import ItemsDistributor
+from neonsign.block.layout_calculation import (
+    ItemsDistributor, distribute_proportionally
+)
 from tests.neonsign.block.test_canvas import TestCanvas
 
 
@@ -33,3 +35,9 @@ class TestLayoutCalculation(TestCanvas):
         test(num_items=7, num_recipients=4, expected_result=[2, 2, 2, 1])
         test(num_items=8, num_recipients=4, expected_result=[2, 2, 2, 2])
 
+    def test_distributing_proportionally(self):
+        self.assertEqual([], distribute_proportionally(5, []))
+        self.assertEqual([0, 0], distribute_proportionally(5, [0, 0]))
+        self.assertEqual([2, 4], distribute_proportionally(6, [1, 2]))
+        self.assertEqual([3, 2, 2], distribute_proportionally(7, [1, 1, 1]))
+        self.assertEqual([1, 0, 3], distribute_proportionally(4, [3, 1, 8]))
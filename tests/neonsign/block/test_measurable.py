@@ -1,6 +1,12 @@
+import sys
 from typing import Optional
 from unittest import TestCase
 
+from neonsign import (
+    Axis, FixedHeightBlock, FixedSizeBlock, FixedWidthBlock, FlexibleSpace,
+    HorizontalSeparator, Label, ProgressBar, Rectangle, TextArea,
+    VerticalSeparator
+)
 from neonsign.block.cache import LayoutContainer
 from neonsign.block.measurable import Measurable
 from neonsign.core.size import Size
@@ -39,3 +45,36 @@ class TestMeasurable(TestCase):
                 Size.zero(),
                 zero_height_measurable.measure()
             )
+
+    def test_flexibility_without_measuring(self):
+        blocks = [
+            Label(''),
+            Label('abc'),
+            TextArea(''),
+            TextArea('abc def', max_number_of_lines=1),
+            ProgressBar(0.5),
+            HorizontalSeparator(),
+            VerticalSeparator(),
+            FlexibleSpace(),
+            Rectangle(),
+            Label('abc').bold(),
+            FlexibleSpace().underlined().keyed('k'),
+            FixedWidthBlock(FlexibleSpace(), fixed_width=3),
+            FixedWidthBlock(Label('abc'), fixed_width=0),
+            FixedHeightBlock(TextArea('abc'), fixed_height=2),
+            FixedSizeBlock(Rectangle(), fixed_width=2, fixed_height=2),
+        ]
+        for block in blocks:
+            for axis in Axis:
+                for cross_constraint in [None, 0, 1, 2, 5, sys.maxsize]:
+                    with self.subTest(
+                        block=block,
+                        axis=axis,
+                        cross_constraint=cross_constraint
+                    ):
+                        self.assertEqual(
+                            Measurable.flexibility(
+                                block, axis, cross_constraint
+                            ),
+                            block.flexibility(axis, cross_constraint)
+                        )
@@ -0,0 +1,124 @@
+from unittest import TestCase, skipIf
+from unittest.mock import patch
+
+from neonsign.core import color_conversion
+from neonsign.core.color_conversion import (
+    quantize_to_color8, quantize_to_simple_color, rgb_of
+)
+from neonsign.core.colors import Color
+
+
+class TestColorConversion(TestCase):
+
+    def test_gradient(self):
+        self.assertEqual(
+            [
+                Color.rgb(0, 0, 0),
+                Color.rgb(64, 25, 0),
+                Color.rgb(128, 50, 0),
+                Color.rgb(191, 75, 0),
+                Color.rgb(255, 100, 0),
+            ],
+            Color.gradient(Color.BLACK, Color.rgb(255, 100, 0), 5)
+        )
+        self.assertEqual(
+            [Color.rgb(255, 255, 255)],
+            Color.gradient(Color.BRIGHT_WHITE, Color.BLACK, 1)
+        )
+        with self.assertRaises(ValueError) as e:
+            Color.gradient(Color.BLACK, Color.WHITE, 0)
+        self.assertEqual(
+            'steps must be a positive integer and not 0!',
+            str(e.exception)
+        )
+
+    def test_converting_arrays(self):
+        hues, saturations, values = zip(
+            *[
+                (hue, saturation, value)
+                for hue in range(0, 361, 15)
+                for saturation in range(0, 101, 20)
+                for value in range(0, 101, 10)
+            ]
+        )
+        self.assertEqual(
+            [Color.hsl(*hsl) for hsl in zip(hues, saturations, values)],
+            Color.from_hsl_array(hues, saturations, values)
+        )
+        self.assertEqual(
+            [Color.hsv(*hsv) for hsv in zip(hues, saturations, values)],
+            Color.from_hsv_array(hues, saturations, values)
+        )
+        self.assertIs(
+            Color.hsl(200, 40, 60),
+            Color.from_hsl_array([200], [40], [60])[0]
+        )
+        self.assertEqual([], Color.from_hsl_array([], [], []))
+
+        with self.assertRaises(ValueError) as e:
+            Color.from_hsl_array([0, 1], [0], [0, 0])
+        self.assertEqual(
+            'saturations must have 2 values like hues, and not 1!',
+            str(e.exception)
+        )
+        with self.assertRaises(ValueError) as e:
+            Color.from_hsv_array([0, 400], [0, 0], [0, 0])
+        self.assertEqual(
+            'hues must be between 0 and 360, inclusive, but 0 and 400 were '
+            'found!',
+            str(e.exception)
+        )
+
+    @skipIf(color_conversion.numpy is None, 'NumPy is not installed.')
+    def test_converting_with_and_without_numpy(self):
+        hues = [i * 0.37 % 360 for i in range(0, 1000)]
+        saturations = [i * 0.11 % 100 for i in range(0, 1000)]
+        values = [i * 0.13 % 100 for i in range(0, 1000)]
+        with_numpy = (
+            Color.from_hsl_array(hues, saturations, values),
+            Color.from_hsv_array(hues, saturations, values),
+            Color.gradient(Color.rgb(1, 2, 3), Color.rgb(250, 0, 128), 1000)
+        )
+        with patch.object(color_conversion, 'numpy', None):
+            without_numpy = (
+                Color.from_hsl_array(hues, saturations, values),
+                Color.from_hsv_array(hues, saturations, values),
+                Color.gradient(
+                    Color.rgb(1, 2, 3),
+                    Color.rgb(250, 0, 128),
+                    1000
+                )
+            )
+        self.assertEqual(without_numpy, with_numpy)
+
+    def test_rgb_of(self):
+        self.assertEqual((1, 2, 3), rgb_of(Color.rgb(1, 2, 3)))
+        self.assertEqual((205, 0, 0), rgb_of(Color.RED))
+        self.assertEqual((205, 0, 0), rgb_of(Color.color8(1)))
+        self.assertEqual((255, 135, 0), rgb_of(Color.color8(208)))
+        self.assertEqual((128, 128, 128), rgb_of(Color.color8(244)))
+
+    def test_quantizing(self):
+        for index in range(16, 256):
+            color8 = Color.color8(index)
+            self.assertEqual(
+                color8,
+                quantize_to_color8(Color.rgb(*rgb_of(color8)))
+            )
+        self.assertEqual(
+            Color.color8(208),
+            quantize_to_color8(Color.rgb(250, 140, 10))
+        )
+        self.assertEqual(
+            Color.color8(244),
+            quantize_to_color8(Color.rgb(126, 129, 130))
+        )
+        self.assertEqual(
+            Color.BRIGHT_RED,
+            quantize_to_simple_color(Color.rgb(250, 10, 10))
+        )
+        self.assertEqual(
+            Color.BLUE,
+            quantize_to_simple_color(Color.color8(18))
+        )
+        self.assertEqual(Color.CYAN, quantize_to_simple_color(Color.CYAN))
@@ -54,6 +54,39 @@ class TestColors(TestCase):
         self.assertIsInstance(color_instance, Color8)
         self.assertEqual(1, color_instance.index)
 
+    def test_interning(self):
+        self.assertIs(Color.rgb(1, 2, 3), Color.rgb(1, 2, 3))
+        self.assertIs(Color.rgb(255, 0, 0), Color.hex('#F00'))
+        self.assertIs(Color.hsl(0, 100, 50), Color.hsv(0, 100, 100))
+        self.assertIs(Color.color8(42), Color.color8(42))
+        self.assertEqual(Color24(1, 2, 3), Color.rgb(1, 2, 3))
+
+        color = Color.rgb(10, 20, 30)
+        self.assertIs(color.foreground_command, color.foreground_command)
+        self.assertEqual('38;2;10;20;30', color.foreground_command.parameters)
+        self.assertEqual('48;2;10;20;30', color.background_command.parameters)
+        self.assertEqual('95', Color.BRIGHT_MAGENTA.foreground_command.parameters)
+
+        with self.assertRaises(ValueError):
+            Color.rgb(256, 0, 0)
+        with self.assertRaises(ValueError):
+            Color.color8(-1)
+
+    def test_interning_float_components(self):
+        # A float color interned first must not become the integer color.
+        float_color = Color.rgb(11.0, 21, 31)
+        color = Color.rgb(11, 21, 31)
+        self.assertIs(color, float_color)
+        self.assertIs(int, type(color.red))
+        self.assertEqual('38;2;11;21;31', color.foreground_command.parameters)
+
+        with self.assertRaises(ValueError) as e:
+            Color.rgb(0, 0.5, 0)
+        self.assertEqual(
+            'The green component must be an integer and not 0.5!',
+            str(e.exception)
+        )
+
     def test_simple_color_validation(self):
         with self.assertRaises(ValueError) as e:
             SimpleColor('rainbow')
@@ -17,3 +17,10 @@ class TestStyleCommand(TestCase):
             (38, 2, 10, 20, 30),
             command_with_args.terminal_code
         )
+
+    def test_interning(self):
+        command = StyleCommand.of(38, (2, 10, 20, 30))
+        self.assertIs(command, StyleCommand.of(38, (2, 10, 20, 30)))
+        self.assertEqual(StyleCommand(38, (2, 10, 20, 30)), command)
+        self.assertEqual('38;2;10;20;30', command.parameters)
+        self.assertEqual('1', StyleCommand.of(1).parameters)
@@ -0,0 +1,85 @@
+from io import StringIO
+from unittest import TestCase
+
+from neonsign import Color, ColorProfile, Label, s
+from neonsign.block.canvas import Canvas
+from neonsign.block.frame_differ import FrameDiffer
+from neonsign.core.size import Size
+from neonsign.string.color_profile import style_id_for_profile
+from neonsign.string.style_table import PLAIN_STYLE_ID, STYLE_TABLE
+
+
+class TestColorProfile(TestCase):
+
+    def test_detecting(self):
+        for environment, expected in [
+            ({}, ColorProfile.COLOR16),
+            ({'TERM': 'xterm'}, ColorProfile.COLOR16),
+            ({'TERM': 'screen-256color'}, ColorProfile.COLOR256),
+            (
+                {'TERM': 'xterm-256color', 'COLORTERM': 'truecolor'},
+                ColorProfile.TRUECOLOR
+            ),
+            ({'COLORTERM': '24bit'}, ColorProfile.TRUECOLOR),
+            ({'TERM': 'dumb', 'COLORTERM': '24bit'}, ColorProfile.NONE),
+            (
+                {'TERM': 'xterm-256color', 'NO_COLOR': '1'},
+                ColorProfile.NONE
+            ),
+        ]:
+            self.assertEqual(expected, ColorProfile.detect(environment))
+
+    def test_adapting_styles(self):
+        string = s(
+            s('a').foreground(Color.rgb(250, 140, 10)).bold(),
+            s('b').background(Color.color8(18)),
+            s('c').foreground(Color.RED),
+        )
+        canvas = Canvas.of_lines(Size(width=3, height=1), [string.spans])
+
+        self.assertEqual(
+            '\033[1;38;2;250;140;10ma\033[0;48;5;18mb\033[0;31mc\033[m',
+            canvas.serialized()
+        )
+        self.assertEqual(
+            '\033[1;38;5;208ma\033[0;48;5;18mb\033[0;31mc\033[m',
+            canvas.serialized(profile=ColorProfile.COLOR256)
+        )
+        self.assertEqual(
+            '\033[1;33ma\033[0;44mb\033[0;31mc\033[m',
+            canvas.serialized(profile=ColorProfile.COLOR16)
+        )
+        self.assertEqual(
+            '\033[1;33ma\033[m\033[44mb\033[m\033[31mc\033[m',
+            canvas.serialized(per_cell=True, profile=ColorProfile.COLOR16)
+        )
+        self.assertEqual(
+            'abc',
+            canvas.serialized(profile=ColorProfile.NONE)
+        )
+
+        style_id = canvas.styles[0]
+        self.assertEqual(
+            '\033[1;38;5;208m',
+            STYLE_TABLE.style(
+                style_id_for_profile(style_id, ColorProfile.COLOR256)
+            ).prefix
+        )
+        self.assertEqual(
+            style_id,
+            style_id_for_profile(style_id, ColorProfile.TRUECOLOR)
+        )
+        self.assertEqual(
+            PLAIN_STYLE_ID,
+            style_id_for_profile(style_id, ColorProfile.NONE)
+        )
+
+    def test_writing_frames_and_lines(self):
+        block = Label('hi').foreground(Color.rgb(0, 0, 255))
+        self.assertEqual(
+            ['\033[34mhi\033[m'],
+            list(block.iter_lines(profile=ColorProfile.COLOR16))
+        )
+        stream = StringIO()
+        FrameDiffer(profile=ColorProfile.NONE).write(block.rendered(), stream)
+        self.assertEqual('\033[1;1Hhi\033[K', stream.getvalue())
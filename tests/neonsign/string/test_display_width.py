@@ -0,0 +1,37 @@
+from unittest import TestCase
+
+from neonsign.string.display_width import (
+    char_width, count_rows, display_width, wrap_offsets
+)
+
+
+class TestDisplayWidth(TestCase):
+
+    def test_char_width(self):
+        self.assertEqual(1, char_width('a'))
+        self.assertEqual(1, char_width('é'))
+        self.assertEqual(1, char_width('…'))
+        self.assertEqual(2, char_width('中'))
+        self.assertEqual(2, char_width('Ａ'))
+        self.assertEqual(2, char_width('😀'))
+        self.assertEqual(0, char_width('\u0301'))
+        self.assertEqual(0, char_width('\u200b'))
+        self.assertEqual(1, char_width('\u00ad'))
+
+    def test_display_width(self):
+        self.assertEqual(0, display_width(''))
+        self.assertEqual(5, display_width('hello'))
+        self.assertEqual(6, display_width('中文ab'))
+        self.assertEqual(1, display_width('é'))
+
+    def test_wrapping(self):
+        self.assertEqual([0, 3, 6], wrap_offsets('abcdefg', 3))
+        self.assertEqual([0, 2, 3], wrap_offsets('ab中文c', 3))
+        self.assertEqual([0, 2], wrap_offsets('é中', 2))
+        self.assertEqual([0, 1, 2], wrap_offsets('中文x', 1))
+        for text in ['', 'abcdefg', 'ab中文c', '中文x', 'é́']:
+            for width in range(1, 5):
+                self.assertEqual(
+                    len(wrap_offsets(text, width)),
+                    count_rows(text, width)
+                )
@@ -0,0 +1,117 @@
+from unittest import TestCase
+
+from neonsign.string.display_width import display_width
+from neonsign.string.line_breaking import (
+    Line, WrapMode, break_lines, slice_spans, spans_of_lines
+)
+
+
+def wrapped(text: str, width: int, **kwargs) -> list:
+    return [
+        text[line.start:line.end] + ('-' if line.hyphenated else '')
+        for line in break_lines(text, width, **kwargs)
+    ]
+
+
+class TestLineBreaking(TestCase):
+
+    def test_breaking_by_characters(self):
+        self.assertEqual(
+            ['lorem', ' ipsu', 'm'],
+            wrapped('lorem ipsum', 5, mode=WrapMode.CHARACTERS)
+        )
+        self.assertEqual(
+            ['ab', '中', '文'],
+            wrapped('ab中文', 3, mode=WrapMode.CHARACTERS)
+        )
+
+    def test_breaking_greedily(self):
+        self.assertEqual((), break_lines('', 5))
+        self.assertEqual([' a  b '], wrapped(' a  b ', 6))
+        self.assertEqual(
+            ['aaa bb', 'cc', 'ddddd', 'e'],
+            wrapped('aaa bb  cc ddddd e', 6)
+        )
+        self.assertEqual(
+            ['abcde', 'fgh', 'ij'],
+            wrapped('abcdefgh ij', 5)
+        )
+        self.assertEqual(['中文', '字'], wrapped('中文 字', 5))
+
+    def test_hyphenating(self):
+        self.assertEqual(
+            ['one th-', 'ree'],
+            wrapped('one three', 7, hyphenate=True)
+        )
+        self.assertEqual(
+            ['a word-', 'ing is'],
+            wrapped('a wording is', 7, hyphenate=True)
+        )
+        self.assertEqual(
+            ['abcd-', 'efgh-', 'ij'],
+            wrapped('abcdefghij', 5, hyphenate=True)
+        )
+        self.assertEqual(
+            ['one', '1234567'],
+            wrapped('one 1234567', 7, hyphenate=True)
+        )
+        # The rest of a split word is broken again from the split.
+        self.assertEqual(
+            ['a cde-', 'fghijk'],
+            wrapped('a cdefghijk', 6, hyphenate=True)
+        )
+
+    def test_hyphenating_wide_characters(self):
+        self.assertEqual(
+            ['c éc-', 'c漢a'],
+            wrapped('c écc漢a', 5, hyphenate=True)
+        )
+        self.assertEqual(
+            ['ab', '漢字-', '漢字-', '漢字'],
+            wrapped('ab 漢字漢字漢字', 5, hyphenate=True)
+        )
+        for width in range(2, 8):
+            for line in wrapped('c écc漢a xy漢字zw漢', width, hyphenate=True):
+                self.assertLessEqual(display_width(line), width)
+
+    def test_breaking_balanced_lines(self):
+        text = 'aaa bb cc ddddd'
+        self.assertEqual(['aaa bb', 'cc', 'ddddd'], wrapped(text, 6))
+        self.assertEqual(
+            ['aaa', 'bb cc', 'ddddd'],
+            wrapped(text, 6, mode=WrapMode.BALANCED)
+        )
+        self.assertEqual(
+            ['abcd-', 'efgh-', 'ij x'],
+            wrapped('abcdefghij x', 5, mode=WrapMode.BALANCED, hyphenate=True)
+        )
+
+    def test_memoizing_breaks(self):
+        text = 'lorem ipsum dolor sit amet'
+        self.assertIs(break_lines(text, 10), break_lines(text, 10))
+        self.assertIsNot(
+            break_lines(text, 10),
+            break_lines(text, 10, mode=WrapMode.BALANCED)
+        )
+
+        with self.assertRaises(ValueError) as e:
+            break_lines(text, 0)
+        self.assertEqual(
+            'width must be a positive integer and not 0!',
+            str(e.exception)
+        )
+
+    def test_slicing_spans(self):
+        spans = (('abc', 0), ('', 1), ('de', 2))
+        self.assertEqual(
+            [('bc', 0), ('', 1), ('d', 2)],
+            slice_spans(spans, 1, 4)
+        )
+        self.assertEqual([('e', 2)], slice_spans(spans, 4, 9))
+        self.assertEqual(
+            [[('ab', 0), ('-', 0)], [('c', 0), ('', 1), ('de', 2)]],
+            spans_of_lines(
+                spans,
+                [Line(0, 2, hyphenated=True), Line(2, 5)]
+            )
+        )
@@ -0,0 +1,28 @@
+from unittest import TestCase
+
+from neonsign.core.style_command import StyleCommand
+from neonsign.string.sgr import sgr_parameters, style_transition
+from neonsign.string.style_table import PLAIN_STYLE_ID, intern_style
+
+
+class TestSgr(TestCase):
+
+    def test_sgr_parameters(self):
+        self.assertEqual('', sgr_parameters(()))
+        self.assertEqual(
+            '1;38;2;10;20;30',
+            sgr_parameters(
+                (StyleCommand(1), StyleCommand(38, args=(2, 10, 20, 30)))
+            )
+        )
+
+    def test_style_transition(self):
+        bold = intern_style((StyleCommand(1),))
+        bold_italic = intern_style((StyleCommand(1), StyleCommand(3)))
+        italic = intern_style((StyleCommand(3),))
+
+        self.assertEqual('', style_transition(bold, bold))
+        self.assertEqual('\033[m', style_transition(bold, PLAIN_STYLE_ID))
+        self.assertEqual('\033[1m', style_transition(PLAIN_STYLE_ID, bold))
+        self.assertEqual('\033[3m', style_transition(bold, bold_italic))
+        self.assertEqual('\033[0;3m', style_transition(bold_italic, italic))
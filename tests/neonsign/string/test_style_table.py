@@ -0,0 +1,68 @@
+from unittest import TestCase
+
+from neonsign import Color, s
+from neonsign.core.color_commands import (
+    command_for_background, command_for_foreground
+)
+from neonsign.core.style_command import StyleCommand
+from neonsign.string.style_table import (
+    PLAIN_STYLE_ID, StyleTable, collapse_style_commands
+)
+
+BOLD = StyleCommand(1)
+ITALIC = StyleCommand(3)
+RED = command_for_foreground(Color.RED)
+GREEN = command_for_foreground(Color.GREEN)
+RGB = command_for_foreground(Color.rgb(1, 2, 3))
+BLUE_BACKGROUND = command_for_background(Color.BLUE)
+
+
+class TestStyleTable(TestCase):
+
+    def test_collapsing(self):
+        self.assertEqual((), collapse_style_commands(()))
+        self.assertEqual(
+            (BOLD, RED, BLUE_BACKGROUND),
+            collapse_style_commands((BOLD, RED, BLUE_BACKGROUND))
+        )
+        self.assertEqual(
+            (BOLD, ITALIC, RGB),
+            collapse_style_commands((GREEN, BOLD, RED, ITALIC, BOLD, RGB))
+        )
+        self.assertEqual(
+            (RED, BLUE_BACKGROUND),
+            collapse_style_commands((BLUE_BACKGROUND, RED, BLUE_BACKGROUND))
+        )
+
+    def test_interning(self):
+        table = StyleTable()
+        style_id = table.intern((BOLD, RED))
+        self.assertEqual(style_id, table.intern((GREEN, BOLD, RED)))
+        self.assertEqual(style_id, table.intern((BOLD, BOLD, RED)))
+        self.assertNotEqual(style_id, table.intern((RED, BOLD)))
+        self.assertEqual((BOLD, RED), table.commands(style_id))
+
+        style = table.style(style_id)
+        self.assertEqual('\033[1;31m', style.prefix)
+        self.assertFalse(style.is_plain)
+        self.assertTrue(table.style(PLAIN_STYLE_ID).is_plain)
+        self.assertEqual('', table.style(PLAIN_STYLE_ID).prefix)
+
+    def test_applying_commands(self):
+        table = StyleTable()
+        bold = table.with_command(PLAIN_STYLE_ID, BOLD)
+        self.assertEqual(table.intern((BOLD,)), bold)
+        self.assertEqual(
+            table.intern((BOLD, RED)),
+            table.with_command(table.with_command(bold, GREEN), RED)
+        )
+
+    def test_rendering_collapsed_styles(self):
+        self.assertEqual(
+            '\033[31ma\033[m',
+            str(s('a').foreground(Color.RED).foreground(Color.GREEN))
+        )
+        self.assertEqual(
+            '\033[1ma\033[m\033[1;32mb\033[m',
+            str(s('a', s('b').foreground(Color.GREEN).bold()).bold())
+        )
@@ -1,6 +1,8 @@
 from unittest import TestCase
 
+from neonsign.core.color_commands import command_for_foreground
 from neonsign.core.colors import Color
+from neonsign.core.style_command import StyleCommand
 from neonsign.string.styled_string import (
     BackgroundColoredString, BlinkingString, BoldString, ColorInvertedString,
     ConcatenatedString,
@@ -8,6 +10,7 @@ from neonsign.string.styled_string import (
     FramedString, HiddenString, ItalicString, LightString, OverlinedString,
     PaddedString, PlainString, UnderlinedString
 )
+from neonsign.string.style_table import PLAIN_STYLE_ID, intern_style
 from neonsign.string.syntax import s
 from tests.neonsign.string.utils import validate_styled_string
 
@@ -397,3 +400,116 @@ class TestStyledStringCreationAndRendering(TestCase):
             expected_content='test0test1.0test1.1test1.2test1.3test2',
             expected_layout_size=40,
         )
+
+    def test_spans(self):
+        bold = intern_style((StyleCommand(1),))
+        bold_green = intern_style(
+            (StyleCommand(1), command_for_foreground(Color.GREEN))
+        )
+        string = s('a', s('b').foreground(Color.GREEN).padded_left(2)).bold()
+        self.assertEqual(
+            (('a', bold), ('  ', bold), ('b', bold_green)),
+            string.spans
+        )
+        self.assertEqual(
+            [('a', bold), ('b', bold_green)],
+            list(string._iter_content())
+        )
+        self.assertEqual((('', PLAIN_STYLE_ID),), s('').spans)
+
+    def test_reusing_flattened_substrings(self):
+        inner = s('a', s('b').italic())
+        self.assertEqual('a\033[3mb\033[m', inner.rendered)
+        outer = s(inner, inner.bold())
+        self.assertEqual(
+            'a\033[3mb\033[m\033[1ma\033[m\033[1;3mb\033[m',
+            outer.rendered
+        )
+        self.assertEqual('abab', outer.content)
+
+    def test_deep_nesting(self):
+        string = s('x')
+        for _ in range(0, 5000):
+            string = s('(', string, ')').bold()
+        self.assertEqual(10001, string.layout_size)
+        self.assertEqual('(' * 5000 + 'x' + ')' * 5000, string.content)
+        self.assertEqual(
+            '\033[1m(\033[m' * 5000 +
+            '\033[1mx\033[m' +
+            '\033[1m)\033[m' * 5000,
+            string.rendered
+        )
+
+    def test_slicing(self):
+        bold = intern_style((StyleCommand(1),))
+        string = s('ab', s('cd').bold().padded_left(1))
+        self.assertEqual(' \033[1mcd\033[m', string[2:].rendered)
+        self.assertEqual(' c', string[2:4].content)
+        self.assertEqual(
+            (('b', PLAIN_STYLE_ID), (' ', PLAIN_STYLE_ID)),
+            string[1:3].spans
+        )
+        self.assertEqual((('d', bold),), string[-1].spans)
+        self.assertEqual('a\033[1mc\033[m', string[::3].rendered)
+        self.assertEqual('', string[10:].content)
+        with self.assertRaises(IndexError) as e:
+            _ = string[5]
+        self.assertEqual(
+            'Index 5 is out of range for a styled string of 5 characters!',
+            str(e.exception)
+        )
+
+        left, right = string.split_at(3)
+        self.assertEqual('ab ', left.content)
+        self.assertEqual('\033[1mcd\033[m', right.rendered)
+
+    def test_splitting_at_a_width(self):
+        string = s('a', s('漢字').bold(), 'e\u0301')
+        for width, left, right in [
+            (0, '', 'a漢字e\u0301'),
+            (1, 'a', '漢字e\u0301'),
+            (2, 'a', '漢字e\u0301'),
+            (3, 'a漢', '字e\u0301'),
+            (5, 'a漢字', 'e\u0301'),
+            (6, 'a漢字e\u0301', ''),
+            (9, 'a漢字e\u0301', ''),
+        ]:
+            parts = string.split_at(width)
+            self.assertEqual(
+                [left, right],
+                [part.content for part in parts]
+            )
+        self.assertEqual(
+            ['a\033[1m漢\033[m', '\033[1m字\033[me\u0301'],
+            [part.rendered for part in string.split_at(4)]
+        )
+
+        with self.assertRaises(ValueError) as e:
+            string.split_at(-1)
+        self.assertEqual(
+            'width must be a non-negative integer and not -1!',
+            str(e.exception)
+        )
+
+    def test_iterating_characters(self):
+        string = s('ab', s('a').bold())
+        chars = list(string.iter_chars())
+        self.assertEqual(
+            ['a', 'b', '\033[1ma\033[m'],
+            [char.rendered for char in chars]
+        )
+        self.assertIs(chars[0], next(s('a').iter_chars()))
+        self.assertIs(chars[2], next(s('a').bold().iter_chars()))
+
+    def test_wrapping(self):
+        string = s('abc', s('de').italic())
+        self.assertEqual(
+            ['ab', 'c\033[3md\033[m', '\033[3me\033[m'],
+            [line.rendered for line in string.wrap(2)]
+        )
+        with self.assertRaises(ValueError) as e:
+            string.wrap(0)
+        self.assertEqual(
+            'width must be a positive integer and not 0!',
+            str(e.exception)
+        )
@@ -0,0 +1,122 @@
+import asyncio
+from io import StringIO
+from unittest import IsolatedAsyncioTestCase
+
+from neonsign import Label, LiveDisplay, Observable
+from neonsign.block.frame_differ import FrameDiffer
+
+
+class TestLiveDisplay(IsolatedAsyncioTestCase):
+
+    async def test_painting_changes(self):
+        text = Observable('ab')
+        stream = StringIO()
+        display = LiveDisplay(
+            lambda: Label(text.value),
+            watch=[text],
+            max_fps=1000,
+            stream=stream,
+            width_constraint=10,
+            height_constraint=1
+        )
+        async with display:
+            await asyncio.sleep(0.05)
+            self.assertEqual('\033[1;1Hab\033[K', stream.getvalue())
+            text.value = 'ac'
+            await asyncio.sleep(0.05)
+        self.assertEqual(
+            '\033[1;1Hab\033[K' '\033[1;2Hc' '\033[2;1H',
+            stream.getvalue()
+        )
+        self.assertEqual(2, display.num_frames)
+
+    async def test_coalescing_refreshes(self):
+        counter = Observable(0)
+        views = []
+
+        def view():
+            views.append(counter.value)
+            return Label(str(counter.value))
+
+        stream = StringIO()
+        async with LiveDisplay(
+                view,
+                watch=[counter],
+                max_fps=10,
+                stream=stream,
+                width_constraint=10,
+                height_constraint=1,
+                differ=FrameDiffer(top=3)
+        ) as display:
+            for i in range(1, 101):
+                counter.value = i
+                await asyncio.sleep(0.001)
+        # A frame every 0.1 seconds at most, and the last frame.
+        self.assertLess(len(views), 10)
+        self.assertEqual(100, views[-1])
+        self.assertEqual(len(views), display.num_frames)
+        self.assertTrue(stream.getvalue().endswith('100\033[K\033[4;1H'))
+
+        counter.value = 101
+        self.assertEqual(len(views), display.num_frames)
+
+    async def test_refreshing_from_other_threads(self):
+        counter = Observable(0)
+        stream = StringIO()
+        async with LiveDisplay(
+                lambda: Label(str(counter.value)),
+                watch=[counter],
+                max_fps=1000,
+                stream=stream,
+                width_constraint=10,
+                height_constraint=1
+        ):
+            await asyncio.sleep(0.01)
+
+            def count():
+                for i in range(1, 1001):
+                    counter.value = i
+
+            await asyncio.get_running_loop().run_in_executor(None, count)
+        self.assertTrue(stream.getvalue().endswith('1000\033[K\033[2;1H'))
+
+    async def test_restarting(self):
+        text = Observable('ab')
+        stream = StringIO()
+        display = LiveDisplay(
+            lambda: Label(text.value),
+            watch=[text],
+            max_fps=1000,
+            stream=stream,
+            width_constraint=10,
+            height_constraint=1
+        )
+        async with display:
+            await asyncio.sleep(0.05)
+        text.value = 'ac'
+        self.assertEqual(1, display.num_frames)
+
+        async with display:
+            await asyncio.sleep(0.05)
+            text.value = 'cc'
+            await asyncio.sleep(0.05)
+        self.assertEqual(
+            '\033[1;1Hab\033[K' '\033[2;1H'
+            '\033[1;2Hc' '\033[1;1Hc' '\033[2;1H',
+            stream.getvalue()
+        )
+        self.assertEqual(3, display.num_frames)
+
+    async def test_invalid_arguments(self):
+        with self.assertRaises(ValueError) as e:
+            LiveDisplay(lambda: Label(''), max_fps=0)
+        self.assertEqual(
+            'max_fps must be a positive number and not 0!',
+            str(e.exception)
+        )
+        display = LiveDisplay(lambda: Label(''), stream=StringIO())
+        await display.start()
+        with self.assertRaises(RuntimeError):
+            await display.start()
+        await display.stop()
+        await display.stop()